@@ -0,0 +1,203 @@
+"""Inclusion d'une séquence dans une autre.
+
+Un motif est inclus dans une séquence :
+    - de façon contiguë si ses éléments apparaissent consécutivement dans la
+      séquence ('bra' dans 'abracadabra') ;
+    - comme sous-séquence si ses éléments apparaissent dans le même ordre,
+      mais pas nécessairement consécutivement ('aaa' dans 'abracadabra').
+
+La fonction incluse parcourt la séquence à chaque appel. Pour tester de
+nombreux motifs dans une même séquence, la classe SequenceIndexee la prétraite
+une fois pour toutes : chaque test ne dépend alors plus que de la longueur du
+motif.
+"""
+
+import bisect
+from typing import Hashable, Iterable, Sequence
+
+import numpy as np
+
+
+def _incluse_contigue(motif: list, sequence: Iterable) -> bool:
+    """Teste l'inclusion contiguë d'un motif avec l'algorithme de Knuth, Morris et Pratt, en O(n + m)."""
+    if not motif:
+        return True
+    # bords[i] : longueur du plus long préfixe strict de motif[: i + 1] qui en est aussi un suffixe
+    bords = [0] * len(motif)
+    k = 0
+    for i in range(1, len(motif)):
+        while k and motif[i] != motif[k]:
+            k = bords[k - 1]
+        if motif[i] == motif[k]:
+            k += 1
+        bords[i] = k
+    # k : longueur du plus long préfixe du motif terminant la partie déjà lue de la séquence
+    k = 0
+    for element in sequence:
+        while k and element != motif[k]:
+            k = bords[k - 1]
+        if element == motif[k]:
+            k += 1
+            if k == len(motif):
+                return True
+    return False
+
+
+def incluse(motif: Sequence, sequence: Sequence, contigue: bool = True) -> bool:
+    """Teste si un motif est inclus dans une séquence.
+
+    Parameters
+    ----------
+    motif : Sequence
+        Motif recherché.
+
+    sequence : Sequence
+        Séquence dans laquelle le motif est recherché.
+
+    contigue : bool
+        Si True, les éléments du motif doivent être consécutifs dans la
+        séquence. Sinon, ils doivent seulement y apparaître dans le même ordre.
+        Dans les deux cas, les éléments sont comparés un à un : le motif et la
+        séquence peuvent être de types différents.
+
+    Returns
+    -------
+    bool
+        True si le motif est inclus dans la séquence.
+
+    Examples
+    --------
+    >>> incluse([2, 3], [1, 2, 3, 4])
+    True
+    >>> incluse([1, 3], [1, 2, 3, 4]), incluse([1, 3], [1, 2, 3, 4], contigue=False)
+    (False, True)
+    >>> incluse((2, 3), [1, 2, 3]), incluse('bc', ['a', 'b', 'c']), incluse(np.array([2, 3]), np.arange(5))
+    (True, True, True)
+    """
+    if not contigue:
+        # Chaque test « in » reprend le parcours de la séquence là où le précédent s'est arrêté
+        iterateur = iter(sequence)
+        return all(element in iterateur for element in motif)
+    if isinstance(motif, str) and isinstance(sequence, str):
+        return motif in sequence
+    return _incluse_contigue(list(motif), sequence)
+
+
+class SequenceIndexee:
+    """Séquence prétraitée pour tester rapidement l'inclusion de nombreux motifs.
+
+    Pour l'inclusion contiguë, la séquence est représentée par son automate
+    des suffixes : un automate dont les chemins depuis l'état initial sont
+    exactement les facteurs de la séquence. Il est construit en O(n) et
+    contient au plus 2n états. Un motif est inclus si et seulement si on peut
+    le lire dans l'automate, en O(m).
+
+    Pour l'inclusion comme sous-séquence, les positions de chaque élément sont
+    stockées par ordre croissant : la position de chaque élément du motif,
+    après celle du précédent, est trouvée par recherche dichotomique, soit
+    O(m log n) par motif.
+
+    Parameters
+    ----------
+    sequence : Iterable[Hashable]
+        Séquence d'éléments hachables.
+
+    Examples
+    --------
+    >>> adn = SequenceIndexee('GATTACAGATTACA')
+    >>> 'ACAGA' in adn, adn.incluse('AGT'), adn.incluse('AGT', contigue=False)
+    (True, False, True)
+    >>> adn.incluses(['TTA', 'CAT', 'GAGA'])
+    array([ True, False, False])
+    >>> adn.incluses(['TTA', 'CAT', 'GAGA'], contigue=False)
+    array([ True,  True,  True])
+    """
+
+    def __init__(self, sequence: Iterable[Hashable]) -> None:
+        self.longueur = 0
+        self._positions: dict[Hashable, list[int]] = {}
+        # Transitions de chaque état, lien suffixe et longueur du plus long facteur menant à chaque état
+        transitions: list[dict[Hashable, int]] = [{}]
+        liens = [-1]
+        longueurs = [0]
+        dernier = 0
+        for position, element in enumerate(sequence):
+            self._positions.setdefault(element, []).append(position)
+            courant = len(transitions)
+            transitions.append({})
+            liens.append(0)
+            longueurs.append(longueurs[dernier] + 1)
+            etat = dernier
+            while etat != -1 and element not in transitions[etat]:
+                transitions[etat][element] = courant
+                etat = liens[etat]
+            if etat != -1:
+                suivant = transitions[etat][element]
+                if longueurs[etat] + 1 == longueurs[suivant]:
+                    liens[courant] = suivant
+                else:
+                    # L'état suivant est dédoublé, pour séparer les facteurs de longueurs différentes
+                    clone = len(transitions)
+                    transitions.append(dict(transitions[suivant]))
+                    liens.append(liens[suivant])
+                    longueurs.append(longueurs[etat] + 1)
+                    while etat != -1 and transitions[etat].get(element) == suivant:
+                        transitions[etat][element] = clone
+                        etat = liens[etat]
+                    liens[suivant] = liens[courant] = clone
+            dernier = courant
+            self.longueur += 1
+        # Les liens et les longueurs ne servent qu'à la construction
+        self._transitions = transitions
+
+    def __len__(self) -> int:
+        return self.longueur
+
+    @property
+    def nb_etats(self) -> int:
+        """int : Nombre d'états de l'automate des suffixes."""
+        return len(self._transitions)
+
+    def __contains__(self, motif: Iterable[Hashable]) -> bool:
+        transitions = self._transitions
+        etat = 0
+        for element in motif:
+            etat = transitions[etat].get(element, -1)
+            if etat == -1:
+                return False
+        return True
+
+    def _sous_sequence(self, motif: Iterable[Hashable]) -> bool:
+        position = -1
+        for element in motif:
+            positions = self._positions.get(element)
+            if positions is None:
+                return False
+            k = bisect.bisect_right(positions, position)
+            if k == len(positions):
+                return False
+            position = positions[k]
+        return True
+
+    def incluse(self, motif: Iterable[Hashable], contigue: bool = True) -> bool:
+        """Teste si un motif est inclus dans la séquence (voir la fonction incluse)."""
+        return motif in self if contigue else self._sous_sequence(motif)
+
+    def incluses(self, motifs: Iterable[Iterable[Hashable]], contigue: bool = True) -> np.ndarray:
+        """Teste l'inclusion de plusieurs motifs dans la séquence.
+
+        Parameters
+        ----------
+        motifs : Iterable[Iterable[Hashable]]
+            Motifs recherchés.
+
+        contigue : bool
+            Type d'inclusion (voir la fonction incluse).
+
+        Returns
+        -------
+        np.ndarray
+            Tableau de booléens indiquant, pour chaque motif, s'il est inclus.
+        """
+        test = self.__contains__ if contigue else self._sous_sequence
+        return np.fromiter(map(test, motifs), dtype=bool)
@@ -0,0 +1,317 @@
+"""Vérification et conversion d'entiers écrits sous forme de texte.
+
+Un entier valide est écrit comme un signe + ou - facultatif suivi d'au moins
+un chiffre décimal ASCII, éventuellement entouré d'espaces, et sa valeur
+tient dans un entier signé de 64 bits (ou dans un intervalle donné).
+
+La fonction verifier_entier vérifie une valeur. Pour des millions de valeurs,
+par exemple une colonne d'un fichier CSV, verifier_entiers vérifie et
+convertit toute une colonne avec NumPy : les chaînes sont alignées à droite
+dans un tableau d'octets à deux dimensions, dont chaque groupe de 8 colonnes
+est lu comme un entier de 64 bits et converti en une seule opération, pour
+toutes les valeurs à la fois. verifier_fichier traite un fichier par blocs,
+sans le charger en entier ni le découper en lignes en Python.
+"""
+
+import os
+from typing import Iterable, Iterator
+
+import numpy as np
+
+ENTIER_MIN = -(1 << 63)
+ENTIER_MAX = (1 << 63) - 1
+
+# Plus grand nombre formé par les chiffres précédant les 8 derniers d'un entier
+# de 64 bits, en valeur absolue : au-delà, l'entier dépasse 2**63
+_BORNE_GROUPE = (1 << 63) // 10**8
+
+
+def verifier_entier(valeur: str | bytes, minimum: int = ENTIER_MIN, maximum: int = ENTIER_MAX) -> bool:
+    """Vérifie qu'une chaîne de caractères représente un entier compris entre deux bornes.
+
+    Parameters
+    ----------
+    valeur : str or bytes
+        Chaîne de caractères à vérifier.
+
+    minimum, maximum : int
+        Bornes (incluses) de l'entier.
+
+    Returns
+    -------
+    bool
+        True si la chaîne est un entier valide.
+
+    Examples
+    --------
+    >>> verifier_entier('-42'), verifier_entier(' +7 '), verifier_entier(b'12')
+    (True, True, True)
+    >>> verifier_entier('4.2'), verifier_entier('1_000'), verifier_entier('-'), verifier_entier('٣')
+    (False, False, False, False)
+    >>> verifier_entier('9223372036854775808'), verifier_entier('15', maximum=10)
+    (False, False)
+    """
+    if isinstance(valeur, bytes):
+        valeur = valeur.decode("ascii", "replace")
+    valeur = valeur.strip()
+    chiffres = valeur[1:] if valeur[:1] in ("+", "-") else valeur
+    # isdigit accepte d'autres chiffres que les chiffres ASCII
+    if not (chiffres.isascii() and chiffres.isdigit()):
+        return False
+    return minimum <= int(valeur) <= maximum
+
+
+def _espaces(caracteres: np.ndarray) -> np.ndarray:
+    """Indique les caractères qui sont des espaces ou des caractères de contrôle ASCII."""
+    return (caracteres <= ord(" ")) & (caracteres != 0)
+
+
+def _convertir(
+    alignes: np.ndarray, negatifs: np.ndarray, valides: np.ndarray, minimum: int, maximum: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convertit des chaînes alignées à droite en entiers de 64 bits.
+
+    Parameters
+    ----------
+    alignes : np.ndarray
+        Tableau d'octets contigu à n lignes et à un multiple de 8 colonnes :
+        chaque ligne contient les chiffres d'une valeur, complétés à gauche
+        par des zéros ('0'), le signe éventuel étant lui aussi remplacé par un
+        zéro. Il est modifié.
+
+    negatifs : np.ndarray
+        Tableau de booléens indiquant les valeurs précédées d'un signe -.
+
+    valides : np.ndarray
+        Tableau de booléens indiquant les valeurs considérées comme valides
+        avant la lecture des chiffres. Il est modifié.
+
+    minimum, maximum : int
+        Bornes (incluses) des entiers.
+    """
+    n = len(alignes)
+    # Chaque octet d'un chiffre devient sa valeur, de 0 à 9
+    groupes = alignes.view("<u8").reshape(n, -1)
+    groupes ^= np.uint64(0x3030303030303030)
+    absolues = np.zeros(n, dtype=np.uint64)
+    for groupe in groupes.T:
+        # Un octet est un chiffre s'il est inférieur à 0x80 et si son addition
+        # avec 0x76 ne l'est pas
+        valides &= ((groupe | (groupe + np.uint64(0x7676767676767676))) & np.uint64(0x8080808080808080)) == 0
+        # Valeur des 8 chiffres, le premier étant l'octet de poids faible :
+        # les chiffres sont combinés deux par deux, puis par quatre, puis par huit
+        groupe = ((groupe & np.uint64(0x0F0F0F0F0F0F0F0F)) * np.uint64(10 * 2**8 + 1)) >> np.uint64(8)
+        groupe = ((groupe & np.uint64(0x00FF00FF00FF00FF)) * np.uint64(100 * 2**16 + 1)) >> np.uint64(16)
+        groupe = ((groupe & np.uint64(0x0000FFFF0000FFFF)) * np.uint64(10000 * 2**32 + 1)) >> np.uint64(32)
+        valides &= absolues <= _BORNE_GROUPE
+        absolues = absolues * np.uint64(10**8) + groupe
+
+    valides &= absolues <= np.uint64(1 << 63) - ~negatifs
+    # Opposé modulo 2**64, puis lecture des bits comme un entier signé
+    entiers = np.where(negatifs, np.uint64(0) - absolues, absolues).view(np.int64)
+    if minimum > ENTIER_MIN:
+        valides &= entiers >= minimum
+    if maximum < ENTIER_MAX:
+        valides &= entiers <= maximum
+    entiers[~valides] = 0
+    return entiers, ~valides
+
+
+def verifier_entiers(
+    valeurs: Iterable[str] | Iterable[bytes] | np.ndarray, minimum: int = ENTIER_MIN, maximum: int = ENTIER_MAX
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vérifie et convertit une colonne de chaînes de caractères en entiers de 64 bits.
+
+    Comme dans tout tableau NumPy de chaînes, les caractères nuls en fin de
+    chaîne sont ignorés.
+
+    Parameters
+    ----------
+    valeurs : Iterable[str], Iterable[bytes] or np.ndarray
+        Chaînes de caractères, ou tableau NumPy de chaînes (de type S ou U).
+
+    minimum, maximum : int
+        Bornes (incluses) des entiers.
+
+    Returns
+    -------
+    entiers : np.ndarray
+        Entiers de 64 bits. Les valeurs invalides sont remplacées par 0.
+
+    invalides : np.ndarray
+        Tableau de booléens indiquant les valeurs invalides. Leurs positions
+        sont données par np.flatnonzero(invalides).
+
+    Examples
+    --------
+    >>> entiers, invalides = verifier_entiers(['12', ' -3', 'x', '', '+0', '99999999999999999999'])
+    >>> entiers
+    array([12, -3,  0,  0,  0,  0])
+    >>> np.flatnonzero(invalides)
+    array([2, 3, 5])
+    >>> verifier_entiers(np.array([b'-9223372036854775808', b'7']), maximum=5)
+    (array([-9223372036854775808,                    0]), array([False,  True]))
+    """
+    tableau = np.asarray(valeurs if isinstance(valeurs, np.ndarray) else list(valeurs)).ravel()
+    if tableau.dtype.kind not in "SU":
+        if len(tableau) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+        raise TypeError(f"Les valeurs doivent être des chaînes de caractères (type {tableau.dtype}).")
+    n = len(tableau)
+    code = np.uint8 if tableau.dtype.kind == "S" else np.uint32
+    tableau = np.ascontiguousarray(tableau)
+    # Les espaces ne sont retirés que si une chaîne commence par un espace (et,
+    # plus bas, si une chaîne se termine par un espace) : c'est rarement le cas
+    if tableau.dtype.itemsize and (code is np.uint32 or _espaces(tableau.view(code).reshape(n, -1)[:, 0]).any()):
+        tableau = np.char.strip(tableau)
+    if n == 0 or tableau.dtype.itemsize == 0:
+        return np.zeros(n, dtype=np.int64), np.ones(n, dtype=bool)
+
+    # Les chaînes sont alignées à droite en les complétant par des zéros (après
+    # le signe), sur une largeur multiple de 8
+    largeur = -(-tableau.dtype.itemsize // np.dtype(code).itemsize // 8) * 8
+    alignes = np.char.zfill(tableau, largeur).view(code).reshape(n, largeur)
+    if code is np.uint8 and _espaces(alignes[:, -1]).any():
+        tableau = np.char.strip(tableau)
+        alignes = np.char.zfill(tableau, largeur).view(code).reshape(n, largeur)
+    if code is np.uint32:
+        # Les caractères non ASCII sont remplacés par un caractère invalide
+        alignes = np.minimum(alignes, 0x7F).astype(np.uint8)
+
+    caracteres = tableau.view(code).reshape(n, -1)
+    negatifs = caracteres[:, 0] == ord("-")
+    signes = negatifs | (caracteres[:, 0] == ord("+"))
+    # Une chaîne vide ou réduite à un signe est invalide
+    valides = (caracteres[:, 0] != 0) & ~(signes & (caracteres[:, 1] == 0 if caracteres.shape[1] > 1 else True))
+    alignes[:, 0][signes] = ord("0")
+    return _convertir(alignes, negatifs, valides, minimum, maximum)
+
+
+def _champs(octets: np.ndarray, colonne: int | None, separateur: int) -> tuple[np.ndarray, np.ndarray]:
+    """Renvoie les positions de début et de fin du champ de chaque ligne d'un bloc de lignes complètes."""
+    fins = np.flatnonzero(octets == ord("\n"))
+    if octets[-1] != ord("\n"):
+        fins = np.append(fins, len(octets))
+    debuts = np.empty_like(fins)
+    debuts[0] = 0
+    debuts[1:] = fins[:-1] + 1
+    # Fins de ligne Windows
+    fins -= (fins > debuts) & (octets[fins - 1] == ord("\r"))
+    if colonne is None:
+        return debuts, fins
+
+    # Le champ d'indice colonne est compris entre le colonne-ième séparateur
+    # de la ligne et le suivant (ou le début et la fin de la ligne)
+    separateurs = np.append(np.flatnonzero(octets == separateur), len(octets))
+    premiers = np.searchsorted(separateurs, debuts)
+    if colonne > 0:
+        precedents = separateurs[np.minimum(premiers + colonne - 1, len(separateurs) - 1)]
+        # Si la ligne n'a pas assez de colonnes, le champ est vide
+        debuts = np.where(precedents < fins, precedents + 1, fins)
+    suivants = separateurs[np.minimum(premiers + colonne, len(separateurs) - 1)]
+    return debuts, np.minimum(suivants, fins)
+
+
+def _verifier_bloc(
+    donnees: bytes, colonne: int | None, separateur: bytes, minimum: int, maximum: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vérifie et convertit les valeurs d'un bloc de lignes complètes."""
+    octets = np.frombuffer(donnees, dtype=np.uint8)
+    debuts, fins = _champs(octets, colonne, separateur[0])
+    longueurs = fins - debuts
+    non_vides = longueurs > 0
+    if _espaces(octets[debuts[non_vides]]).any() or _espaces(octets[fins[non_vides] - 1]).any():
+        # Des champs sont entourés d'espaces : ils sont découpés un par un
+        champs = [donnees[debut:fin] for debut, fin in zip(debuts.tolist(), fins.tolist())]
+        return verifier_entiers(np.array(champs, dtype=bytes), minimum, maximum)
+
+    # Chaque champ est copié, aligné à droite, dans une ligne de largeur octets,
+    # puis les octets qui le précèdent sont remplacés par des zéros
+    n = len(debuts)
+    largeur = max(8, -(-int(longueurs.max()) // 8) * 8)
+    octets_completes = np.concatenate((np.zeros(largeur, dtype=np.uint8), octets))
+    alignes = np.lib.stride_tricks.sliding_window_view(octets_completes, largeur)[fins]
+    np.copyto(alignes, ord("0"), where=np.arange(largeur) < (largeur - longueurs)[:, np.newaxis])
+
+    premiers = octets[np.minimum(debuts, len(octets) - 1)]
+    negatifs = non_vides & (premiers == ord("-"))
+    signes = negatifs | non_vides & (premiers == ord("+"))
+    # Un champ vide ou réduit à un signe est invalide
+    valides = longueurs > signes
+    alignes[np.flatnonzero(signes), largeur - longueurs[signes]] = ord("0")
+    return _convertir(alignes.reshape(n, largeur), negatifs, valides, minimum, maximum)
+
+
+def verifier_fichier(
+    chemin: str | os.PathLike,
+    colonne: int | None = None,
+    separateur: bytes = b",",
+    en_tete: bool = False,
+    minimum: int = ENTIER_MIN,
+    maximum: int = ENTIER_MAX,
+    taille_bloc: int = 1 << 24,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Vérifie et convertit en entiers les valeurs d'un fichier, par blocs de lignes.
+
+    Seul un bloc d'environ taille_bloc octets est en mémoire à la fois. Les
+    positions des fins de ligne et des séparateurs de chaque bloc sont
+    trouvées par NumPy, et les champs sont copiés dans un tableau d'octets
+    aligné à droite sans être découpés un par un.
+
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Fichier texte contenant une valeur par ligne ou, si colonne est donné,
+        un fichier CSV (sans guillemets autour des valeurs).
+
+    colonne : int or None
+        Indice de la colonne à vérifier. Si None, chaque ligne entière est
+        une valeur.
+
+    separateur : bytes
+        Séparateur des colonnes, d'un octet.
+
+    en_tete : bool
+        Si True, la première ligne est ignorée.
+
+    minimum, maximum : int
+        Bornes (incluses) des entiers.
+
+    taille_bloc : int
+        Taille approximative (en octets) des blocs lus.
+
+    Yields
+    ------
+    entiers : np.ndarray
+        Entiers des lignes du bloc, 0 pour les valeurs invalides.
+
+    invalides : np.ndarray
+        Tableau de booléens indiquant les valeurs invalides du bloc.
+
+    lignes_invalides : np.ndarray
+        Numéros (à partir de 1) des lignes invalides dans le fichier.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'mesures.csv'
+    >>> _ = chemin.write_text('nom,valeur\\na,12\\nb,douze\\nc,-4\\nd\\n')
+    >>> for entiers, invalides, lignes in verifier_fichier(chemin, colonne=1, en_tete=True, taille_bloc=8):
+    ...     print(entiers, lignes)
+    [12  0] [3]
+    [-4  0] [5]
+    """
+    if len(separateur) != 1:
+        raise ValueError(f"Le séparateur doit être un octet : {separateur!r}.")
+    numero = 1
+    with open(chemin, "rb") as fichier:
+        if en_tete:
+            fichier.readline()
+            numero += 1
+        while donnees := fichier.read(taille_bloc):
+            # Le bloc est complété jusqu'à la fin de sa dernière ligne
+            if not donnees.endswith(b"\n"):
+                donnees += fichier.readline()
+            entiers, invalides = _verifier_bloc(donnees, colonne, separateur, minimum, maximum)
+            yield entiers, invalides, np.flatnonzero(invalides) + numero
+            numero += len(entiers)
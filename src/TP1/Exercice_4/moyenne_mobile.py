@@ -0,0 +1,265 @@
+"""Moyennes mobiles.
+
+La moyenne mobile d'ordre k d'une suite de valeurs est la suite des moyennes
+de k valeurs consécutives. Plutôt que de recalculer la somme de chaque
+fenêtre, en O(k), on met à jour une somme courante : la valeur qui entre dans
+la fenêtre y est ajoutée, celle qui en sort en est retranchée.
+
+Les classes MoyenneMobile, MoyenneMobileExponentielle et MoyenneMobilePonderee
+traitent les valeurs une par une, au fil de leur arrivée, avec la même
+méthode ajouter et en O(1) par valeur.
+"""
+
+import abc
+import math
+from typing import Iterable
+
+import numpy as np
+
+
+def moyenne_mobile(valeurs: Iterable[float], k: int) -> list[float]:
+    """Calcule la moyenne mobile d'ordre k d'une suite de valeurs.
+
+    Parameters
+    ----------
+    valeurs : Iterable[float]
+        Suite de valeurs.
+
+    k : int
+        Nombre de valeurs consécutives dans chaque fenêtre.
+
+    Returns
+    -------
+    list[float]
+        Moyennes des fenêtres complètes : la i-ème est la moyenne des valeurs
+        d'indices i à i + k - 1.
+
+    Examples
+    --------
+    >>> moyenne_mobile([1, 2, 3, 4, 5, 6], 3)
+    [2.0, 3.0, 4.0, 5.0]
+    >>> moyenne_mobile([1, 2], 3)
+    []
+    """
+    moyenne = MoyenneMobile(k)
+    moyennes = []
+    for valeur in valeurs:
+        moyenne.ajouter(valeur)
+        if moyenne.complete:
+            moyennes.append(moyenne.valeur)
+    return moyennes
+
+
+def moyennes_mobiles(tableau: np.ndarray, k: int) -> np.ndarray:
+    """Calcule la moyenne mobile d'ordre k d'un tableau NumPy.
+
+    La somme de chaque fenêtre est la différence de deux sommes cumulées :
+    tout le calcul est effectué par NumPy, en O(n).
+
+    Parameters
+    ----------
+    tableau : np.ndarray
+        Tableau de valeurs, à une dimension.
+
+    k : int
+        Nombre de valeurs consécutives dans chaque fenêtre.
+
+    Returns
+    -------
+    np.ndarray
+        Moyennes des fenêtres complètes.
+
+    Examples
+    --------
+    >>> moyennes_mobiles(np.array([1, 2, 3, 4, 5, 6]), 3)
+    array([2., 3., 4., 5.])
+    """
+    if k <= 0:
+        raise ValueError("k doit être un entier strictement positif.")
+    tableau = np.asarray(tableau, dtype=np.float64)
+    if len(tableau) < k:
+        return np.zeros(0)
+    sommes = np.empty(len(tableau) + 1)
+    sommes[0] = 0.0
+    # Les valeurs sont centrées pour limiter les erreurs d'arrondi des sommes
+    # cumulées sur de longs tableaux.
+    centre = tableau.mean()
+    np.cumsum(tableau - centre, out=sommes[1:])
+    return (sommes[k:] - sommes[:-k]) / k + centre
+
+
+class _MoyenneEnLigne(abc.ABC):
+    """Interface commune des moyennes calculées au fil des valeurs."""
+
+    @property
+    @abc.abstractmethod
+    def valeur(self) -> float:
+        """float : Moyenne courante, ou nan si aucune valeur n'a été ajoutée."""
+
+    @abc.abstractmethod
+    def ajouter(self, valeur: float) -> float:
+        """Ajoute une valeur et renvoie la nouvelle moyenne."""
+
+    def ajouter_plusieurs(self, valeurs: Iterable[float]) -> list[float]:
+        """Ajoute plusieurs valeurs et renvoie la moyenne après chacune d'elles."""
+        return [self.ajouter(valeur) for valeur in valeurs]
+
+
+class MoyenneMobile(_MoyenneEnLigne):
+    """Moyenne mobile d'ordre k, mise à jour au fil des valeurs.
+
+    Les k dernières valeurs sont conservées dans un tampon circulaire de
+    taille fixe, et leur somme est mise à jour à chaque ajout. Pour que les
+    erreurs d'arrondi ne s'accumulent pas, la somme est recalculée
+    exactement à chaque tour du tampon, soit en O(1) amorti par valeur.
+
+    Tant que moins de k valeurs ont été ajoutées, la moyenne porte sur toutes
+    les valeurs ajoutées.
+
+    Parameters
+    ----------
+    k : int
+        Nombre de valeurs dans la fenêtre.
+
+    Examples
+    --------
+    >>> moyenne = MoyenneMobile(3)
+    >>> moyenne.ajouter_plusieurs([1, 2, 3, 4])
+    [1.0, 1.5, 2.0, 3.0]
+    >>> moyenne.complete
+    True
+    """
+
+    def __init__(self, k: int) -> None:
+        if k <= 0:
+            raise ValueError("k doit être un entier strictement positif.")
+        self.k = k
+        self._tampon = [0.0] * k
+        self._position = 0
+        self._nombre = 0
+        self._somme = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """bool : Vrai si la fenêtre contient k valeurs."""
+        return self._nombre == self.k
+
+    @property
+    def nombre(self) -> int:
+        """int : Nombre de valeurs dans la fenêtre, au plus k."""
+        return self._nombre
+
+    @property
+    def somme(self) -> float:
+        """float : Somme des valeurs de la fenêtre."""
+        return self._somme
+
+    @property
+    def valeurs(self) -> list[float]:
+        """list[float] : Valeurs de la fenêtre, de la plus ancienne à la plus récente."""
+        if not self.complete:
+            return self._tampon[: self._nombre]
+        return self._tampon[self._position :] + self._tampon[: self._position]
+
+    @property
+    def valeur(self) -> float:
+        return self._somme / self._nombre if self._nombre else math.nan
+
+    def ajouter(self, valeur: float) -> float:
+        valeur = float(valeur)
+        self._somme += valeur - self._tampon[self._position]
+        self._tampon[self._position] = valeur
+        self._position += 1
+        if self._nombre < self.k:
+            self._nombre += 1
+        if self._position == self.k:
+            self._position = 0
+            self._somme = math.fsum(self._tampon)
+        return self.valeur
+
+
+class MoyenneMobileExponentielle(_MoyenneEnLigne):
+    """Moyenne mobile exponentielle, mise à jour au fil des valeurs.
+
+    Chaque nouvelle valeur x modifie la moyenne m en alpha * x + (1 - alpha) * m :
+    le poids des valeurs décroît exponentiellement avec leur ancienneté. La
+    première valeur initialise la moyenne.
+
+    Parameters
+    ----------
+    alpha : float
+        Facteur de lissage, compris entre 0 (exclu) et 1 (inclus).
+
+    Examples
+    --------
+    >>> MoyenneMobileExponentielle(0.5).ajouter_plusieurs([4, 0, 2])
+    [4.0, 2.0, 2.0]
+    """
+
+    def __init__(self, alpha: float) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha doit être compris entre 0 (exclu) et 1 (inclus).")
+        self.alpha = alpha
+        self._moyenne = math.nan
+
+    @property
+    def valeur(self) -> float:
+        return self._moyenne
+
+    def ajouter(self, valeur: float) -> float:
+        if math.isnan(self._moyenne):
+            self._moyenne = float(valeur)
+        else:
+            self._moyenne += self.alpha * (valeur - self._moyenne)
+        return self._moyenne
+
+
+class MoyenneMobilePonderee(_MoyenneEnLigne):
+    """Moyenne mobile pondérée linéairement, mise à jour au fil des valeurs.
+
+    Dans une fenêtre de k valeurs, la plus ancienne a pour poids 1 et la plus
+    récente a pour poids k. Lorsqu'une valeur entre dans une fenêtre complète,
+    le poids de chaque autre valeur diminue de 1 : la somme pondérée diminue
+    donc de la somme simple de la fenêtre, ce qui permet de la mettre à jour
+    en O(1). Comme pour MoyenneMobile, elle est recalculée exactement à
+    chaque tour du tampon.
+
+    Parameters
+    ----------
+    k : int
+        Nombre de valeurs dans la fenêtre.
+
+    Examples
+    --------
+    >>> MoyenneMobilePonderee(3).ajouter_plusieurs([3, 6, 3, 9])
+    [3.0, 5.0, 4.0, 6.5]
+    """
+
+    def __init__(self, k: int) -> None:
+        self._fenetre = MoyenneMobile(k)
+        self._somme_ponderee = 0.0
+        # Position de la prochaine valeur dans le tampon de la fenêtre
+        self._position = 0
+
+    @property
+    def k(self) -> int:
+        """int : Nombre de valeurs dans la fenêtre."""
+        return self._fenetre.k
+
+    @property
+    def valeur(self) -> float:
+        nombre = self._fenetre.nombre
+        return self._somme_ponderee / (nombre * (nombre + 1) / 2) if nombre else math.nan
+
+    def ajouter(self, valeur: float) -> float:
+        fenetre = self._fenetre
+        if fenetre.complete:
+            self._somme_ponderee -= fenetre.somme
+        fenetre.ajouter(valeur)
+        self._position = (self._position + 1) % self.k
+        if self._position == 0:
+            # Le tampon vient d'être rempli : la somme pondérée est recalculée exactement
+            self._somme_ponderee = math.fsum(poids * x for poids, x in enumerate(fenetre.valeurs, start=1))
+        else:
+            self._somme_ponderee += fenetre.nombre * float(valeur)
+        return self.valeur
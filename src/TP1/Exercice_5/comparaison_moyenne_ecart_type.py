@@ -0,0 +1,66 @@
+"""Comparaison des calculs de l'écart-type de 10**8 valeurs.
+
+Un fichier .npy de NB_VALEURS valeurs aléatoires est généré par blocs, puis
+l'écart-type de ses valeurs est calculé :
+    - avec statistics.stdev ;
+    - avec moyenne_ecart_type (algorithme de Welford, valeur par valeur) ;
+    - avec np.std, en deux passes sur le tableau entier ;
+    - avec accumuler_par_blocs dans le fil courant ;
+    - avec accumuler_par_blocs sur plusieurs fils d'exécution.
+
+Les deux premières méthodes, trop lentes, ne sont appliquées qu'aux
+NB_VALEURS_LENTES premières valeurs, et leur durée pour NB_VALEURS valeurs
+est extrapolée.
+
+Utilisation (depuis le dossier src) :
+    python -m TP1.Exercice_5.comparaison_moyenne_ecart_type
+"""
+
+import os
+import pathlib
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from .moyenne_ecart_type import accumuler_par_blocs, moyenne_ecart_type
+
+NB_VALEURS = 10**8
+NB_VALEURS_LENTES = 10**6
+TAILLE_BLOC = 10**7
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = pathlib.Path(dossier) / "valeurs.npy"
+        valeurs = np.lib.format.open_memmap(chemin, mode="w+", dtype=np.float64, shape=(NB_VALEURS,))
+        for i in range(0, NB_VALEURS, TAILLE_BLOC):
+            valeurs[i : i + TAILLE_BLOC] = 1e6 + rng.standard_normal(min(TAILLE_BLOC, NB_VALEURS - i))
+        valeurs.flush()
+        extrait = valeurs[:NB_VALEURS_LENTES].tolist()
+        print(f"{NB_VALEURS:_} valeurs ({chemin.stat().st_size / 1e6:.0f} Mo)")
+
+        methodes = {
+            "statistics.stdev": (lambda: statistics.stdev(extrait), NB_VALEURS_LENTES),
+            "moyenne_ecart_type": (lambda: moyenne_ecart_type(extrait, ddof=1)[1], NB_VALEURS_LENTES),
+            "np.std (deux passes)": (lambda: float(np.std(np.load(chemin, mmap_mode="r"), ddof=1)), NB_VALEURS),
+            "accumuler_par_blocs, 1 fil": (
+                lambda: accumuler_par_blocs(chemin, nb_taches=1, taille_bloc=TAILLE_BLOC).ecart_type(ddof=1),
+                NB_VALEURS,
+            ),
+            f"accumuler_par_blocs, {os.cpu_count()} fils": (
+                lambda: accumuler_par_blocs(chemin, taille_bloc=TAILLE_BLOC).ecart_type(ddof=1),
+                NB_VALEURS,
+            ),
+        }
+        for nom, (methode, nombre) in methodes.items():
+            debut = time.perf_counter()
+            ecart_type = methode()
+            duree = time.perf_counter() - debut
+            extrapolation = " (extrapolée)" if nombre < NB_VALEURS else ""
+            print(
+                f"    {nom:<30} : écart-type {ecart_type:.6f}, {nombre / duree:14_.0f} valeurs/s, "
+                f"{duree * NB_VALEURS / nombre:8.2f} s pour {NB_VALEURS:_} valeurs{extrapolation}"
+            )
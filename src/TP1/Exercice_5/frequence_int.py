@@ -0,0 +1,298 @@
+"""Fréquences d'apparition d'entiers.
+
+Compter les entiers un par un dans un dictionnaire coûte une mise à jour en
+Python par élément. Les compteurs de ce module reçoivent les entiers par
+blocs, sous forme de tableaux NumPy, et comptent chaque bloc en une fois :
+    - CompteurDense, pour des entiers dans un petit intervalle, compte chaque
+      bloc avec np.bincount ;
+    - CompteurHache, pour des entiers dispersés, ne met à jour son
+      dictionnaire qu'une fois par valeur distincte de chaque bloc ;
+    - CountMin, pour des flux de taille non bornée, estime les fréquences
+      dans une mémoire fixée, avec une erreur contrôlée.
+
+Les trois compteurs ont la même interface. Deux compteurs de même type,
+remplis par exemple par des processus différents, peuvent être fusionnés.
+"""
+
+import abc
+import math
+from typing import Iterable, Self
+
+import numpy as np
+
+
+def _tableau_entiers(valeurs: Iterable[int] | np.ndarray) -> np.ndarray:
+    """Convertit des entiers en un tableau NumPy d'entiers de 64 bits à une dimension.
+
+    Examples
+    --------
+    >>> _tableau_entiers(np.array([2**63], dtype=np.uint64))
+    Traceback (most recent call last):
+    ...
+    OverflowError: Les entiers doivent être inférieurs à 2**63 (9223372036854775808 rencontré)
+    """
+    if isinstance(valeurs, np.ndarray):
+        if not np.issubdtype(valeurs.dtype, np.integer):
+            raise TypeError(f"Le tableau doit contenir des entiers (type {valeurs.dtype})")
+        # Seuls les entiers non signés de 64 bits peuvent dépasser : la conversion les ferait déborder
+        if valeurs.dtype == np.uint64 and valeurs.size and valeurs.max() > np.iinfo(np.int64).max:
+            raise OverflowError(f"Les entiers doivent être inférieurs à 2**63 ({valeurs.max()} rencontré)")
+        return valeurs.astype(np.int64, copy=False).ravel()
+    return np.fromiter(valeurs, dtype=np.int64)
+
+
+class _Compteur(abc.ABC):
+    """Interface commune des compteurs."""
+
+    def __init__(self) -> None:
+        self.total = 0
+
+    def ajouter(self, valeurs: Iterable[int] | np.ndarray) -> None:
+        """Compte un bloc d'entiers.
+
+        Parameters
+        ----------
+        valeurs : Iterable[int] or np.ndarray
+            Entiers à compter.
+        """
+        tableau = _tableau_entiers(valeurs)
+        if len(tableau):
+            self._ajouter_tableau(tableau)
+            self.total += len(tableau)
+
+    @abc.abstractmethod
+    def _ajouter_tableau(self, tableau: np.ndarray) -> None:
+        """Compte un tableau non vide d'entiers de 64 bits."""
+
+    @abc.abstractmethod
+    def __getitem__(self, valeur: int) -> int:
+        """Renvoie le nombre d'occurrences d'un entier."""
+
+    def fusionner(self, autre: "_Compteur") -> None:
+        """Ajoute au compteur les occurrences comptées par un autre compteur de même type."""
+        if type(autre) is not type(self):
+            raise TypeError(f"Impossible de fusionner {type(self).__name__} et {type(autre).__name__}.")
+        self._fusionner(autre)
+        self.total += autre.total
+
+    @abc.abstractmethod
+    def _fusionner(self, autre: Self) -> None:
+        """Ajoute les nombres d'occurrences d'un compteur de même type."""
+
+    def __add__(self, autre: "_Compteur") -> Self:
+        if not isinstance(autre, _Compteur):
+            return NotImplemented
+        resultat = self._copie_vide()
+        resultat.fusionner(self)
+        resultat.fusionner(autre)
+        return resultat
+
+    def _copie_vide(self) -> Self:
+        return type(self)()
+
+
+class CompteurDense(_Compteur):
+    """Compteur d'entiers compris dans un intervalle de petite taille.
+
+    Les nombres d'occurrences sont stockés dans un tableau indexé par les
+    entiers, de leur minimum à leur maximum. Le tableau est agrandi si
+    nécessaire : sa taille est celle de l'intervalle des entiers rencontrés.
+
+    Examples
+    --------
+    >>> compteur = CompteurDense()
+    >>> compteur.ajouter([3, 1, 3, 3])
+    >>> compteur.ajouter(np.array([-1, 1]))
+    >>> compteur.vers_dict()
+    {-1: 1, 1: 2, 3: 3}
+    >>> compteur[3], compteur[100]
+    (3, 0)
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.minimum = 0
+        self.nombres = np.zeros(0, dtype=np.int64)
+
+    def _etendre(self, minimum: int, maximum: int) -> None:
+        """Agrandit le tableau des nombres d'occurrences pour couvrir l'intervalle [minimum, maximum]."""
+        if len(self.nombres) == 0:
+            self.minimum, self.nombres = minimum, np.zeros(maximum - minimum + 1, dtype=np.int64)
+            return
+        nouveau_minimum = min(minimum, self.minimum)
+        nouveau_maximum = max(maximum, self.minimum + len(self.nombres) - 1)
+        if nouveau_minimum < self.minimum or nouveau_maximum >= self.minimum + len(self.nombres):
+            nombres = np.zeros(nouveau_maximum - nouveau_minimum + 1, dtype=np.int64)
+            decalage = self.minimum - nouveau_minimum
+            nombres[decalage : decalage + len(self.nombres)] = self.nombres
+            self.minimum, self.nombres = nouveau_minimum, nombres
+
+    def _ajouter_tableau(self, tableau: np.ndarray) -> None:
+        minimum, maximum = int(tableau.min()), int(tableau.max())
+        self._etendre(minimum, maximum)
+        debut = minimum - self.minimum
+        self.nombres[debut : debut + maximum - minimum + 1] += np.bincount(tableau - minimum)
+
+    def __getitem__(self, valeur: int) -> int:
+        indice = valeur - self.minimum
+        return int(self.nombres[indice]) if 0 <= indice < len(self.nombres) else 0
+
+    def _fusionner(self, autre: Self) -> None:
+        if len(autre.nombres):
+            self._etendre(autre.minimum, autre.minimum + len(autre.nombres) - 1)
+            debut = autre.minimum - self.minimum
+            self.nombres[debut : debut + len(autre.nombres)] += autre.nombres
+
+    def vers_dict(self) -> dict[int, int]:
+        """Renvoie le dictionnaire associant à chaque entier rencontré son nombre d'occurrences."""
+        (indices,) = np.nonzero(self.nombres)
+        return dict(zip((indices + self.minimum).tolist(), self.nombres[indices].tolist()))
+
+
+class CompteurHache(_Compteur):
+    """Compteur d'entiers dispersés, stockés dans un dictionnaire.
+
+    Chaque bloc est trié par NumPy pour obtenir ses valeurs distinctes et
+    leurs nombres d'occurrences : le dictionnaire n'est mis à jour qu'une
+    fois par valeur distincte du bloc.
+
+    Examples
+    --------
+    >>> compteur = CompteurHache()
+    >>> compteur.ajouter([10**12, 5, 10**12])
+    >>> autre = CompteurHache()
+    >>> autre.ajouter([5, -7])
+    >>> (compteur + autre).vers_dict()
+    {5: 2, 1000000000000: 2, -7: 1}
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.nombres: dict[int, int] = {}
+
+    def _ajouter_tableau(self, tableau: np.ndarray) -> None:
+        valeurs, nombres = np.unique(tableau, return_counts=True)
+        compteur = self.nombres
+        for valeur, nombre in zip(valeurs.tolist(), nombres.tolist()):
+            compteur[valeur] = compteur.get(valeur, 0) + nombre
+
+    def __getitem__(self, valeur: int) -> int:
+        return self.nombres.get(valeur, 0)
+
+    def _fusionner(self, autre: Self) -> None:
+        for valeur, nombre in autre.nombres.items():
+            self.nombres[valeur] = self.nombres.get(valeur, 0) + nombre
+
+    def vers_dict(self) -> dict[int, int]:
+        """Renvoie le dictionnaire associant à chaque entier rencontré son nombre d'occurrences."""
+        return dict(self.nombres)
+
+
+class CountMin(_Compteur):
+    """Estimation des fréquences d'un flux d'entiers dans une mémoire fixée (Count-Min sketch).
+
+    Le compteur est un tableau de profondeur lignes et largeur colonnes.
+    Chaque ligne est associée à une fonction de hachage : un entier
+    incrémente, dans chaque ligne, la case désignée par son haché. Le nombre
+    d'occurrences estimé d'un entier est le minimum de ses cases. Il n'est
+    jamais inférieur au nombre réel, et le dépasse de plus de
+    e / largeur * total avec une probabilité inférieure à exp(-profondeur).
+
+    Parameters
+    ----------
+    largeur : int
+        Nombre de colonnes, arrondi à la puissance de 2 supérieure.
+
+    profondeur : int
+        Nombre de lignes, c'est-à-dire de fonctions de hachage.
+
+    graine : int
+        Graine des fonctions de hachage. Seuls des compteurs de mêmes
+        paramètres peuvent être fusionnés.
+
+    Examples
+    --------
+    >>> compteur = CountMin(largeur=1024, profondeur=4)
+    >>> compteur.ajouter(np.arange(10_000) % 100)
+    >>> compteur[7] >= 100
+    True
+    >>> compteur.largeur, compteur.nbytes
+    (1024, 32768)
+    """
+
+    def __init__(self, largeur: int = 1 << 16, profondeur: int = 5, graine: int = 0) -> None:
+        super().__init__()
+        if largeur < 1 or profondeur < 1:
+            raise ValueError("La largeur et la profondeur doivent être strictement positives.")
+        self._bits = max(1, math.ceil(math.log2(largeur)))
+        self.largeur = 1 << self._bits
+        self.profondeur = profondeur
+        self.graine = graine
+        # Hachage multiplicatif : h(x) = (a * x + b) mod 2**64, dont on garde les bits de poids fort
+        generateur = np.random.default_rng(graine)
+        self._a = generateur.integers(0, 2**63, profondeur, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = generateur.integers(0, 2**63, profondeur, dtype=np.uint64)
+        self.table = np.zeros((profondeur, self.largeur), dtype=np.int64)
+
+    @classmethod
+    def depuis_precision(cls, epsilon: float, delta: float, graine: int = 0) -> "CountMin":
+        """Construit un compteur dont l'erreur dépasse epsilon * total avec une probabilité inférieure à delta."""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), graine)
+
+    @property
+    def nbytes(self) -> int:
+        """int : Nombre d'octets occupés par le tableau des compteurs, indépendant du nombre d'entiers."""
+        return self.table.nbytes
+
+    def _copie_vide(self) -> Self:
+        return type(self)(self.largeur, self.profondeur, self.graine)
+
+    def _colonnes(self, tableau: np.ndarray) -> np.ndarray:
+        """Renvoie, pour chaque ligne, les colonnes désignées par les entiers du tableau."""
+        x = tableau.view(np.uint64)
+        return (self._a[:, np.newaxis] * x + self._b[:, np.newaxis]) >> np.uint64(64 - self._bits)
+
+    def _ajouter_tableau(self, tableau: np.ndarray) -> None:
+        for ligne, colonnes in zip(self.table, self._colonnes(tableau)):
+            ligne += np.bincount(colonnes, minlength=self.largeur)
+
+    def __getitem__(self, valeur: int) -> int:
+        colonnes = self._colonnes(np.array([valeur], dtype=np.int64))[:, 0]
+        return int(self.table[np.arange(self.profondeur), colonnes].min())
+
+    def _fusionner(self, autre: Self) -> None:
+        if (autre.largeur, autre.profondeur, autre.graine) != (self.largeur, self.profondeur, self.graine):
+            raise ValueError("Les compteurs doivent avoir la même largeur, la même profondeur et la même graine.")
+        self.table += autre.table
+
+
+def frequence_int(valeurs: Iterable[int] | np.ndarray) -> dict[int, int]:
+    """Compte le nombre d'occurrences de chaque entier.
+
+    Les entiers sont comptés avec un CompteurDense si l'intervalle qu'ils
+    couvrent n'est pas beaucoup plus grand que leur nombre, et avec un
+    CompteurHache sinon.
+
+    Parameters
+    ----------
+    valeurs : Iterable[int] or np.ndarray
+        Entiers à compter.
+
+    Returns
+    -------
+    dict[int, int]
+        Dictionnaire associant à chaque entier son nombre d'occurrences, par
+        ordre croissant des entiers.
+
+    Examples
+    --------
+    >>> frequence_int([4, 2, 4, 4, 2, 9])
+    {2: 2, 4: 3, 9: 1}
+    >>> frequence_int(np.array([10**15, -10**15, 10**15]))
+    {-1000000000000000: 1, 1000000000000000: 2}
+    """
+    tableau = _tableau_entiers(valeurs)
+    dense = len(tableau) > 0 and int(tableau.max()) - int(tableau.min()) <= 4 * len(tableau) + 1024
+    compteur = CompteurDense() if dense else CompteurHache()
+    compteur.ajouter(tableau)
+    return compteur.vers_dict()
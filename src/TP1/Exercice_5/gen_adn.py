@@ -0,0 +1,188 @@
+"""Génération de séquences d'ADN aléatoires.
+
+Une séquence d'ADN est une chaîne de caractères composée des bases A, C, G et
+T. Plutôt que de tirer les bases une par une, on tire des octets aléatoires
+en grande quantité avec NumPy : chaque octet donne quatre bases (deux bits
+par base), obtenues en une seule lecture d'une table de 256 entrées.
+
+La séquence est découpée en segments de TAILLE_SEGMENT bases, le k-ième
+segment étant tiré par un générateur initialisé à partir de la graine et de
+k. La séquence ne dépend donc que de la graine, et non de la taille des
+blocs écrits ou du nombre de processus utilisés pour la produire.
+"""
+
+import concurrent.futures
+import functools
+import os
+
+import numpy as np
+
+BASES = b"ACGT"
+TAILLE_SEGMENT = 1 << 22
+
+# Table associant à chaque octet les quatre bases correspondant à ses paires de
+# bits, de la moins significative à la plus significative.
+_OCTETS = np.arange(256, dtype=np.uint8)
+_TABLE_BASES = (
+    np.stack([np.frombuffer(BASES, dtype=np.uint8)[(_OCTETS >> (2 * k)) & 3] for k in range(4)], axis=1)
+    .copy()
+    .view(np.uint32)
+    .ravel()
+)
+
+
+def _entropie(graine: int | None) -> int:
+    """Renvoie l'entropie de la suite de générateurs, tirée au hasard si la graine est None."""
+    entropie = np.random.SeedSequence(graine).entropy
+    if not isinstance(entropie, int):
+        raise TypeError("La graine doit être un entier ou None.")
+    return entropie
+
+
+@functools.lru_cache(maxsize=2)
+def _segment(entropie: int, k: int) -> np.ndarray:
+    """Tire le k-ième segment de la séquence, sous la forme d'un tableau d'octets.
+
+    Les derniers segments tirés sont conservés, pour les blocs plus petits
+    qu'un segment.
+    """
+    generateur = np.random.PCG64(np.random.SeedSequence(entropie, spawn_key=(k,)))
+    octets = generateur.random_raw(TAILLE_SEGMENT // 32).astype("<u8", copy=False).view(np.uint8)
+    return _TABLE_BASES[octets].view(np.uint8)
+
+
+def _bases(entropie: int, debut: int, fin: int) -> np.ndarray:
+    """Renvoie les bases de la séquence entre les positions debut (incluse) et fin (exclue)."""
+    resultat = np.empty(fin - debut, dtype=np.uint8)
+    for k in range(debut // TAILLE_SEGMENT, -(-fin // TAILLE_SEGMENT)):
+        debut_segment = k * TAILLE_SEGMENT
+        a, b = max(debut, debut_segment), min(fin, debut_segment + TAILLE_SEGMENT)
+        resultat[a - debut : b - debut] = _segment(entropie, k)[a - debut_segment : b - debut_segment]
+    return resultat
+
+
+def gen_adn(n: int, graine: int | None = None) -> str:
+    """Génère une séquence d'ADN aléatoire.
+
+    Parameters
+    ----------
+    n : int
+        Nombre de bases.
+
+    graine : int or None
+        Graine du générateur aléatoire. Si None, la séquence est différente à
+        chaque appel.
+
+    Returns
+    -------
+    str
+        Séquence de n bases.
+
+    Examples
+    --------
+    >>> adn = gen_adn(20, graine=0)
+    >>> len(adn), set(adn) <= set('ACGT')
+    (20, True)
+    >>> adn == gen_adn(30, graine=0)[:20]
+    True
+    """
+    if n < 0:
+        raise ValueError("n doit être un entier positif ou nul.")
+    return _bases(_entropie(graine), 0, n).tobytes().decode("ascii")
+
+
+def remplir_adn(tampon, graine: int | None = None, debut: int = 0, taille_bloc: int = 1 << 24) -> None:
+    """Remplit un tampon, par exemple un fichier projeté en mémoire, avec une séquence d'ADN aléatoire.
+
+    Parameters
+    ----------
+    tampon : bytearray, mmap.mmap, memoryview or np.ndarray
+        Objet modifiable exposant un tampon d'octets.
+
+    graine : int or None
+        Graine du générateur aléatoire.
+
+    debut : int
+        Position, dans la séquence, de la première base écrite dans le tampon.
+        Plusieurs tampons peuvent ainsi contenir des parties consécutives
+        d'une même séquence.
+
+    taille_bloc : int
+        Nombre de bases générées à la fois.
+
+    Examples
+    --------
+    >>> tampon = bytearray(10)
+    >>> remplir_adn(tampon, graine=0, debut=5)
+    >>> tampon.decode() == gen_adn(15, graine=0)[5:]
+    True
+    """
+    tableau = np.frombuffer(tampon, dtype=np.uint8)
+    entropie = _entropie(graine)
+    for i in range(0, len(tableau), taille_bloc):
+        fin = min(i + taille_bloc, len(tableau))
+        tableau[i:fin] = _bases(entropie, debut + i, debut + fin)
+
+
+def _ecrire_adn(chemin: str | os.PathLike, entropie: int, debut: int, fin: int) -> None:
+    """Écrit les bases de la séquence entre les positions debut et fin, au même endroit du fichier."""
+    with open(chemin, "r+b") as fichier:
+        fichier.seek(debut)
+        fichier.write(_bases(entropie, debut, fin).data)
+
+
+def gen_adn_fichier(
+    chemin: str | os.PathLike,
+    n: int,
+    graine: int | None = None,
+    taille_bloc: int = 1 << 24,
+    nb_processus: int | None = 1,
+) -> None:
+    """Écrit une séquence d'ADN aléatoire dans un fichier, par blocs de taille fixe.
+
+    Seul un bloc est en mémoire à la fois. Le fichier obtenu ne dépend que de
+    n et de la graine, quels que soient taille_bloc et nb_processus.
+
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Chemin du fichier.
+
+    n : int
+        Nombre de bases.
+
+    graine : int or None
+        Graine du générateur aléatoire.
+
+    taille_bloc : int
+        Nombre de bases générées et écrites à la fois.
+
+    nb_processus : int or None
+        Nombre de processus. Si différent de 1, les blocs sont générés et
+        écrits en parallèle, chacun à sa position dans le fichier. Si None, le
+        nombre de processeurs est utilisé.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'adn.txt'
+    >>> gen_adn_fichier(chemin, 1000, graine=42, taille_bloc=64)
+    >>> chemin.read_text() == gen_adn(1000, graine=42)
+    True
+    """
+    if n < 0:
+        raise ValueError("n doit être un entier positif ou nul.")
+    entropie = _entropie(graine)
+    debuts = list(range(0, n, taille_bloc))
+    fins = [min(debut + taille_bloc, n) for debut in debuts]
+    if nb_processus == 1:
+        with open(chemin, "wb") as fichier:
+            for debut, fin in zip(debuts, fins):
+                fichier.write(_bases(entropie, debut, fin).data)
+        return
+
+    # Le fichier est créé à sa taille finale, puis chaque processus écrit ses blocs
+    with open(chemin, "wb") as fichier:
+        fichier.truncate(n)
+    with concurrent.futures.ProcessPoolExecutor(nb_processus) as executeur:
+        list(executeur.map(_ecrire_adn, [chemin] * len(debuts), [entropie] * len(debuts), debuts, fins))
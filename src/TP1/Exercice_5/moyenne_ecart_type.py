@@ -0,0 +1,244 @@
+"""Moyenne et écart-type calculés en une seule passe.
+
+Le calcul direct de l'écart-type en deux passes (la moyenne, puis la somme
+des carrés des écarts à la moyenne) impose de conserver toutes les valeurs.
+La formule en une passe, moyenne des carrés moins carré de la moyenne, est
+quant à elle numériquement instable.
+
+La classe AccumulateurMoyenneVariance met à jour la moyenne et la somme des
+carrés des écarts à la moyenne à chaque valeur (algorithme de Welford). Deux
+accumulateurs, calculés sur des parties différentes des données, peuvent être
+fusionnés (formule de Chan, Golub et LeVeque) : les données peuvent ainsi être
+traitées par blocs, en parallèle.
+"""
+
+import concurrent.futures
+import contextlib
+import math
+import mmap
+import os
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class AccumulateurMoyenneVariance:
+    """Accumulateur du nombre de valeurs, de leur moyenne et de leur variance.
+
+    Parameters
+    ----------
+    valeurs : Iterable[float]
+        Valeurs ajoutées à la création de l'accumulateur.
+
+    Examples
+    --------
+    >>> a = AccumulateurMoyenneVariance([2, 4, 4, 4])
+    >>> b = AccumulateurMoyenneVariance()
+    >>> b.ajouter_tableau(np.array([5.0, 5.0, 7.0, 9.0]))
+    >>> total = a + b
+    >>> total.nombre, total.moyenne, total.ecart_type()
+    (8, 5.0, 2.0)
+    >>> round(total.ecart_type(ddof=1), 6)
+    2.13809
+    """
+
+    def __init__(self, valeurs: Iterable[float] = ()) -> None:
+        self.nombre = 0
+        self.moyenne = 0.0
+        # Somme des carrés des écarts à la moyenne
+        self._m2 = 0.0
+        for valeur in valeurs:
+            self.ajouter(valeur)
+
+    def __repr__(self) -> str:
+        return f"AccumulateurMoyenneVariance(nombre={self.nombre}, moyenne={self.moyenne}, variance={self.variance()})"
+
+    def ajouter(self, valeur: float) -> None:
+        """Ajoute une valeur (algorithme de Welford)."""
+        self.nombre += 1
+        ecart = valeur - self.moyenne
+        self.moyenne += ecart / self.nombre
+        self._m2 += ecart * (valeur - self.moyenne)
+
+    def ajouter_tableau(self, tableau: np.ndarray) -> None:
+        """Ajoute toutes les valeurs d'un tableau NumPy.
+
+        La moyenne et la somme des carrés des écarts du tableau sont calculées
+        par NumPy, en deux passes sur le tableau seul, puis fusionnées avec
+        celles de l'accumulateur.
+        """
+        tableau = np.asarray(tableau, dtype=np.float64).ravel()
+        if len(tableau) == 0:
+            return
+        bloc = type(self)()
+        bloc.nombre = len(tableau)
+        bloc.moyenne = float(tableau.mean())
+        ecarts = tableau - bloc.moyenne
+        bloc._m2 = float(np.dot(ecarts, ecarts))
+        self.fusionner(bloc)
+
+    def fusionner(self, autre: "AccumulateurMoyenneVariance") -> None:
+        """Ajoute à l'accumulateur les valeurs d'un autre accumulateur (formule de Chan et al.)."""
+        nombre = self.nombre + autre.nombre
+        if nombre == 0:
+            return
+        ecart = autre.moyenne - self.moyenne
+        self._m2 += autre._m2 + ecart * ecart * self.nombre * autre.nombre / nombre
+        self.moyenne += ecart * autre.nombre / nombre
+        self.nombre = nombre
+
+    def __add__(self, autre: "AccumulateurMoyenneVariance") -> "AccumulateurMoyenneVariance":
+        if not isinstance(autre, AccumulateurMoyenneVariance):
+            return NotImplemented
+        resultat = type(self)()
+        resultat.fusionner(self)
+        resultat.fusionner(autre)
+        return resultat
+
+    def variance(self, ddof: int = 0) -> float:
+        """Renvoie la variance des valeurs.
+
+        Parameters
+        ----------
+        ddof : int
+            La somme des carrés des écarts est divisée par nombre - ddof : 0
+            pour la variance de la population, 1 pour la variance corrigée
+            d'un échantillon.
+
+        Returns
+        -------
+        float
+            Variance, ou nan s'il n'y a pas assez de valeurs.
+        """
+        return self._m2 / (self.nombre - ddof) if self.nombre > ddof else math.nan
+
+    def ecart_type(self, ddof: int = 0) -> float:
+        """Renvoie l'écart-type des valeurs (voir la méthode variance pour ddof)."""
+        return math.sqrt(self.variance(ddof))
+
+
+def moyenne_ecart_type(valeurs: Iterable[float], ddof: int = 0) -> tuple[float, float]:
+    """Calcule la moyenne et l'écart-type d'une suite de valeurs, en une seule passe.
+
+    Parameters
+    ----------
+    valeurs : Iterable[float]
+        Valeurs, éventuellement fournies par un générateur.
+
+    ddof : int
+        0 pour l'écart-type de la population, 1 pour l'écart-type corrigé
+        d'un échantillon.
+
+    Returns
+    -------
+    tuple[float, float]
+        Moyenne et écart-type.
+
+    Examples
+    --------
+    >>> moyenne_ecart_type([2, 4, 4, 4, 5, 5, 7, 9])
+    (5.0, 2.0)
+    >>> moyenne, ecart_type = moyenne_ecart_type(1e9 + x for x in [4, 7, 13, 16])
+    >>> ecart_type
+    4.743416490252569
+    """
+    accumulateur = AccumulateurMoyenneVariance(valeurs)
+    return accumulateur.moyenne, accumulateur.ecart_type(ddof)
+
+
+def _accumuler_tableau(tableau: np.ndarray) -> AccumulateurMoyenneVariance:
+    accumulateur = AccumulateurMoyenneVariance()
+    accumulateur.ajouter_tableau(tableau)
+    return accumulateur
+
+
+def _accumuler_bloc_fichier(chemin: str | os.PathLike, debut: int, fin: int) -> AccumulateurMoyenneVariance:
+    """Accumule les nombres d'une portion de fichier texte, projeté en mémoire."""
+    with open(chemin, "rb") as fichier, mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as tampon:
+        return _accumuler_tableau(np.array(tampon[debut:fin].split(), dtype=np.float64))
+
+
+def _blocs_fichier(chemin: str | os.PathLike, taille_bloc: int) -> tuple[list[int], list[int]]:
+    """Découpe un fichier texte en blocs d'environ taille_bloc octets, se terminant par une fin de ligne."""
+    fins: list[int] = []
+    with open(chemin, "rb") as fichier:
+        taille = os.fstat(fichier.fileno()).st_size
+        if taille == 0:
+            return [], []
+        with mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as tampon:
+            fin = 0
+            while fin < taille:
+                # Chaque bloc s'arrête après la fin de la ligne contenant son dernier octet
+                fin = tampon.find(b"\n", min(fin + taille_bloc, taille) - 1) + 1 or taille
+                fins.append(fin)
+    return [0] + fins[:-1], fins
+
+
+def accumuler_par_blocs(
+    source: np.ndarray | str | os.PathLike, nb_taches: int | None = None, taille_bloc: int = 1 << 22
+) -> AccumulateurMoyenneVariance:
+    """Calcule la moyenne et la variance d'un tableau ou d'un fichier, par blocs traités en parallèle.
+
+    Un accumulateur est calculé pour chaque bloc, puis les accumulateurs sont
+    fusionnés dans l'ordre des blocs : le résultat ne dépend pas du nombre de
+    tâches.
+
+    Parameters
+    ----------
+    source : np.ndarray, str or os.PathLike
+        Tableau NumPy, fichier .npy (projeté en mémoire) ou fichier texte
+        contenant des nombres séparés par des espaces ou des fins de ligne.
+
+    nb_taches : int or None
+        Nombre de tâches parallèles : des fils d'exécution pour un tableau,
+        NumPy libérant le verrou global de l'interpréteur, et des processus
+        pour un fichier texte. Si None, le nombre de processeurs est utilisé.
+        Si 1, le calcul est effectué dans le fil courant.
+
+    taille_bloc : int
+        Nombre de valeurs (pour un tableau) ou d'octets (pour un fichier
+        texte) de chaque bloc.
+
+    Returns
+    -------
+    AccumulateurMoyenneVariance
+        Accumulateur de toutes les valeurs.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'valeurs.txt'
+    >>> _ = chemin.write_text('2\\n4\\n4\\n4\\n5\\n5\\n7\\n9\\n')
+    >>> accumulateur = accumuler_par_blocs(chemin, nb_taches=1, taille_bloc=5)
+    >>> accumulateur.nombre, accumulateur.moyenne, accumulateur.ecart_type()
+    (8, 5.0, 2.0)
+    >>> accumuler_par_blocs(np.arange(10.0), nb_taches=2, taille_bloc=3).moyenne
+    4.5
+    """
+    if isinstance(source, (str, os.PathLike)) and os.fspath(source).endswith(".npy"):
+        source = np.load(source, mmap_mode="r")
+
+    accumulateurs: Iterator[AccumulateurMoyenneVariance]
+    executeur: concurrent.futures.Executor
+    with contextlib.ExitStack() as pile:
+        if isinstance(source, np.ndarray):
+            source = source.ravel()
+            blocs = [source[i : i + taille_bloc] for i in range(0, len(source), taille_bloc)]
+            if nb_taches == 1:
+                accumulateurs = map(_accumuler_tableau, blocs)
+            else:
+                executeur = pile.enter_context(concurrent.futures.ThreadPoolExecutor(nb_taches))
+                accumulateurs = executeur.map(_accumuler_tableau, blocs)
+        else:
+            debuts, fins = _blocs_fichier(source, taille_bloc)
+            chemins = [source] * len(debuts)
+            if nb_taches == 1:
+                accumulateurs = map(_accumuler_bloc_fichier, chemins, debuts, fins)
+            else:
+                executeur = pile.enter_context(concurrent.futures.ProcessPoolExecutor(nb_taches))
+                accumulateurs = executeur.map(_accumuler_bloc_fichier, chemins, debuts, fins)
+
+        total = AccumulateurMoyenneVariance()
+        for accumulateur in accumulateurs:
+            total.fusionner(accumulateur)
+    return total
@@ -0,0 +1,315 @@
+"""Permutations d'une suite d'éléments.
+
+Construire récursivement la liste des n! permutations épuise rapidement la
+mémoire. Les permutations sont ici énumérées une par une, dans l'ordre
+lexicographique des positions des éléments : la permutation suivante est
+obtenue en place, sans récursion, en O(1) amorti.
+
+Les permutations sont aussi numérotées : la k-ième permutation est calculée
+directement à partir de k (système de numération factoriel), sans énumérer
+les précédentes. L'ensemble des permutations peut ainsi être découpé en
+intervalles de rangs, énumérés en parallèle par des processus différents.
+"""
+
+import bisect
+import collections.abc
+import concurrent.futures
+import math
+import os
+from typing import Any, Callable, Iterable, Iterator, overload
+
+
+def permutation_suivante(liste: list) -> bool:
+    """Remplace une liste par la permutation suivante de ses éléments, dans l'ordre lexicographique.
+
+    Parameters
+    ----------
+    liste : list
+        Liste d'éléments comparables, éventuellement égaux.
+
+    Returns
+    -------
+    bool
+        False si la liste était la dernière permutation (triée par ordre
+        décroissant) : elle est alors remplacée par la première (triée par
+        ordre croissant). True sinon.
+
+    Examples
+    --------
+    >>> liste = [1, 3, 2]
+    >>> permutation_suivante(liste), liste
+    (True, [2, 1, 3])
+    >>> liste = [1, 2, 2]
+    >>> while True:
+    ...     print(liste)
+    ...     if not permutation_suivante(liste):
+    ...         break
+    [1, 2, 2]
+    [2, 1, 2]
+    [2, 2, 1]
+    """
+    # Plus long suffixe décroissant
+    i = len(liste) - 2
+    while i >= 0 and liste[i] >= liste[i + 1]:
+        i -= 1
+    if i >= 0:
+        # Le pivot est échangé avec le plus petit élément du suffixe qui lui est supérieur
+        j = len(liste) - 1
+        while liste[j] <= liste[i]:
+            j -= 1
+        liste[i], liste[j] = liste[j], liste[i]
+    liste[i + 1 :] = liste[:i:-1]
+    return i >= 0
+
+
+class Permutations(collections.abc.Sequence):
+    """Suite des permutations d'éléments, dans l'ordre lexicographique de leurs positions.
+
+    Les permutations ne sont pas stockées : la k-ième est calculée à la
+    demande en O(n²), quel que soit k, et son rang est calculé de même.
+    Comme pour itertools.permutations, les éléments sont distingués par leur
+    position et non par leur valeur. Si les éléments sont triés, l'ordre est
+    celui des valeurs.
+
+    Parameters
+    ----------
+    elements : Iterable
+        Éléments à permuter.
+
+    Attributes
+    ----------
+    nombre : int
+        Nombre de permutations, n!. Contrairement à len, il n'est pas limité à
+        sys.maxsize.
+
+    Examples
+    --------
+    >>> permutations = Permutations('abc')
+    >>> len(permutations), permutations[3], permutations[-1]
+    (6, ('b', 'c', 'a'), ('c', 'b', 'a'))
+    >>> permutations.index(('b', 'c', 'a'))
+    3
+    >>> permutations[1:3]
+    [('a', 'c', 'b'), ('b', 'a', 'c')]
+    >>> Permutations(range(20))[10**18]
+    (8, 4, 3, 10, 16, 7, 13, 6, 17, 9, 18, 12, 2, 5, 19, 1, 14, 15, 0, 11)
+    """
+
+    def __init__(self, elements: Iterable) -> None:
+        self.elements = tuple(elements)
+        self.nombre = math.factorial(len(self.elements))
+
+    def __len__(self) -> int:
+        return self.nombre
+
+    def _indices(self, rang: int) -> list[int]:
+        """Renvoie les positions des éléments de la permutation de rang donné."""
+        n = len(self.elements)
+        restants = list(range(n))
+        indices = []
+        factorielle = self.nombre
+        for i in range(n, 0, -1):
+            factorielle //= i
+            q, rang = divmod(rang, factorielle)
+            indices.append(restants.pop(q))
+        return indices
+
+    @overload
+    def __getitem__(self, rang: int) -> tuple: ...
+
+    @overload
+    def __getitem__(self, rang: slice) -> list[tuple]: ...
+
+    def __getitem__(self, rang: int | slice) -> tuple | list[tuple]:
+        if isinstance(rang, slice):
+            debut, fin, pas = rang.indices(self.nombre)
+            if pas == 1:
+                return list(self.parcourir(debut, fin))
+            return [self[k] for k in range(debut, fin, pas)]
+        if not -self.nombre <= rang < self.nombre:
+            raise IndexError("Rang de permutation hors limites.")
+        return tuple(self.elements[i] for i in self._indices(rang % self.nombre))
+
+    def index(self, permutation: Iterable) -> int:  # type: ignore[override]
+        """Renvoie le rang d'une permutation des éléments.
+
+        Les éléments doivent être hachables. S'ils ne sont pas distincts, le
+        rang renvoyé est celui de l'une des permutations égales.
+        """
+        positions: dict[Any, list[int]] = {}
+        for i, element in reversed(list(enumerate(self.elements))):
+            positions.setdefault(element, []).append(i)
+        restants = list(range(len(self.elements)))
+        rang = 0
+        factorielle = self.nombre
+        try:
+            for i, element in enumerate(permutation, start=1):
+                factorielle //= len(self.elements) - i + 1
+                q = bisect.bisect_left(restants, positions[element].pop())
+                rang += q * factorielle
+                restants.pop(q)
+        except (KeyError, IndexError, ZeroDivisionError):
+            raise ValueError(f"{permutation!r} n'est pas une permutation des éléments.") from None
+        if restants:
+            raise ValueError(f"{permutation!r} n'est pas une permutation des éléments.")
+        return rang
+
+    def __contains__(self, permutation: object) -> bool:
+        try:
+            self.index(permutation)  # type: ignore[arg-type]
+        except (ValueError, TypeError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[tuple]:
+        return self.parcourir()
+
+    def parcourir(self, debut: int = 0, fin: int | None = None, tampon: bool = False) -> Iterator:
+        """Énumère les permutations de rangs compris entre debut (inclus) et fin (exclu).
+
+        La première permutation est calculée à partir de son rang, puis
+        chacune des suivantes est obtenue en place à partir de la précédente.
+
+        Parameters
+        ----------
+        debut, fin : int
+            Intervalle de rangs. Si fin est None, toutes les permutations à
+            partir de debut sont énumérées. Comme pour une tranche, les rangs
+            négatifs sont comptés à partir de la fin.
+
+        tampon : bool
+            Si True, la même liste est renvoyée à chaque étape, modifiée en
+            place : aucune permutation n'est construite et le coût est O(1)
+            amorti par permutation. La liste ne doit pas être modifiée, et
+            doit être copiée pour être conservée. Si False, chaque permutation
+            est un nouveau tuple.
+
+        Yields
+        ------
+        tuple or list
+            Permutations.
+
+        Examples
+        --------
+        >>> list(Permutations([1, 2, 3]).parcourir(2, 5))
+        [(2, 1, 3), (2, 3, 1), (3, 1, 2)]
+        >>> list(Permutations([1, 2, 3]).parcourir(-1))
+        [(3, 2, 1)]
+        >>> sum(sum(i * x for i, x in enumerate(p)) for p in Permutations(range(8)).parcourir(tampon=True))
+        3951360
+        """
+        debut, fin, _ = slice(debut, fin).indices(self.nombre)
+        if debut >= fin:
+            return
+        indices = self._indices(debut)
+        valeurs = [self.elements[i] for i in indices]
+        n = len(indices)
+        for _ in range(fin - debut - 1):
+            yield valeurs if tampon else tuple(valeurs)
+            # Permutation suivante des positions, appliquée aussi aux valeurs
+            i = n - 2
+            while indices[i] > indices[i + 1]:
+                i -= 1
+            j = n - 1
+            while indices[j] < indices[i]:
+                j -= 1
+            indices[i], indices[j] = indices[j], indices[i]
+            valeurs[i], valeurs[j] = valeurs[j], valeurs[i]
+            indices[i + 1 :] = indices[:i:-1]
+            valeurs[i + 1 :] = valeurs[:i:-1]
+        yield valeurs if tampon else tuple(valeurs)
+
+    def tranches(self, nb_tranches: int) -> list[range]:
+        """Découpe les rangs des permutations en nb_tranches intervalles consécutifs de tailles égales à 1 près.
+
+        Examples
+        --------
+        >>> Permutations('abcd').tranches(5)
+        [range(0, 4), range(4, 9), range(9, 14), range(14, 19), range(19, 24)]
+        """
+        nb_tranches = max(1, min(nb_tranches, self.nombre))
+        bornes = [self.nombre * k // nb_tranches for k in range(nb_tranches + 1)]
+        return [range(debut, fin) for debut, fin in zip(bornes, bornes[1:])]
+
+
+def permut(elements: Iterable) -> Iterator[tuple]:
+    """Énumère les permutations d'éléments, une par une.
+
+    Parameters
+    ----------
+    elements : Iterable
+        Éléments à permuter.
+
+    Yields
+    ------
+    tuple
+        Permutations, dans l'ordre lexicographique des positions des éléments.
+
+    Examples
+    --------
+    >>> list(permut('abc'))
+    [('a', 'b', 'c'), ('a', 'c', 'b'), ('b', 'a', 'c'), ('b', 'c', 'a'), ('c', 'a', 'b'), ('c', 'b', 'a')]
+    >>> next(permut(range(1000)))[-3:]
+    (997, 998, 999)
+    """
+    return iter(Permutations(elements))
+
+
+def _appliquer_tranche(fonction: Callable[[Iterator], Any], elements: tuple, debut: int, fin: int) -> Any:
+    return fonction(Permutations(elements).parcourir(debut, fin))
+
+
+def appliquer_par_tranches(
+    fonction: Callable[[Iterator], Any],
+    elements: Iterable,
+    nb_processus: int | None = None,
+    nb_tranches: int | None = None,
+) -> list:
+    """Applique une fonction aux permutations d'éléments, découpées en intervalles de rangs traités en parallèle.
+
+    Parameters
+    ----------
+    fonction : callable
+        Fonction appliquée à l'itérateur des permutations de chaque
+        intervalle, renvoyant un résultat partiel (par exemple un nombre de
+        permutations vérifiant une condition, ou la meilleure d'entre elles).
+        Pour être transmise à d'autres processus, elle doit être définie au
+        niveau d'un module.
+
+    elements : Iterable
+        Éléments à permuter.
+
+    nb_processus : int or None
+        Nombre de processus. Si None, le nombre de processeurs est utilisé. Si
+        1, les intervalles sont traités dans le processus courant.
+
+    nb_tranches : int or None
+        Nombre d'intervalles de rangs. Si None, quatre fois le nombre de
+        processus, pour équilibrer la charge.
+
+    Returns
+    -------
+    list
+        Résultats partiels, dans l'ordre des intervalles.
+
+    Examples
+    --------
+    >>> def nb_derangements(permutations):
+    ...     return sum(all(x != i for i, x in enumerate(p)) for p in permutations)
+    >>> sum(appliquer_par_tranches(nb_derangements, range(6), nb_processus=1, nb_tranches=7))
+    265
+    """
+    elements = tuple(elements)
+    if nb_tranches is None:
+        nb_tranches = 4 * (nb_processus or os.cpu_count() or 1)
+    tranches = Permutations(elements).tranches(nb_tranches)
+    arguments = (
+        [fonction] * len(tranches),
+        [elements] * len(tranches),
+        [t.start for t in tranches],
+        [t.stop for t in tranches],
+    )
+    if nb_processus == 1:
+        return list(map(_appliquer_tranche, *arguments))
+    with concurrent.futures.ProcessPoolExecutor(nb_processus) as executeur:
+        return list(executeur.map(_appliquer_tranche, *arguments))
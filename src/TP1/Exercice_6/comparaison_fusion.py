@@ -0,0 +1,85 @@
+"""Comparaison des fusions de listes triées et du tri externe.
+
+Pour chaque nombre d'éléments de TAILLES, NB_SUITES listes triées d'entiers
+aléatoires sont fusionnées :
+    - en triant leur concaténation avec sorted ;
+    - avec heapq.merge ;
+    - avec fusion_k ;
+    - avec fusion, deux à deux.
+
+Un fichier de NB_LIGNES entiers aléatoires est ensuite trié :
+    - en mémoire, avec sorted sur toutes ses lignes ;
+    - avec tri_externe, par blocs de TAILLE_BLOC octets.
+
+Utilisation (depuis le dossier src) :
+    python -m TP1.Exercice_6.comparaison_fusion
+"""
+
+import heapq
+import pathlib
+import random
+import tempfile
+import time
+
+from .fusion import fusion, fusion_k, tri_externe
+
+TAILLES = [10**4, 10**5, 10**6, 4 * 10**6]
+NB_SUITES = 16
+NB_LIGNES = 5 * 10**6
+TAILLE_BLOC = 1 << 22
+
+
+def fusion_deux_a_deux(suites):
+    while len(suites) > 1:
+        suites = [fusion(*suites[i : i + 2]) if i + 1 < len(suites) else suites[i] for i in range(0, len(suites), 2)]
+    return suites[0]
+
+
+def trier_en_memoire(chemin_entree, chemin_sortie):
+    with open(chemin_entree, "rb") as entree:
+        lignes = entree.read().split()
+    lignes.sort(key=int)
+    lignes.append(b"")
+    with open(chemin_sortie, "wb") as sortie:
+        sortie.write(b"\n".join(lignes))
+    return len(lignes) - 1
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    for taille in TAILLES:
+        print(f"Fusion de {NB_SUITES} listes triées, {taille:_} éléments au total")
+        suites = [sorted(random.choices(range(10**9), k=taille // NB_SUITES)) for _ in range(NB_SUITES)]
+        methodes = {
+            "sorted": lambda: sorted([x for suite in suites for x in suite]),
+            "heapq.merge": lambda: list(heapq.merge(*suites)),
+            "fusion_k": lambda: list(fusion_k(*suites)),
+            "fusion deux à deux": lambda: fusion_deux_a_deux(suites),
+        }
+        reference = None
+        for nom, methode in methodes.items():
+            debut = time.perf_counter()
+            resultat = methode()
+            duree = time.perf_counter() - debut
+            reference = resultat if reference is None else reference
+            assert resultat == reference
+            print(f"    {nom:<20} : {duree:7.3f} s, {taille / duree:14_.0f} éléments/s")
+
+    with tempfile.TemporaryDirectory() as dossier:
+        entree = pathlib.Path(dossier) / "entree.txt"
+        sortie = pathlib.Path(dossier) / "sortie.txt"
+        with open(entree, "w") as fichier:
+            for _ in range(0, NB_LIGNES, 10**5):
+                fichier.write("\n".join(map(str, random.choices(range(10**9), k=10**5))) + "\n")
+        print(f"Tri d'un fichier de {NB_LIGNES:_} lignes ({entree.stat().st_size / 1e6:.0f} Mo)")
+        methodes = {
+            "sorted en mémoire": lambda: trier_en_memoire(entree, sortie),
+            f"tri_externe, blocs de {TAILLE_BLOC >> 20} Mo": lambda: tri_externe(
+                entree, sortie, cle=int, taille_bloc=TAILLE_BLOC, dossier=dossier
+            ),
+        }
+        for nom, methode in methodes.items():
+            debut = time.perf_counter()
+            nb_lignes = methode()
+            duree = time.perf_counter() - debut
+            print(f"    {nom:<30} : {duree:7.3f} s, {nb_lignes / duree:14_.0f} lignes/s")
@@ -0,0 +1,89 @@
+"""Comparaison des suppressions de doublons selon le nombre d'éléments distincts.
+
+Pour chaque nombre d'éléments distincts de CARDINALITES, NB_ELEMENTS entiers
+aléatoires sont dédoublonnés :
+    - en testant l'appartenance à la liste des éléments déjà vus, sur les
+      NB_ELEMENTS_LENTS premiers entiers seulement. La durée est extrapolée
+      proportionnellement au nombre de comparaisons, qui croît comme le
+      produit du nombre d'entiers et du nombre d'éléments distincts ;
+    - avec unique (dictionnaire) ;
+    - avec unique_flux, exact (ensemble) et approché (filtre de Bloom) ;
+    - avec unique_tableau ;
+    - avec np.unique, qui ne conserve pas l'ordre ;
+    - avec unique_blocs, exact et approché, par blocs de TAILLE_BLOC entiers.
+
+Pour chaque méthode sont affichés la durée, le nombre d'éléments distincts
+trouvés (inférieur au nombre exact pour les méthodes approchées) et la mémoire
+occupée par les éléments déjà vus.
+
+Utilisation (depuis le dossier src) :
+    python -m TP1.Exercice_6.comparaison_unique
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from .unique import FiltreBloom, unique, unique_blocs, unique_flux, unique_tableau
+
+NB_ELEMENTS = 10**6
+NB_ELEMENTS_LENTS = 10**4
+CARDINALITES = [10, 10**3, 10**5, 10**6]
+TAILLE_BLOC = 10**5
+TAUX_FAUX_POSITIFS = 0.01
+
+
+def unique_liste(elements):
+    vus = []
+    for element in elements:
+        if element not in vus:
+            vus.append(element)
+    return vus
+
+
+def nb_comparaisons(tableau):
+    """Majorant du nombre de comparaisons de unique_liste : pour chaque entier, le nombre d'éléments déjà vus."""
+    premiers = np.zeros(len(tableau), dtype=np.int64)
+    premiers[np.unique(tableau, return_index=True)[1]] = 1
+    return int(np.cumsum(premiers).sum())
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    for cardinalite in CARDINALITES:
+        tableau = rng.integers(0, 2**62, cardinalite)[rng.integers(0, cardinalite, NB_ELEMENTS)]
+        elements = tableau.tolist()
+        nb_distincts = len(set(elements))
+        blocs = [tableau[i : i + TAILLE_BLOC] for i in range(0, NB_ELEMENTS, TAILLE_BLOC)]
+        taille_ensemble = sys.getsizeof(set(elements)) + 32 * nb_distincts
+        taille_filtre = FiltreBloom(nb_distincts, TAUX_FAUX_POSITIFS).nbytes
+        facteur_liste = nb_comparaisons(tableau) / nb_comparaisons(tableau[:NB_ELEMENTS_LENTS])
+        print(f"{NB_ELEMENTS:_} entiers, {nb_distincts:_} distincts")
+
+        methodes = {
+            "liste des éléments vus": (lambda: unique_liste(elements[:NB_ELEMENTS_LENTS]), facteur_liste, None),
+            "unique": (lambda: unique(elements), 1, taille_ensemble),
+            "unique_flux exact": (lambda: list(unique_flux(elements)), 1, taille_ensemble),
+            "unique_flux Bloom": (
+                lambda: list(unique_flux(elements, TAUX_FAUX_POSITIFS, nb_distincts)),
+                1,
+                taille_filtre,
+            ),
+            "unique_tableau": (lambda: unique_tableau(tableau), 1, None),
+            "np.unique (sans ordre)": (lambda: np.unique(tableau), 1, None),
+            "unique_blocs exact": (lambda: np.concatenate(list(unique_blocs(blocs))), 1, 8 * nb_distincts),
+            "unique_blocs Bloom": (
+                lambda: np.concatenate(list(unique_blocs(blocs, TAUX_FAUX_POSITIFS, nb_distincts))),
+                1,
+                taille_filtre,
+            ),
+        }
+        for nom, (methode, facteur, memoire) in methodes.items():
+            debut = time.perf_counter()
+            resultat = methode()
+            duree = time.perf_counter() - debut
+            extrapolation = " (extrapolée)" if facteur != 1 else ""
+            distincts = f"{len(resultat):9_} distincts" if facteur == 1 else " " * 19
+            texte_memoire = f", {memoire / 1e6:8.3f} Mo" if memoire is not None else ""
+            print(f"    {nom:<25} : {duree * facteur:10.3f} s{extrapolation:<13} {distincts}{texte_memoire}")
@@ -0,0 +1,285 @@
+"""Fusion de listes triées et tri externe.
+
+La fusion de deux listes triées avance un indice dans chacune d'elles et
+prend à chaque étape le plus petit des deux éléments courants. Pour fusionner
+k suites triées, les éléments courants sont rangés dans un tas binaire : le
+plus petit est obtenu en O(1) et remplacé en O(log k).
+
+Les suites sont parcourues au fil de la fusion, sans être chargées en mémoire.
+Elles peuvent donc être des fichiers triés, lus par tampons de taille fixe :
+c'est la base du tri externe, qui trie un fichier plus grand que la mémoire en
+triant des blocs qui tiennent en mémoire, écrits dans des fichiers temporaires,
+puis en fusionnant ces fichiers.
+"""
+
+import contextlib
+import heapq
+import itertools
+import os
+import tempfile
+from typing import Any, Callable, Iterable, Iterator
+
+# Nombre de lignes écrites à la fois par fusion_fichiers
+_TAILLE_LOT = 4096
+
+
+def fusion(liste1: list, liste2: list) -> list:
+    """Fusionne deux listes triées en une liste triée.
+
+    Parameters
+    ----------
+    liste1, liste2 : list
+        Listes triées par ordre croissant.
+
+    Returns
+    -------
+    list
+        Liste triée des éléments des deux listes. À égalité, les éléments de
+        liste1 sont placés avant ceux de liste2.
+
+    Examples
+    --------
+    >>> fusion([1, 4, 9], [2, 3, 10, 11])
+    [1, 2, 3, 4, 9, 10, 11]
+    >>> fusion([], [5])
+    [5]
+    """
+    resultat = []
+    i = j = 0
+    while i < len(liste1) and j < len(liste2):
+        if liste2[j] < liste1[i]:
+            resultat.append(liste2[j])
+            j += 1
+        else:
+            resultat.append(liste1[i])
+            i += 1
+    # Une des deux listes est épuisée : le reste de l'autre est déjà trié
+    resultat.extend(liste1[i:])
+    resultat.extend(liste2[j:])
+    return resultat
+
+
+def fusion_k(*suites: Iterable, cle: Callable[[Any], Any] | None = None) -> Iterator:
+    """Fusionne un nombre quelconque de suites triées, avec un tas binaire.
+
+    Le tas contient, pour chaque suite non épuisée, son élément courant : seul
+    un élément par suite est en mémoire. Lorsqu'il ne reste qu'une suite, ses
+    éléments sont renvoyés directement.
+
+    Parameters
+    ----------
+    *suites : Iterable
+        Suites triées par ordre croissant (de cle, si elle est donnée).
+
+    cle : callable or None
+        Fonction appliquée à chaque élément pour le comparer.
+
+    Yields
+    ------
+    object
+        Éléments des suites, par ordre croissant. À égalité, les éléments
+        sont renvoyés dans l'ordre des suites.
+
+    Examples
+    --------
+    >>> list(fusion_k([1, 5, 9], [2, 3], [], [4, 5, 10]))
+    [1, 2, 3, 4, 5, 5, 9, 10]
+    >>> list(fusion_k(['pomme', 'kiwi'], ['fraise', 'ananas'], cle=lambda mot: -len(mot)))
+    ['fraise', 'ananas', 'pomme', 'kiwi']
+    """
+    # Chaque entrée du tas est [clé, indice de la suite, élément, suivant, itérateur]
+    # L'indice départage les clés égales : les éléments ne sont jamais comparés entre eux
+    tas = []
+    for indice, suite in enumerate(suites):
+        iterateur = iter(suite)
+        try:
+            element = next(iterateur)
+        except StopIteration:
+            continue
+        tas.append([element if cle is None else cle(element), indice, element, iterateur.__next__, iterateur])
+    heapq.heapify(tas)
+
+    while len(tas) > 1:
+        entree = tas[0]
+        yield entree[2]
+        try:
+            element = entree[3]()
+        except StopIteration:
+            heapq.heappop(tas)
+            continue
+        entree[0] = element if cle is None else cle(element)
+        entree[2] = element
+        heapq.heapreplace(tas, entree)
+
+    if tas:
+        yield tas[0][2]
+        yield from tas[0][4]
+
+
+def lire_lignes(chemin: str | os.PathLike, taille_tampon: int = 1 << 16) -> Iterator[bytes]:
+    """Lit les lignes d'un fichier, sans leur fin de ligne, avec un tampon de taille fixe.
+
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Chemin du fichier.
+
+    taille_tampon : int
+        Taille (en octets) du tampon de lecture.
+
+    Yields
+    ------
+    bytes
+        Lignes du fichier.
+    """
+    with open(chemin, "rb", buffering=taille_tampon) as fichier:
+        for ligne in fichier:
+            yield ligne[:-1] if ligne.endswith(b"\n") else ligne
+
+
+def fusion_fichiers(
+    chemins: Iterable[str | os.PathLike],
+    chemin_sortie: str | os.PathLike,
+    cle: Callable[[bytes], Any] | None = None,
+    taille_tampon: int = 1 << 16,
+) -> int:
+    """Fusionne des fichiers dont les lignes sont triées.
+
+    Chaque fichier est lu avec un tampon de taille_tampon octets, et le
+    fichier de sortie est écrit au fil de la fusion : la mémoire utilisée ne
+    dépend que du nombre de fichiers, et non de leur taille.
+
+    Parameters
+    ----------
+    chemins : Iterable[str or os.PathLike]
+        Fichiers dont les lignes sont triées par ordre croissant (de cle, si
+        elle est donnée).
+
+    chemin_sortie : str or os.PathLike
+        Fichier dans lequel écrire les lignes fusionnées.
+
+    cle : callable or None
+        Fonction appliquée à chaque ligne (de type bytes, sans fin de ligne)
+        pour la comparer. Si None, les lignes sont comparées comme des octets.
+
+    taille_tampon : int
+        Taille (en octets) des tampons de lecture et d'écriture.
+
+    Returns
+    -------
+    int
+        Nombre de lignes écrites.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> dossier = pathlib.Path(tempfile.mkdtemp())
+    >>> _ = (dossier / 'a.txt').write_text('2\\n10\\n33\\n')
+    >>> _ = (dossier / 'b.txt').write_text('1\\n7\\n')
+    >>> fusion_fichiers([dossier / 'a.txt', dossier / 'b.txt'], dossier / 'sortie.txt', cle=int)
+    5
+    >>> (dossier / 'sortie.txt').read_text().split()
+    ['1', '2', '7', '10', '33']
+    """
+    nb_lignes = 0
+    with open(chemin_sortie, "wb", buffering=taille_tampon) as sortie:
+        lignes = fusion_k(*(lire_lignes(chemin, taille_tampon) for chemin in chemins), cle=cle)
+        # Les lignes sont écrites par lots, pour limiter le nombre d'appels à write
+        while lot := list(itertools.islice(lignes, _TAILLE_LOT)):
+            lot.append(b"")
+            sortie.write(b"\n".join(lot))
+            nb_lignes += len(lot) - 1
+    return nb_lignes
+
+
+def tri_externe(
+    chemin_entree: str | os.PathLike,
+    chemin_sortie: str | os.PathLike,
+    cle: Callable[[bytes], Any] | None = None,
+    taille_bloc: int = 1 << 26,
+    nb_fusion: int = 128,
+    taille_tampon: int = 1 << 16,
+    dossier: str | os.PathLike | None = None,
+) -> int:
+    """Trie les lignes d'un fichier plus grand que la mémoire (tri externe).
+
+    Le fichier est lu par blocs d'environ taille_bloc octets. Chaque bloc est
+    trié en mémoire et écrit dans un fichier temporaire. Les fichiers
+    temporaires sont ensuite fusionnés par groupes d'au plus nb_fusion, en
+    autant de passes que nécessaire, jusqu'à n'en former plus qu'un.
+
+    Parameters
+    ----------
+    chemin_entree : str or os.PathLike
+        Fichier dont les lignes sont à trier.
+
+    chemin_sortie : str or os.PathLike
+        Fichier dans lequel écrire les lignes triées.
+
+    cle : callable or None
+        Fonction appliquée à chaque ligne (de type bytes, sans fin de ligne)
+        pour la comparer. Si None, les lignes sont comparées comme des octets.
+
+    taille_bloc : int
+        Taille approximative (en octets) des blocs triés en mémoire.
+
+    nb_fusion : int
+        Nombre maximal de fichiers fusionnés, donc ouverts, à la fois.
+
+    taille_tampon : int
+        Taille (en octets) des tampons de lecture et d'écriture des fusions.
+
+    dossier : str, os.PathLike or None
+        Dossier des fichiers temporaires. Si None, le dossier temporaire du
+        système est utilisé.
+
+    Returns
+    -------
+    int
+        Nombre de lignes triées.
+
+    Examples
+    --------
+    >>> import pathlib, random, tempfile
+    >>> dossier = pathlib.Path(tempfile.mkdtemp())
+    >>> nombres = random.Random(0).sample(range(1000), 200)
+    >>> _ = (dossier / 'entree.txt').write_text('\\n'.join(map(str, nombres)))
+    >>> tri_externe(dossier / 'entree.txt', dossier / 'sortie.txt', cle=int, taille_bloc=100, nb_fusion=4)
+    200
+    >>> [int(ligne) for ligne in (dossier / 'sortie.txt').read_text().split()] == sorted(nombres)
+    True
+    """
+    if nb_fusion < 2:
+        raise ValueError("nb_fusion doit être au moins égal à 2.")
+
+    with tempfile.TemporaryDirectory(dir=dossier) as temporaire:
+        compteur = itertools.count()
+
+        def nouveau_fichier() -> str:
+            return os.path.join(temporaire, f"{next(compteur)}.txt")
+
+        # Tri en mémoire de chaque bloc
+        fichiers = []
+        nb_lignes = 0
+        with open(chemin_entree, "rb") as entree:
+            while lignes := entree.readlines(taille_bloc):
+                lignes = [ligne[:-1] if ligne.endswith(b"\n") else ligne for ligne in lignes]
+                lignes.sort(key=cle)
+                lignes.append(b"")
+                fichiers.append(nouveau_fichier())
+                with open(fichiers[-1], "wb") as sortie:
+                    sortie.write(b"\n".join(lignes))
+                nb_lignes += len(lignes) - 1
+
+        # Fusion des fichiers par groupes, jusqu'au fichier de sortie
+        while len(fichiers) > nb_fusion:
+            groupes = [fichiers[i : i + nb_fusion] for i in range(0, len(fichiers), nb_fusion)]
+            fichiers = []
+            for groupe in groupes:
+                fichiers.append(nouveau_fichier())
+                fusion_fichiers(groupe, fichiers[-1], cle, taille_tampon)
+                for chemin in groupe:
+                    with contextlib.suppress(OSError):
+                        os.remove(chemin)
+        fusion_fichiers(fichiers, chemin_sortie, cle, taille_tampon)
+    return nb_lignes
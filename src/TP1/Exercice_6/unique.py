@@ -0,0 +1,328 @@
+"""Suppression des doublons d'une suite, en conservant l'ordre des premières apparitions.
+
+Tester l'appartenance de chaque élément à la liste des éléments déjà vus
+coûte O(n²). Avec un ensemble, chaque test coûte O(1), mais l'ensemble
+contient tous les éléments distincts : sa taille n'est pas bornée pour un flux
+de données. Ce module propose :
+    - unique et unique_flux, exacts, avec un ensemble ;
+    - unique_tableau, pour un tableau NumPy, en triant le tableau ;
+    - FiltreBloom, un ensemble approché de taille fixe, utilisé par
+      unique_flux et unique_blocs pour traiter des flux de taille non bornée.
+      Un élément nouveau peut être considéré à tort comme déjà vu, avec une
+      probabilité choisie (taux de faux positifs).
+"""
+
+import hashlib
+import itertools
+import math
+from typing import Hashable, Iterable, Iterator
+
+import numpy as np
+
+_MASQUE_64 = (1 << 64) - 1
+
+# Nombre d'éléments traités à la fois par unique_flux en mode approché
+_TAILLE_LOT = 4096
+
+
+def unique(liste: Iterable[Hashable]) -> list:
+    """Renvoie les éléments distincts d'une liste, dans l'ordre de leur première apparition.
+
+    Parameters
+    ----------
+    liste : Iterable[Hashable]
+        Éléments.
+
+    Returns
+    -------
+    list
+        Éléments distincts.
+
+    Examples
+    --------
+    >>> unique([3, 1, 3, 2, 1])
+    [3, 1, 2]
+    >>> unique('abracadabra')
+    ['a', 'b', 'r', 'c', 'd']
+    """
+    # Les dictionnaires conservent l'ordre d'insertion de leurs clés
+    return list(dict.fromkeys(liste))
+
+
+def unique_tableau(tableau: np.ndarray) -> np.ndarray:
+    """Renvoie les éléments distincts d'un tableau NumPy, dans l'ordre de leur première apparition.
+
+    Le tableau est trié par un tri stable : dans chaque groupe d'éléments
+    égaux, le premier est la première apparition de l'élément.
+
+    Parameters
+    ----------
+    tableau : np.ndarray
+        Tableau à une dimension.
+
+    Returns
+    -------
+    np.ndarray
+        Éléments distincts.
+
+    Examples
+    --------
+    >>> unique_tableau(np.array([3, 1, 3, 2, 1]))
+    array([3, 1, 2])
+    """
+    tableau = np.asarray(tableau).ravel()
+    return tableau[_indices_premiers(tableau)]
+
+
+def _indices_premiers(tableau: np.ndarray) -> np.ndarray:
+    """Renvoie les indices croissants des premières apparitions des éléments d'un tableau."""
+    ordre = np.argsort(tableau, kind="stable")
+    tries = tableau[ordre]
+    premiers = np.empty(len(tableau), dtype=bool)
+    premiers[:1] = True
+    np.not_equal(tries[1:], tries[:-1], out=premiers[1:])
+    return np.sort(ordre[premiers])
+
+
+class FiltreBloom:
+    """Ensemble approché de taille fixe (filtre de Bloom).
+
+    Le filtre est un tableau de bits. Ajouter un élément met à 1 les bits
+    désignés par nb_hachages fonctions de hachage. Un élément est considéré
+    comme présent si tous ses bits valent 1 : un élément ajouté est toujours
+    reconnu, mais un élément jamais ajouté peut l'être aussi (faux positif).
+
+    La taille du filtre est choisie pour que le taux de faux positifs ne
+    dépasse pas taux_faux_positifs tant que le nombre d'éléments ajoutés ne
+    dépasse pas capacite.
+
+    Les entiers de 64 bits sont hachés directement, les autres éléments à
+    partir de leur représentation en octets (BLAKE2) : le filtre ne dépend
+    pas de la graine de hachage de Python et peut être fusionné avec un
+    filtre calculé par un autre processus.
+
+    Parameters
+    ----------
+    capacite : int
+        Nombre d'éléments distincts attendus.
+
+    taux_faux_positifs : float
+        Taux de faux positifs visé, entre 0 et 1 (exclus).
+
+    graine : int
+        Graine des fonctions de hachage.
+
+    Examples
+    --------
+    >>> filtre = FiltreBloom(capacite=1000, taux_faux_positifs=0.01)
+    >>> filtre.ajouter('pomme')
+    False
+    >>> filtre.ajouter('pomme')
+    True
+    >>> 'pomme' in filtre, 42 in filtre
+    (True, False)
+    >>> filtre.nb_bits, filtre.nb_hachages
+    (16384, 7)
+    """
+
+    def __init__(self, capacite: int, taux_faux_positifs: float = 0.01, graine: int = 0) -> None:
+        if capacite < 1:
+            raise ValueError("La capacité doit être strictement positive.")
+        if not 0 < taux_faux_positifs < 1:
+            raise ValueError("Le taux de faux positifs doit être compris entre 0 et 1 (exclus).")
+        self.capacite = capacite
+        self.taux_faux_positifs = taux_faux_positifs
+        self.graine = graine
+        # Nombre de bits optimal, arrondi à la puissance de 2 supérieure, et nombre de hachages associé
+        nb_bits = -capacite * math.log(taux_faux_positifs) / math.log(2) ** 2
+        self._bits = max(3, math.ceil(math.log2(nb_bits)))
+        self.nb_bits = 1 << self._bits
+        self.nb_hachages = max(1, round(nb_bits / capacite * math.log(2)))
+        # Hachage multiplicatif : h(x) = (a * x + b) mod 2**64, dont on garde les bits de poids fort
+        generateur = np.random.default_rng(graine)
+        self._a = generateur.integers(0, 2**63, self.nb_hachages, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = generateur.integers(0, 2**63, self.nb_hachages, dtype=np.uint64)
+        self._coefficients = list(zip(self._a.tolist(), self._b.tolist()))
+        # Un bytearray est plus rapide qu'un tableau NumPy pour les accès élément par élément
+        self.octets = bytearray(self.nb_bits // 8)
+
+    @property
+    def nbytes(self) -> int:
+        """int : Nombre d'octets occupés par le filtre, indépendant du nombre d'éléments ajoutés."""
+        return len(self.octets)
+
+    @staticmethod
+    def _cle(element: Hashable) -> int:
+        """Renvoie un entier de 64 bits représentant l'élément.
+
+        Comme pour un ensemble, des éléments égaux ont la même clé : les
+        booléens et les flottants entiers ont la clé de l'entier égal.
+        """
+        if isinstance(element, np.bool_) or (isinstance(element, (float, np.floating)) and float(element).is_integer()):
+            element = int(element)
+        if isinstance(element, (int, np.integer)) and -(1 << 63) <= element < 1 << 63:
+            return int(element) & _MASQUE_64
+        if isinstance(element, (int, np.integer)):
+            donnees = b"r" + repr(int(element)).encode("ascii")
+        elif isinstance(element, str):
+            donnees = b"s" + element.encode("utf-8", "surrogatepass")
+        elif isinstance(element, bytes):
+            donnees = b"b" + element
+        else:
+            donnees = b"r" + repr(element).encode("utf-8", "surrogatepass")
+        return int.from_bytes(hashlib.blake2b(donnees, digest_size=8).digest(), "little")
+
+    def _positions(self, element: Hashable) -> list[int]:
+        cle = self._cle(element)
+        decalage = 64 - self._bits
+        return [((a * cle + b) & _MASQUE_64) >> decalage for a, b in self._coefficients]
+
+    def __contains__(self, element: Hashable) -> bool:
+        octets = self.octets
+        return all(octets[position >> 3] >> (position & 7) & 1 for position in self._positions(element))
+
+    def ajouter(self, element: Hashable) -> bool:
+        """Ajoute un élément et indique s'il était (probablement) déjà présent."""
+        octets = self.octets
+        present = True
+        for position in self._positions(element):
+            masque = 1 << (position & 7)
+            if not octets[position >> 3] & masque:
+                present = False
+                octets[position >> 3] |= masque
+        return present
+
+    def _positions_tableau(self, cles: np.ndarray) -> np.ndarray:
+        # Un tableau d'entiers non signés de 64 bits contient déjà des clés (voir _cle)
+        if cles.dtype != np.uint64:
+            cles = np.ascontiguousarray(cles, dtype=np.int64).view(np.uint64)
+        return (self._a[:, np.newaxis] * cles + self._b[:, np.newaxis]) >> np.uint64(64 - self._bits)
+
+    def contient_tableau(self, tableau: np.ndarray) -> np.ndarray:
+        """Indique, pour chaque entier d'un tableau, s'il est (probablement) présent."""
+        positions = self._positions_tableau(tableau)
+        octets = np.frombuffer(self.octets, dtype=np.uint8)
+        bits = (octets[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=0)
+
+    def ajouter_tableau(self, tableau: np.ndarray) -> np.ndarray:
+        """Ajoute les entiers d'un tableau et indique, pour chacun, s'il était (probablement) déjà présent.
+
+        Les entiers sont testés avant d'être tous ajoutés : un entier présent
+        plusieurs fois dans le tableau n'est pas considéré comme déjà présent.
+        """
+        positions = self._positions_tableau(tableau)
+        indices, decalages = positions >> np.uint64(3), (positions & np.uint64(7)).astype(np.uint8)
+        octets = np.frombuffer(self.octets, dtype=np.uint8)
+        presents = ((octets[indices] >> decalages) & 1).all(axis=0)
+        np.bitwise_or.at(octets, indices.ravel(), np.left_shift(1, decalages.ravel(), dtype=np.uint8))
+        return presents
+
+    def fusionner(self, autre: "FiltreBloom") -> None:
+        """Ajoute au filtre les éléments d'un autre filtre de mêmes paramètres."""
+        if (autre.nb_bits, autre.nb_hachages, autre.graine) != (self.nb_bits, self.nb_hachages, self.graine):
+            raise ValueError("Les filtres doivent avoir le même nombre de bits, de hachages et la même graine.")
+        octets = np.frombuffer(self.octets, dtype=np.uint8)
+        octets |= np.frombuffer(autre.octets, dtype=np.uint8)
+
+
+def unique_flux(
+    elements: Iterable[Hashable], taux_faux_positifs: float | None = None, capacite: int = 10**6
+) -> Iterator:
+    """Renvoie au fil de l'eau les éléments distincts d'une suite, dans l'ordre de leur première apparition.
+
+    Parameters
+    ----------
+    elements : Iterable[Hashable]
+        Éléments, éventuellement fournis par un générateur.
+
+    taux_faux_positifs : float or None
+        Si None, les éléments déjà vus sont conservés dans un ensemble et le
+        résultat est exact. Sinon, ils sont conservés dans un FiltreBloom de
+        taille fixe : un élément nouveau est omis à tort avec une probabilité
+        d'au plus taux_faux_positifs, tant que le nombre d'éléments distincts
+        ne dépasse pas capacite.
+
+    capacite : int
+        Nombre d'éléments distincts attendus, pour le mode approché.
+
+    Yields
+    ------
+    Hashable
+        Éléments distincts.
+
+    Examples
+    --------
+    >>> list(unique_flux(x % 5 for x in range(20)))
+    [0, 1, 2, 3, 4]
+    >>> list(unique_flux(['b', 'a', 'b', 'c'], taux_faux_positifs=1e-6, capacite=100))
+    ['b', 'a', 'c']
+    >>> list(unique_flux([1, 1.0, True, 2], taux_faux_positifs=1e-6, capacite=100))
+    [1, 2]
+    """
+    if taux_faux_positifs is None:
+        vus = set()
+        for element in elements:
+            if element not in vus:
+                vus.add(element)
+                yield element
+    else:
+        # Les éléments sont traités par lots, avec les méthodes vectorisées du filtre
+        filtre = FiltreBloom(capacite, taux_faux_positifs)
+        iterateur = iter(elements)
+        while lot := list(itertools.islice(iterateur, _TAILLE_LOT)):
+            cles = np.fromiter(map(filtre._cle, lot), dtype=np.uint64, count=len(lot))
+            indices = _indices_premiers(cles)
+            for i in indices[~filtre.ajouter_tableau(cles[indices])].tolist():
+                yield lot[i]
+
+
+def unique_blocs(
+    blocs: Iterable[np.ndarray], taux_faux_positifs: float | None = None, capacite: int = 10**6
+) -> Iterator[np.ndarray]:
+    """Renvoie les entiers distincts d'un flux de tableaux, bloc par bloc, dans l'ordre de leur première apparition.
+
+    Les doublons de chaque bloc sont supprimés par unique_tableau, puis les
+    entiers déjà vus dans les blocs précédents sont retirés, pour tout le bloc
+    en une fois.
+
+    Parameters
+    ----------
+    blocs : Iterable[np.ndarray]
+        Tableaux d'entiers.
+
+    taux_faux_positifs : float or None
+        Si None, les entiers déjà vus sont conservés dans un tableau trié et le
+        résultat est exact. Sinon, ils sont conservés dans un FiltreBloom de
+        taille fixe (voir unique_flux).
+
+    capacite : int
+        Nombre d'entiers distincts attendus, pour le mode approché.
+
+    Yields
+    ------
+    np.ndarray
+        Entiers de chaque bloc n'apparaissant pas auparavant.
+
+    Examples
+    --------
+    >>> blocs = [np.array([5, 1, 5]), np.array([2, 1, 7, 2])]
+    >>> [bloc.tolist() for bloc in unique_blocs(blocs)]
+    [[5, 1], [2, 7]]
+    >>> [bloc.tolist() for bloc in unique_blocs(blocs, taux_faux_positifs=1e-6, capacite=100)]
+    [[5, 1], [2, 7]]
+    """
+    filtre = None if taux_faux_positifs is None else FiltreBloom(capacite, taux_faux_positifs)
+    vus = np.zeros(0, dtype=np.int64)
+    for bloc in blocs:
+        bloc = unique_tableau(np.asarray(bloc, dtype=np.int64))
+        if filtre is not None:
+            yield bloc[~filtre.ajouter_tableau(bloc)]
+            continue
+        positions = np.searchsorted(vus, bloc)
+        nouveaux = vus[np.minimum(positions, len(vus) - 1)] != bloc if len(vus) else np.ones(len(bloc), dtype=bool)
+        bloc = bloc[nouveaux]
+        # Le tri stable (timsort) fusionne en temps linéaire les deux parties triées
+        vus = np.concatenate((vus, np.sort(bloc)))
+        vus.sort(kind="stable")
+        yield bloc
@@ -0,0 +1,63 @@
+"""Comparaison des temps de calcul pour la recherche des nombres parfaits.
+
+Trois méthodes sont comparées pour trouver les nombres parfaits inférieurs à N :
+    - l'ancienne version de verifier_nombre_parfait (division par tous les
+      entiers inférieurs à n), appelée pour chaque entier ;
+    - la version actuelle de verifier_nombre_parfait (parcours des diviseurs
+      jusqu'à la racine carrée de n), appelée pour chaque entier ;
+    - la version par lot verifier_nombres_parfaits (crible NumPy).
+
+Les méthodes appelées pour chaque entier devenant vite beaucoup trop lentes
+(complexités respectives en O(N²) et O(N^1.5)), chaque méthode n'est évaluée
+que jusqu'à une taille maximale.
+
+Utilisation (depuis le dossier src) :
+    python -m TP2.Exercice_1.comparaison_nombre_parfait
+"""
+
+import time
+
+from .fonctions import verifier_nombre_parfait, verifier_nombres_parfaits
+
+TAILLES = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+
+def verifier_nombre_parfait_naif(n):
+    """Ancienne version de verifier_nombre_parfait, en O(n)."""
+    dividers = [1]
+    for x in range(2, n):
+        if n % x == 0:
+            dividers.append(x)
+    return sum(dividers) == n
+
+
+def parfaits_naif(n_max):
+    return [n for n in range(2, n_max) if verifier_nombre_parfait_naif(n)]
+
+
+def parfaits_racine(n_max):
+    return [n for n in range(2, n_max) if verifier_nombre_parfait(n)]
+
+
+def parfaits_crible(n_max):
+    nombres = range(1, n_max)
+    return [n for n, parfait in zip(nombres, verifier_nombres_parfaits(nombres)) if parfait]
+
+
+if __name__ == "__main__":
+    methodes = {
+        "ancienne version": (parfaits_naif, 10**4),
+        "racine carrée": (parfaits_racine, 10**5),
+        "crible NumPy": (parfaits_crible, 10**7),
+    }
+
+    for n_max in TAILLES:
+        print(f"N = {n_max:_}")
+        for nom, (methode, taille_max) in methodes.items():
+            if n_max > taille_max:
+                print(f"    {nom:<16} : ignorée (trop lente)")
+                continue
+            debut = time.perf_counter()
+            parfaits = methode(n_max)
+            duree = time.perf_counter() - debut
+            print(f"    {nom:<16} : {duree:8.3f} s  {parfaits}")
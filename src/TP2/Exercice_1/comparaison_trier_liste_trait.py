@@ -0,0 +1,54 @@
+"""Comparaison des débits de tri de fichiers de mots séparés par des traits.
+
+Un fichier de NB_LIGNES lignes aléatoires est généré, puis trié ligne par ligne :
+    - en appelant trier_liste_trait sur chaque ligne ;
+    - avec trier_fichier_trait dans le processus courant ;
+    - avec trier_fichier_trait sur plusieurs processus.
+
+Le débit est affiché en lignes par seconde.
+
+Utilisation (depuis le dossier src) :
+    python -m TP2.Exercice_1.comparaison_trier_liste_trait
+"""
+
+import os
+import pathlib
+import random
+import tempfile
+import time
+
+from .fonctions import trier_fichier_trait, trier_liste_trait
+
+NB_LIGNES = 2_000_000
+MOTS = ["black", "green", "red", "white", "yellow", "paris", "london", "madrid", "berlin", "lisbon", "amsterdam"]
+
+
+def trier_lignes(chemin_entree, chemin_sortie):
+    nb_lignes = 0
+    with open(chemin_entree) as entree, open(chemin_sortie, "w") as sortie:
+        for ligne in entree:
+            sortie.write(trier_liste_trait(ligne.rstrip("\n")) + "\n")
+            nb_lignes += 1
+    return nb_lignes
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as dossier:
+        entree = pathlib.Path(dossier) / "entree.txt"
+        sortie = pathlib.Path(dossier) / "sortie.txt"
+        with open(entree, "w") as fichier:
+            for _ in range(NB_LIGNES):
+                fichier.write("-".join(random.choices(MOTS, k=random.randint(1, 10))) + "\n")
+        print(f"Fichier de {NB_LIGNES:_} lignes ({entree.stat().st_size / 1e6:.1f} Mo)")
+
+        methodes = {
+            "trier_liste_trait par ligne": lambda: trier_lignes(entree, sortie),
+            "trier_fichier_trait, processus courant": lambda: trier_fichier_trait(entree, sortie, nb_processus=1),
+            f"trier_fichier_trait, {os.cpu_count()} processus": lambda: trier_fichier_trait(entree, sortie),
+        }
+        for nom, methode in methodes.items():
+            debut = time.perf_counter()
+            nb_lignes = methode()
+            duree = time.perf_counter() - debut
+            print(f"    {nom:<40} : {nb_lignes / duree:12_.0f} lignes/s")
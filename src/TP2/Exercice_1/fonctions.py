@@ -1,5 +1,22 @@
 """Un module avec des fonctions diverses et variées."""
 
+import concurrent.futures
+import contextlib
+import itertools
+import mmap
+import os
+
+import numpy as np
+
+# Masque de 26 bits où chaque bit correspond à une lettre de l'alphabet
+MASQUE_ALPHABET = (1 << 26) - 1
+
+# Nombre de caractères examinés à la fois par verifier_pangramme
+TAILLE_BLOC_PANGRAMME = 4096
+
+# Nombre de chiffres comparés à la fois par verifier_nombre_palindrome
+TAILLE_BLOC_PALINDROME = 4096
+
 
 def verifier_nombre_parfait(n):
     """"Vérifie si un nombre est parfait.
@@ -19,6 +36,8 @@ def verifier_nombre_parfait(n):
 
     Examples
     --------
+    >>> verifier_nombre_parfait(1)
+    False
     >>> verifier_nombre_parfait(6)
     True
     >>> verifier_nombre_parfait(8)
@@ -34,17 +53,95 @@ def verifier_nombre_parfait(n):
     if not (isinstance(n, int) and n > 0):
         raise ValueError("'n' doit être un entier strictement positif")
 
-    # Cas x = 1
-    dividers = [1]
+    # Les diviseurs vont par paires (x, n // x) avec x <= sqrt(n) : il suffit
+    # donc de parcourir les entiers jusqu'à la racine carrée de n.
+    somme = 1 if n > 1 else 0
+    x = 2
+    while x * x <= n:
+        if n % x == 0:
+            somme += x
+            if x != n // x:
+                somme += n // x
+        x += 1
+
+    return somme == n
+
 
-    # Cas x > 1
-    for x in range(2, n):
-        if n%x == 0:
-            dividers.append(x)
+def _sommes_diviseurs_stricts(n_max):
+    """Calcule la somme des diviseurs stricts de tous les entiers jusqu'à n_max.
+
+    Il s'agit d'un crible : pour chaque entier d <= sqrt(n_max), on ajoute d et
+    m // d à tous les multiples m de d supérieurs ou égaux à d². La complexité
+    est en O(n_max log n_max) et chaque étape est vectorisée avec NumPy.
+
+    Parameters
+    ----------
+    n_max : int
+        Plus grand entier considéré.
+
+    Returns
+    -------
+    np.ndarray
+        Tableau de taille n_max + 1 dont l'élément d'indice n est la somme des
+        diviseurs stricts de n (avec la convention 0 pour n = 0).
+
+    Examples
+    --------
+    >>> _sommes_diviseurs_stricts(12).tolist()
+    [0, 0, 1, 1, 3, 1, 6, 1, 7, 4, 8, 1, 16]
+
+    """
+    sommes = np.zeros(n_max + 1, dtype=np.int64)
+    d = 1
+    while d * d <= n_max:
+        # Multiples m = d * k avec k >= d : on ajoute les diviseurs d et k
+        k = np.arange(d, n_max // d + 1, dtype=np.int64)
+        sommes[d * d :: d] += d + k
+        # Le diviseur d = k de m = d² a été compté deux fois
+        sommes[d * d] -= d
+        d += 1
+
+    # Retire n lui-même, ajouté par la paire (1, n)
+    sommes -= np.arange(n_max + 1, dtype=np.int64)
+    sommes[0] = 0
+    return sommes
+
+
+def verifier_nombres_parfaits(nombres):
+    """Vérifie si des nombres sont parfaits, en un seul passage.
+
+    Version par lot de la fonction verifier_nombre_parfait : les sommes des
+    diviseurs stricts de tous les entiers jusqu'au plus grand nombre sont
+    calculées en une fois avec un crible, puis lues pour chaque nombre.
+
+    Parameters
+    ----------
+    nombres : range or array_like of int
+        Les entiers à vérifier, tous strictement positifs.
+
+    Returns
+    -------
+    np.ndarray
+        Tableau de booléens, vrai pour les nombres parfaits.
 
-    return sum(dividers) == n
+    Examples
+    --------
+    >>> verifier_nombres_parfaits([6, 8, 28, 496])
+    array([ True, False,  True,  True])
+    >>> bool(verifier_nombres_parfaits(range(29, 496)).any())
+    False
+    >>> np.flatnonzero(verifier_nombres_parfaits(range(1, 10_000))) + 1
+    array([   6,   28,  496, 8128])
 
+    """
+    nombres = np.asarray(nombres)
+    if nombres.size == 0:
+        return np.zeros(nombres.shape, dtype=bool)
+    if not np.issubdtype(nombres.dtype, np.integer) or nombres.min() <= 0:
+        raise ValueError("'nombres' doit contenir des entiers strictement positifs")
 
+    sommes = _sommes_diviseurs_stricts(int(nombres.max()))
+    return sommes[nombres] == nombres
 
 
 def verifier_pangramme(text):
@@ -79,15 +176,91 @@ def verifier_pangramme(text):
     >>> verifier_pangramme('abcdef')
     False
     """
-    # Convert all the characters to lower cases
-    text_lower = text.lower()
+    # Le texte est parcouru par blocs : l'ensemble des caractères d'un bloc est
+    # ajouté à un masque de 26 bits (un bit par lettre), et le parcours
+    # s'arrête dès que toutes les lettres ont été vues.
+    masque = 0
+    for debut in range(0, len(text), TAILLE_BLOC_PANGRAMME):
+        for lettre in set(text[debut : debut + TAILLE_BLOC_PANGRAMME].lower()):
+            if "a" <= lettre <= "z":
+                masque |= 1 << (ord(lettre) - 97)
+        if masque == MASQUE_ALPHABET:
+            return True
+    return False
+
+
+def _masques_lettres(documents):
+    """Calcule, pour chaque document, le masque des lettres qu'il contient.
+
+    Les documents sont concaténés dans un unique tableau d'octets, séparés par
+    un saut de ligne, puis le masque de chaque document est obtenu par un « ou »
+    binaire sur ses octets. Seules les lettres ASCII sont prises en compte.
+
+    Parameters
+    ----------
+    documents : list[bytes]
+        Documents encodés.
+
+    Returns
+    -------
+    np.ndarray
+        Masques de 26 bits, un par document.
+
+    """
+    longueurs = np.fromiter(map(len, documents), dtype=np.int64, count=len(documents))
+    debuts = np.zeros(len(documents), dtype=np.int64)
+    np.cumsum(longueurs[:-1] + 1, out=debuts[1:])
+
+    octets = np.frombuffer(b"\n".join(documents) + b"\n", dtype=np.uint8)
+    minuscules = octets | 0x20
+    est_lettre = (minuscules >= 97) & (minuscules <= 122)
+    decalages = np.where(est_lettre, minuscules - 97, 0).astype(np.uint32)
+    bits = np.left_shift(np.uint32(1), decalages) * est_lettre
+    return np.bitwise_or.reduceat(bits, debuts)
+
+
+def verifier_pangrammes(textes, taille_bloc=10_000):
+    """Vérifie, pour chaque texte d'un corpus, s'il s'agit d'un pangramme.
+
+    Les textes sont traités par blocs de taille_bloc textes, chaque bloc étant
+    vérifié en une seule fois avec NumPy : la mémoire utilisée ne dépend pas du
+    nombre total de textes. Seules les lettres ASCII sont prises en compte.
+
+    Parameters
+    ----------
+    textes : iterable of str or bytes, str or os.PathLike
+        Textes à vérifier, ou chemin d'un fichier contenant un texte par ligne.
+        Un fichier déjà ouvert est parcouru ligne par ligne.
+
+    taille_bloc : int
+        Nombre de textes traités à la fois.
+
+    Returns
+    -------
+    np.ndarray
+        Tableau de booléens, vrai pour les pangrammes.
+
+    Examples
+    --------
+    >>> verifier_pangrammes(['The quick brown fox jumps over the lazy dog', 'abcdef', ''])
+    array([ True, False, False])
+    >>> import io
+    >>> fichier = io.StringIO('Portez ce vieux whisky au juge blond qui fume\\nabc\\n')
+    >>> verifier_pangrammes(fichier, taille_bloc=1)
+    array([ True, False])
+
+    """
+    if isinstance(textes, (str, os.PathLike)):
+        with open(textes, "rb") as fichier:
+            return verifier_pangrammes(fichier, taille_bloc)
+
+    resultats = [np.zeros(0, dtype=bool)]
+    iterateur = iter(textes)
+    while bloc := list(itertools.islice(iterateur, taille_bloc)):
+        documents = [t.encode() if isinstance(t, str) else t for t in bloc]
+        resultats.append(_masques_lettres(documents) == MASQUE_ALPHABET)
+    return np.concatenate(resultats)
 
-    # Check, for each letter, if it is present in the lowercase text
-    for n in range(97, 123):
-        letter = chr(n)
-        if not letter in text_lower:
-            return False
-    return(True)
 
 def trier_liste_trait(text):
     """Trie une chaîne de caractères où les mots sont séparés par des traits.
@@ -110,21 +283,138 @@ def trier_liste_trait(text):
     'amsterdam-berlin-lisbon-london-madrid-paris'
 
     """
-    # Meilleure version : words = '-'.join(sorted(text.split('-')))
+    # Les mots triés sont concaténés en une seule fois
+    return "-".join(sorted(text.split("-")))
 
-    # Sépare les mots dans une liste
-    words=text.split('-')
 
-    # Trie la liste
-    words_sorted=sorted(words)
+def _trier_bloc_trait(chemin, debut, fin):
+    """Trie les mots de chaque ligne d'une portion de fichier.
 
-    # Récupère le premier mot
-    res=f'{words_sorted[0]}'
+    Le fichier est projeté en mémoire : seules les positions de début et de fin
+    de la portion sont transmises, et non son contenu.
 
-    # Ajoute un trait d'union et le mot suivant pour les mots restants
-    for word in words_sorted[1:]:
-        res+=f'-{word}'
-    return res
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Chemin du fichier.
+
+    debut, fin : int
+        Positions (en octets) de début et de fin de la portion. La portion doit
+        commencer au début d'une ligne et se terminer à la fin d'une ligne.
+
+    Returns
+    -------
+    bytes
+        Les lignes de la portion, avec leurs mots triés.
+
+    """
+    with open(chemin, "rb") as fichier, mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as tampon:
+        lignes = tampon[debut:fin].split(b"\n")
+    return b"\n".join(b"-".join(sorted(ligne.split(b"-"))) for ligne in lignes)
+
+
+def _decouper_fichier(chemin, taille_bloc):
+    """Découpe un fichier en blocs d'environ taille_bloc octets, se terminant par une fin de ligne.
+
+    Seules les fins de ligne suivant chaque frontière de bloc sont cherchées,
+    dans le fichier projeté en mémoire : le fichier n'est pas lu en entier.
+
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Chemin du fichier.
+
+    taille_bloc : int
+        Taille approximative (en octets) des blocs.
+
+    Returns
+    -------
+    debuts, fins : list[int]
+        Positions (en octets) de début et de fin de chaque bloc. Seul le
+        dernier bloc peut ne pas se terminer par une fin de ligne.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'lignes.txt'
+    >>> _ = chemin.write_text('a\\nbcd\\nef\\ng')
+    >>> _decouper_fichier(chemin, 3)
+    ([0, 6, 9], [6, 9, 10])
+
+    """
+    debuts, fins = [], []
+    with open(chemin, "rb") as fichier:
+        taille = os.fstat(fichier.fileno()).st_size
+        if taille > 0:
+            with mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as tampon:
+                debut = 0
+                while debut < taille:
+                    fin = tampon.find(b"\n", min(debut + taille_bloc, taille) - 1) + 1 or taille
+                    debuts.append(debut)
+                    fins.append(fin)
+                    debut = fin
+    return debuts, fins
+
+
+def trier_fichier_trait(chemin_entree, chemin_sortie, nb_processus=None, taille_bloc=1 << 24):
+    """Trie les mots de chaque ligne d'un fichier où les mots sont séparés par des traits.
+
+    Le fichier d'entrée est projeté en mémoire et découpé en blocs d'environ
+    taille_bloc octets, coupés en fin de ligne. Les blocs sont triés en
+    parallèle par un ensemble de processus, puis écrits dans l'ordre du fichier
+    d'entrée : le résultat ne dépend pas du nombre de processus.
+
+    Les lignes sont triées comme des octets, ce qui donne le même ordre que
+    trier_liste_trait pour un fichier encodé en UTF-8.
+
+    Parameters
+    ----------
+    chemin_entree : str or os.PathLike
+        Fichier contenant une chaîne de mots séparés par des traits par ligne.
+
+    chemin_sortie : str or os.PathLike
+        Fichier dans lequel écrire les lignes triées.
+
+    nb_processus : int or None
+        Nombre de processus. Si None, le nombre de processeurs est utilisé. Si
+        1, le tri est effectué dans le processus courant.
+
+    taille_bloc : int
+        Taille approximative (en octets) des blocs.
+
+    Returns
+    -------
+    int
+        Nombre de lignes triées.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> dossier = pathlib.Path(tempfile.mkdtemp())
+    >>> _ = (dossier / 'entree.txt').write_text('green-red-yellow-black\\nparis-london-berlin\\n')
+    >>> trier_fichier_trait(dossier / 'entree.txt', dossier / 'sortie.txt', nb_processus=1)
+    2
+    >>> print((dossier / 'sortie.txt').read_text(), end='')
+    black-green-red-yellow
+    berlin-london-paris
+
+    """
+    debuts, fins = _decouper_fichier(chemin_entree, taille_bloc)
+    chemins = [chemin_entree] * len(debuts)
+    nb_lignes = 0
+    with open(chemin_sortie, "wb") as sortie, contextlib.ExitStack() as pile:
+        if nb_processus == 1:
+            resultats = map(_trier_bloc_trait, chemins, debuts, fins)
+        else:
+            executeur = pile.enter_context(concurrent.futures.ProcessPoolExecutor(nb_processus))
+            resultats = executeur.map(_trier_bloc_trait, chemins, debuts, fins)
+        # Les résultats sont écrits dans l'ordre des blocs
+        for resultat in resultats:
+            sortie.write(resultat)
+            nb_lignes += resultat.count(b"\n")
+        if fins and not resultat.endswith(b"\n"):
+            nb_lignes += 1
+    return nb_lignes
 
 
 def position(mots, x, n):
@@ -146,6 +436,10 @@ def position(mots, x, n):
     list[str]
         Sous-liste des mots ayant le caractère x à la n-ième position.
 
+    See Also
+    --------
+    index_positions.IndexPositions : Index pour de nombreuses requêtes sur une même liste de mots.
+
     Examples
     --------
     >>> mots = [
@@ -194,6 +488,21 @@ def suites_recurrentes_premier_ordre(u0, v0, fu, fv, n):
     un, vn : float
         Valeurs à l'indice n des suites (u_k)_k et (v_k)_k
 
+    See Also
+    --------
+    suites_recurrentes_lineaires : Calcul en O(log n) lorsque les relations de récurrence sont linéaires.
+
+    Examples
+    --------
+    >>> suites_recurrentes_premier_ordre(1, 0, lambda u, v: u + v, lambda u, v: u, 10)
+    (89, 55)
+
+    Si fu et fv acceptent des tableaux NumPy, plusieurs initialisations peuvent
+    être calculées en même temps :
+
+    >>> suites_recurrentes_premier_ordre(np.array([1, 2]), np.array([0, 1]), lambda u, v: u + v, lambda u, v: u, 10)
+    (array([ 89, 233]), array([ 55, 144]))
+
     """
     # Initialisation
     u, v = u0, v0
@@ -205,6 +514,82 @@ def suites_recurrentes_premier_ordre(u0, v0, fu, fv, n):
     return u, v
 
 
+def _produit_matrices_2x2(a, b):
+    """Calcule le produit de deux matrices 2x2 données sous forme de tuples."""
+    (a00, a01), (a10, a11) = a
+    (b00, b01), (b10, b11) = b
+    return (
+        (a00 * b00 + a01 * b10, a00 * b01 + a01 * b11),
+        (a10 * b00 + a11 * b10, a10 * b01 + a11 * b11),
+    )
+
+
+def suites_recurrentes_lineaires(u0, v0, matrice, n):
+    """Calcule les valeurs de deux suites récurrentes linéaires du premier ordre.
+
+    On considère deux suites récurrentes (u_k)_k et (v_k)_k définies par :
+        - Initialisation : u_0 = u0 et v_0 = v0
+        - Relations de recurrence, avec matrice = ((a, b), (c, d)) :
+            + u_k = a * u_{k-1} + b * v_{k-1}
+            + v_k = c * u_{k-1} + d * v_{k-1}
+
+    Le vecteur (u_n, v_n) est le produit de la puissance n-ième de la matrice
+    par le vecteur (u0, v0). Cette puissance est calculée par exponentiation
+    rapide, soit O(log n) produits de matrices 2x2.
+
+    Si u0 et v0 sont des tableaux NumPy, toutes les initialisations sont
+    calculées en même temps, la puissance de la matrice n'étant calculée
+    qu'une seule fois. Les coefficients de cette puissance doivent alors être
+    représentables dans le type des tableaux.
+
+    Parameters
+    ----------
+    u0, v0 : float or np.ndarray
+        Initialisation des suites
+
+    matrice : tuple
+        Matrice ((a, b), (c, d)) des coefficients des relations de récurrence
+
+    n : int
+        Indice des valeurs des suites à renvoyer
+
+    Returns
+    -------
+    un, vn : float or np.ndarray
+        Valeurs à l'indice n des suites (u_k)_k et (v_k)_k
+
+    Examples
+    --------
+    >>> fibonacci = ((1, 1), (1, 0))
+    >>> suites_recurrentes_lineaires(1, 0, fibonacci, 10)
+    (89, 55)
+    >>> suites_recurrentes_lineaires(1, 0, fibonacci, 1000) == suites_recurrentes_premier_ordre(
+    ...     1, 0, lambda u, v: u + v, lambda u, v: u, 1000
+    ... )
+    True
+    >>> suites_recurrentes_lineaires(np.array([1, 2]), np.array([0, 1]), fibonacci, 10)
+    (array([ 89, 233]), array([ 55, 144]))
+    >>> suites_recurrentes_lineaires(1.0, 1.0, ((0.5, 0.0), (0.0, 2.0)), 3)
+    (0.125, 8.0)
+
+    """
+    if not (isinstance(n, int) and n >= 0):
+        raise ValueError("'n' doit être un entier positif ou nul")
+
+    # Exponentiation rapide : puissance = matrice ** n
+    puissance = ((1, 0), (0, 1))
+    while n > 0:
+        if n % 2 == 1:
+            puissance = _produit_matrices_2x2(puissance, matrice)
+        n //= 2
+        # Le dernier carré, le plus coûteux avec des grands entiers, ne servirait pas
+        if n > 0:
+            matrice = _produit_matrices_2x2(matrice, matrice)
+
+    (a, b), (c, d) = puissance
+    return a * u0 + b * v0, c * u0 + d * v0
+
+
 def verifier_nombre_palindrome(n):
     """Vérifie si un nombre est un palindrome.
 
@@ -228,55 +613,338 @@ def verifier_nombre_palindrome(n):
     True
     >>> verifier_nombre_palindrome(12345678997654321)
     False
+    >>> verifier_nombre_palindrome(10**10_000 + 1)
+    True
+    >>> verifier_nombre_palindrome(10**10_000 + 2)
+    False
     """
 
     if not (isinstance(n, int) and n > 0):
         raise ValueError("'n' doit être un entier strictement positif")
 
-    # Meilleure solution :
-    # n_str = str(n)
-    # return n_str == n_str[::-1]
+    # Les chiffres des deux moitiés de l'écriture décimale sont comparés par
+    # blocs, en partant des extrémités, jusqu'à la première différence.
+    chiffres = _ecriture_decimale(n)
+    longueur = len(chiffres)
+    moitie = longueur // 2
+    for debut in range(0, moitie, TAILLE_BLOC_PALINDROME):
+        fin = min(debut + TAILLE_BLOC_PALINDROME, moitie)
+        if chiffres[debut:fin] != chiffres[longueur - fin : longueur - debut][::-1]:
+            return False
+    return True
+
+
+def _ecriture_decimale(n):
+    """Renvoie l'écriture décimale d'un entier positif, quel que soit son nombre de chiffres.
+
+    La conversion d'un entier en chaîne de caractères est limitée par défaut à
+    4300 chiffres (voir sys.set_int_max_str_digits). Au-delà, l'entier est
+    découpé en deux moitiés converties séparément.
+
+    Examples
+    --------
+    >>> len(_ecriture_decimale(10**10_000))
+    10001
+
+    """
+    try:
+        return str(n)
+    except ValueError:
+        # Environ la moitié du nombre de chiffres, log10(2) valant environ 0,3
+        k = n.bit_length() * 3 // 20
+        haut, bas = divmod(n, 10**k)
+        return _ecriture_decimale(haut) + _ecriture_decimale(bas).zfill(k)
+
+
+def _valeur_decimale(chiffres):
+    """Renvoie l'entier écrit en base 10 par une chaîne de chiffres, quel que soit son nombre de chiffres.
+
+    Fonction réciproque de _ecriture_decimale : au-delà de la limite de
+    conversion, la chaîne est découpée en deux moitiés converties séparément.
+
+    Examples
+    --------
+    >>> _valeur_decimale("1" + "0" * 10_000) == 10**10_000
+    True
+
+    """
+    try:
+        return int(chiffres)
+    except ValueError:
+        if len(chiffres) < 2:
+            raise
+        k = len(chiffres) // 2
+        return _valeur_decimale(chiffres[:-k]) * 10**k + _valeur_decimale(chiffres[-k:])
+
+
+def verifier_nombres_palindromes(nombres):
+    """Vérifie si des nombres sont des palindromes, en une seule fois.
+
+    Version par lot de la fonction verifier_nombre_palindrome pour des tableaux
+    d'entiers NumPy : les chiffres de même rang de tous les nombres sont
+    extraits et comparés en même temps.
+
+    Parameters
+    ----------
+    nombres : array_like of int
+        Nombres à vérifier, tous strictement positifs.
+
+    Returns
+    -------
+    np.ndarray
+        Tableau de booléens, vrai pour les palindromes.
+
+    Examples
+    --------
+    >>> verifier_nombres_palindromes([9, 10, 121, 1221, 1231, 12345678987654321])
+    array([ True, False,  True,  True, False,  True])
+    >>> int(np.count_nonzero(verifier_nombres_palindromes(np.arange(1, 1_000_000))))
+    1998
+
+    """
+    nombres = np.asarray(nombres)
+    if nombres.size == 0:
+        return np.zeros(nombres.shape, dtype=bool)
+    if not np.issubdtype(nombres.dtype, np.integer) or nombres.min() <= 0:
+        raise ValueError("'nombres' doit contenir des entiers strictement positifs")
+
+    nombres = nombres.astype(np.uint64)
+    puissances = np.uint64(10) ** np.arange(20, dtype=np.uint64)
+    nb_chiffres = 1 + (nombres[..., np.newaxis] >= puissances[1:]).sum(axis=-1)
+
+    resultat = np.ones(nombres.shape, dtype=bool)
+    for rang in range(10):
+        a_comparer = rang < nb_chiffres // 2
+        rang_symetrique = np.where(a_comparer, nb_chiffres - 1 - rang, 0)
+        chiffre = nombres // puissances[rang] % np.uint64(10)
+        chiffre_symetrique = nombres // puissances[rang_symetrique] % np.uint64(10)
+        resultat &= ~a_comparer | (chiffre == chiffre_symetrique)
+    return resultat
+
+
+def generer_palindromes(debut, fin):
+    """Génère, dans l'ordre croissant, les palindromes compris entre debut (inclus) et fin (exclu).
 
-    n_copy     = n
-    n_reversed = 0
-    while n != 0:
-        r          = n%10
-        n_reversed = n_reversed*10+r
-        n          = n//10
+    Les palindromes sont construits directement à partir de leur première
+    moitié, sans tester chaque entier de l'intervalle : il y en a environ
+    2 * sqrt(fin).
 
-    return n_reversed == n_copy
+    Parameters
+    ----------
+    debut, fin : int
+        Bornes de l'intervalle.
+
+    Yields
+    ------
+    int
+        Palindrome strictement positif.
+
+    Examples
+    --------
+    >>> list(generer_palindromes(1, 30))
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 22]
+    >>> list(generer_palindromes(990, 1112))
+    [999, 1001, 1111]
+    >>> sum(1 for _ in generer_palindromes(1, 1_000_000))
+    1998
+    >>> palindromes = generer_palindromes(10**9000, 10**9001)
+    >>> [next(palindromes) - 10**9000 for _ in range(2)] == [1, 10**4500 + 1]
+    True
+
+    """
+    debut = max(debut, 1)
+    if debut >= fin:
+        return
+
+    longueur_debut = len(_ecriture_decimale(debut))
+    for longueur in range(longueur_debut, len(_ecriture_decimale(fin - 1)) + 1):
+        taille_moitie = (longueur + 1) // 2
+        # Le palindrome est la première moitié, décalée de k chiffres, suivie
+        # du miroir de ses k premiers chiffres
+        k = longueur - taille_moitie
+        decalage = 10**k
+        premiere_moitie = 10 ** (taille_moitie - 1)
+        if longueur == longueur_debut:
+            # Les palindromes plus petits que debut sont ignorés
+            premiere_moitie = debut // decalage
+        for moitie in range(premiere_moitie, 10**taille_moitie):
+            miroir = _valeur_decimale(_ecriture_decimale(moitie)[:k][::-1]) if k else 0
+            palindrome = moitie * decalage + miroir
+            if palindrome >= fin:
+                return
+            if palindrome >= debut:
+                yield palindrome
 
 
 import datetime
 
 
-def calculer_nombre_jours_restants_anniversaire(date_naissance):
+def _anniversaire(date_naissance, annee):
+    """Renvoie la date d'anniversaire d'une date de naissance pour une année donnée.
+
+    Pour une personne née un 29 février, l'anniversaire a lieu le 1er mars les
+    années non bissextiles.
+
+    """
+    try:
+        return datetime.date(annee, date_naissance.month, date_naissance.day)
+    except ValueError:
+        return datetime.date(annee, 3, 1)
+
+
+def calculer_nombre_jours_restants_anniversaire(date_naissance, date_reference=None):
     """Calcule le nombre de jours restants jusqu'au prochain anniversaire.
 
+    Pour une personne née un 29 février, l'anniversaire a lieu le 1er mars les
+    années non bissextiles.
+
     Parameters
     ----------
     date_naissance : datetime.date
         Date de naissance.
 
+    date_reference : datetime.date or None
+        Date à partir de laquelle le nombre de jours est calculé. Si None, la
+        date d'aujourd'hui est utilisée.
+
     Returns
     -------
     ecart : int
         Nombre de jours jusqu'au prochain anniversaire.
 
-    """
-    #Récupère la date d'aujourd'hui
-    today = date_naissance.today()
+    Examples
+    --------
+    >>> calculer_nombre_jours_restants_anniversaire(datetime.date(1990, 12, 31), datetime.date(2025, 12, 25))
+    6
+    >>> calculer_nombre_jours_restants_anniversaire(datetime.date(1990, 1, 2), datetime.date(2025, 12, 25))
+    8
+    >>> calculer_nombre_jours_restants_anniversaire(datetime.date(2000, 2, 29), datetime.date(2025, 2, 28))
+    1
+    >>> calculer_nombre_jours_restants_anniversaire(datetime.date(2000, 2, 29), datetime.date(2028, 2, 28))
+    1
 
-    #Calcule la date d'anniversaire de cette année
-    next_birthday = datetime.date(today.year, date_naissance.month, date_naissance.day)
+    """
+    # Récupère la date d'aujourd'hui
+    if date_reference is None:
+        date_reference = datetime.date.today()
 
-    #Calcule le nombre de jours entre la date d'anniversaire de cette année
-    res = (next_birthday - today).days
+    # Calcule le nombre de jours jusqu'à l'anniversaire de cette année
+    res = (_anniversaire(date_naissance, date_reference.year) - date_reference).days
 
-    #Si le nombre de jours est négatif
+    # Si le nombre de jours est négatif, le prochain anniversaire est l'année prochaine
     if res < 0:
-        #Le porochain anniversaire est l'année prochaine
-        next_birthday = datetime.date(today.year + 1, date_naissance.month, date_naissance.day)
-        res = (next_birthday - today).days
+        res = (_anniversaire(date_naissance, date_reference.year + 1) - date_reference).days
+
+    return res
+
+
+def calculer_nombres_jours_restants_anniversaire(dates_naissance, date_reference=None):
+    """Calcule le nombre de jours restants jusqu'au prochain anniversaire de plusieurs personnes.
+
+    Version vectorisée de la fonction calculer_nombre_jours_restants_anniversaire :
+    les dates d'anniversaire sont obtenues en ajoutant à l'année de référence le
+    mois et le jour de chaque date de naissance, sans appel Python par date. Un
+    anniversaire un 29 février tombe ainsi le 1er mars les années non
+    bissextiles.
+
+    Parameters
+    ----------
+    dates_naissance : array_like of datetime64
+        Dates de naissance, sous une forme convertible en datetime64[D] (par
+        exemple des chaînes de caractères au format AAAA-MM-JJ).
+
+    date_reference : datetime.date, np.datetime64 or None
+        Date à partir de laquelle le nombre de jours est calculé. Si None, la
+        date d'aujourd'hui est utilisée.
 
-    return(res)
+    Returns
+    -------
+    np.ndarray
+        Nombre de jours jusqu'au prochain anniversaire de chaque personne.
+
+    Examples
+    --------
+    >>> dates = np.array(['1990-12-31', '1990-01-02', '2000-02-29', '1985-12-25'], dtype='datetime64[D]')
+    >>> calculer_nombres_jours_restants_anniversaire(dates, datetime.date(2025, 12, 25))
+    array([  6,   8,  66,   0])
+    >>> calculer_nombres_jours_restants_anniversaire(dates, np.datetime64('2028-02-28'))
+    array([307, 309,   1, 301])
+
+    """
+    if date_reference is None:
+        date_reference = datetime.date.today()
+    reference = np.datetime64(date_reference, "D")
+    dates = np.asarray(dates_naissance, dtype="datetime64[D]")
+
+    # Mois (de 0 à 11) et jour (à partir de 0) de chaque date de naissance
+    debuts_mois = dates.astype("datetime64[M]")
+    mois = debuts_mois.astype(np.int64) % 12
+    jours = (dates - debuts_mois.astype("datetime64[D]")).astype(np.int64)
+
+    # Anniversaires de l'année de référence et de l'année suivante
+    annee = reference.astype("datetime64[Y]")
+    ecarts = []
+    for annee_anniversaire in (annee, annee + 1):
+        anniversaires = (annee_anniversaire.astype("datetime64[M]") + mois).astype("datetime64[D]") + jours
+        ecarts.append((anniversaires - reference).astype(np.int64))
+
+    return np.where(ecarts[0] >= 0, ecarts[0], ecarts[1])
+
+
+def calculer_jours_restants_anniversaire_csv(
+    chemin, colonne, date_reference=None, separateur=",", en_tete=True, taille_bloc=100_000
+):
+    """Calcule le nombre de jours restants jusqu'au prochain anniversaire pour une colonne d'un fichier CSV.
+
+    Le fichier est lu par blocs de taille_bloc lignes, chaque bloc étant traité
+    par la fonction calculer_nombres_jours_restants_anniversaire.
+
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Chemin du fichier CSV.
+
+    colonne : int or str
+        Indice ou nom (si le fichier a une ligne d'en-tête) de la colonne des
+        dates de naissance, au format AAAA-MM-JJ.
+
+    date_reference : datetime.date, np.datetime64 or None
+        Date à partir de laquelle le nombre de jours est calculé. Si None, la
+        date d'aujourd'hui est utilisée.
+
+    separateur : str
+        Séparateur des colonnes.
+
+    en_tete : bool
+        Si vrai, la première ligne du fichier contient les noms des colonnes.
+
+    taille_bloc : int
+        Nombre de lignes lues à la fois.
+
+    Returns
+    -------
+    np.ndarray
+        Nombre de jours jusqu'au prochain anniversaire pour chaque ligne.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'personnes.csv'
+    >>> _ = chemin.write_text('nom,naissance\\nAlice,1990-12-31\\nBob,2000-02-29\\nChloé,1985-12-25\\n')
+    >>> calculer_jours_restants_anniversaire_csv(chemin, 'naissance', datetime.date(2025, 12, 25), taille_bloc=2)
+    array([ 6, 66,  0])
+
+    """
+    if date_reference is None:
+        date_reference = datetime.date.today()
+
+    resultats = [np.zeros(0, dtype=np.int64)]
+    with open(chemin, newline="") as fichier:
+        if en_tete:
+            noms_colonnes = fichier.readline().rstrip("\r\n").split(separateur)
+            if isinstance(colonne, str):
+                colonne = noms_colonnes.index(colonne)
+        while lignes := list(itertools.islice(fichier, taille_bloc)):
+            dates = np.loadtxt(lignes, dtype="datetime64[D]", delimiter=separateur, usecols=colonne, ndmin=1)
+            resultats.append(calculer_nombres_jours_restants_anniversaire(dates, date_reference))
+    return np.concatenate(resultats)
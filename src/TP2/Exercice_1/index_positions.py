@@ -0,0 +1,176 @@
+"""Index des mots selon les caractères qu'ils contiennent à chaque position."""
+
+import os
+import pickle
+from typing import Iterable
+
+
+class IndexPositions:
+    """Index associant à chaque couple (position, caractère) les mots correspondants.
+
+    Cet index permet de répondre à de nombreuses requêtes de la fonction
+    position sur une même liste de mots sans la parcourir à chaque fois : une
+    requête coûte un temps proportionnel au nombre de mots renvoyés.
+
+    Chaque mot ajouté reçoit un identifiant entier. Les mots sont renvoyés dans
+    leur ordre d'ajout.
+
+    Parameters
+    ----------
+    mots : Iterable[str]
+        Mots à ajouter à l'index.
+
+    Examples
+    --------
+    >>> index = IndexPositions(['Coing', 'Kiwi', 'Poire', 'Pomme', 'Prune'])
+    >>> index.rechercher('o', 1)
+    ['Coing', 'Poire', 'Pomme']
+    >>> index.rechercher('a', 42)
+    []
+    >>> index.ajouter('Mangue')
+    5
+    >>> index.supprimer(2)
+    >>> index.rechercher('o', 1)
+    ['Coing', 'Pomme']
+    >>> index.identifiants('e', 4)
+    [3, 4]
+    >>> len(index)
+    5
+
+    """
+
+    def __init__(self, mots: Iterable[str] = ()) -> None:
+        self._mots: dict[int, str] = {}
+        # Les dictionnaires aux valeurs None servent d'ensembles ordonnés
+        self._index: dict[tuple[int, str], dict[int, None]] = {}
+        self._prochain_id: int = 0
+        for mot in mots:
+            self.ajouter(mot)
+
+    def __len__(self) -> int:
+        return len(self._mots)
+
+    def ajouter(self, mot: str) -> int:
+        """Ajoute un mot à l'index.
+
+        Parameters
+        ----------
+        mot : str
+            Mot à ajouter.
+
+        Returns
+        -------
+        int
+            Identifiant du mot.
+
+        """
+        if not isinstance(mot, str):
+            raise TypeError("Le mot doit être une chaîne de caractères.")
+        id_mot = self._prochain_id
+        self._prochain_id += 1
+        self._mots[id_mot] = mot
+        for n, x in enumerate(mot):
+            self._index.setdefault((n, x), {})[id_mot] = None
+        return id_mot
+
+    def supprimer(self, id_mot: int) -> None:
+        """Supprime un mot de l'index.
+
+        Parameters
+        ----------
+        id_mot : int
+            Identifiant du mot à supprimer.
+
+        """
+        if id_mot not in self._mots:
+            raise KeyError(f"Aucun mot n'a pour identifiant {id_mot!r}.")
+        mot = self._mots.pop(id_mot)
+        for n, x in enumerate(mot):
+            ids = self._index[(n, x)]
+            del ids[id_mot]
+            if not ids:
+                del self._index[(n, x)]
+
+    def identifiants(self, x: str, n: int) -> list[int]:
+        """Renvoie les identifiants des mots ayant le caractère x à la n-ième position.
+
+        Parameters
+        ----------
+        x : str
+            Caractère.
+
+        n : int
+            Position, positive ou nulle.
+
+        Returns
+        -------
+        list[int]
+            Identifiants des mots, dans leur ordre d'ajout.
+
+        """
+        if not (isinstance(x, str) and len(x) == 1):
+            raise ValueError("'x' doit être un unique caractère")
+        if not (isinstance(n, int) and n >= 0):
+            raise ValueError("'n' doit être un entier positif ou nul")
+        return list(self._index.get((n, x), ()))
+
+    def rechercher(self, x: str, n: int) -> list[str]:
+        """Renvoie la liste des mots ayant le caractère x à la n-ième position.
+
+        Parameters
+        ----------
+        x : str
+            Caractère.
+
+        n : int
+            Position, positive ou nulle.
+
+        Returns
+        -------
+        list[str]
+            Mots ayant le caractère x à la n-ième position, dans leur ordre
+            d'ajout.
+
+        """
+        return [self._mots[id_mot] for id_mot in self.identifiants(x, n)]
+
+    def sauvegarder(self, chemin: str | os.PathLike) -> None:
+        """Enregistre l'index dans un fichier.
+
+        Parameters
+        ----------
+        chemin : str or os.PathLike
+            Chemin du fichier.
+
+        """
+        with open(chemin, "wb") as fichier:
+            pickle.dump(self, fichier, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def charger(cls, chemin: str | os.PathLike) -> "IndexPositions":
+        """Charge un index enregistré avec la méthode sauvegarder.
+
+        Parameters
+        ----------
+        chemin : str or os.PathLike
+            Chemin du fichier.
+
+        Returns
+        -------
+        IndexPositions
+            L'index enregistré.
+
+        Examples
+        --------
+        >>> import pathlib, tempfile
+        >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'index.pkl'
+        >>> IndexPositions(['Kaki', 'Kiwi']).sauvegarder(chemin)
+        >>> IndexPositions.charger(chemin).rechercher('K', 0)
+        ['Kaki', 'Kiwi']
+
+        """
+        with open(chemin, "rb") as fichier:
+            index = pickle.load(fichier)
+        if not isinstance(index, cls):
+            raise TypeError(f"Le fichier ne contient pas une instance de {cls.__name__}.")
+        return index
@@ -0,0 +1,53 @@
+"""Comparaison des temps de calcul du produit d'une liste d'entiers.
+
+Pour des listes d'entiers aléatoires de 64 bits de différentes tailles, on
+compare :
+    - le produit de gauche à droite (ancienne version de produit) ;
+    - produit, qui effectue le produit en arbre ;
+    - produit_entiers sur un tableau NumPy ;
+    - produit_entiers sur plusieurs processus.
+
+Utilisation (depuis le dossier src) :
+    python -m TP2.Exercice_2.comparaison_produit
+"""
+
+import os
+import random
+import time
+
+import numpy as np
+
+from .produit import produit, produit_entiers
+
+TAILLES = [10**3, 10**4, 10**5]
+
+
+def produit_gauche_droite(liste: list[int]) -> int:
+    """Ancienne version de produit, de gauche à droite."""
+    res = 1
+    for x in liste:
+        res *= x
+    return res
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    for taille in TAILLES:
+        liste = [random.randrange(1, 2**63) for _ in range(taille)]
+        tableau = np.array(liste, dtype=np.int64)
+        methodes = {
+            "de gauche à droite": lambda: produit_gauche_droite(liste),
+            "produit (en arbre)": lambda: produit(liste),
+            "produit_entiers (NumPy)": lambda: produit_entiers(tableau),
+            f"produit_entiers ({os.cpu_count()} processus)": lambda: produit_entiers(liste, nb_processus=None),
+        }
+
+        print(f"{taille:_} entiers")
+        for nom, methode in methodes.items():
+            if nom == "de gauche à droite" and taille > 10**4:
+                print(f"    {nom:<30} : ignoré (trop lent)")
+                continue
+            debut = time.perf_counter()
+            methode()
+            duree = time.perf_counter() - debut
+            print(f"    {nom:<30} : {duree:8.3f} s")
@@ -1,3 +1,45 @@
+import concurrent.futures
+import os
+from typing import Iterable
+
+import numpy as np
+
+
+def _produit_arbre(facteurs: list[int]) -> int:
+    """Effectue le produit d'une liste d'entiers en arbre.
+
+    Les facteurs sont multipliés deux à deux, puis les résultats sont à nouveau
+    multipliés deux à deux, et ainsi de suite. Les multiplications portent
+    ainsi sur des entiers de tailles comparables, ce qui est bien plus rapide
+    qu'un produit de gauche à droite lorsque le résultat devient très grand.
+
+    Parameters
+    ----------
+    facteurs : list[int]
+        Liste d'entiers.
+
+    Returns
+    -------
+    int
+        Produit des entiers de la liste.
+
+    Examples
+    --------
+    >>> _produit_arbre([1, 2, 3, 4, 5])
+    120
+    >>> _produit_arbre([])
+    1
+    """
+    if not facteurs:
+        return 1
+    while len(facteurs) > 1:
+        produits = [a * b for a, b in zip(facteurs[0::2], facteurs[1::2])]
+        if len(facteurs) % 2 == 1:
+            produits.append(facteurs[-1])
+        facteurs = produits
+    return facteurs[0]
+
+
 def produit(liste: list[int]) -> int:
     """Effectue le produit des entiers d'une liste.
 
@@ -18,11 +60,74 @@ def produit(liste: list[int]) -> int:
     """
     if not isinstance(liste, list):
         raise TypeError("liste doit être une liste")
-    res: int = 1
     for x in liste:
         if not isinstance(x, int):
             raise TypeError(
                 f"Tous les éléments de la liste doivent être des entiers " f"({repr(x)} n'est pas un entier)"
             )
-        res *= x
-    return res
+    if 0 in liste:
+        return 0
+    return _produit_arbre(liste)
+
+
+def produit_entiers(valeurs: Iterable[int] | np.ndarray, nb_processus: int | None = 1) -> int:
+    """Effectue le produit d'entiers, éventuellement très nombreux.
+
+    Contrairement à produit, cette fonction accepte n'importe quel itérable
+    d'entiers ou un tableau NumPy d'entiers, dont le type est vérifié en une
+    seule fois. Le produit est calculé en arbre, sans dépassement de capacité,
+    et vaut 0 dès qu'un des entiers est nul.
+
+    Parameters
+    ----------
+    valeurs : Iterable[int] or np.ndarray
+        Entiers à multiplier.
+
+    nb_processus : int or None
+        Nombre de processus, strictement positif. Si différent de 1, les
+        entiers sont répartis en nb_processus parts dont les produits sont
+        calculés en parallèle. Si None, le nombre de processeurs est utilisé.
+
+    Returns
+    -------
+    int
+        Produit des entiers.
+
+    Examples
+    --------
+    >>> produit_entiers((1, 2, 3))
+    6
+    >>> produit_entiers(x for x in range(1, 6))
+    120
+    >>> produit_entiers(np.array([2**40, 2**40], dtype=np.int64)) == 2**80
+    True
+    """
+    if nb_processus is not None and (isinstance(nb_processus, bool) or not isinstance(nb_processus, int)):
+        raise TypeError(f"nb_processus doit être un entier ou None ({nb_processus!r} n'est pas un entier)")
+    if nb_processus is not None and nb_processus < 1:
+        raise ValueError(f"nb_processus doit être strictement positif ({nb_processus} processus demandés)")
+
+    if isinstance(valeurs, np.ndarray):
+        if not np.issubdtype(valeurs.dtype, np.integer):
+            raise TypeError(f"Le tableau doit contenir des entiers (type {valeurs.dtype})")
+        if not valeurs.all():
+            return 0
+        # Conversion en entiers Python, qui ne dépassent pas
+        facteurs = valeurs.ravel().tolist()
+    else:
+        facteurs = list(valeurs)
+        for x in facteurs:
+            # Les booléens sont des entiers pour Python, mais pas des facteurs valides
+            if isinstance(x, bool) or not isinstance(x, int):
+                raise TypeError(f"Tous les éléments doivent être des entiers ({repr(x)} n'est pas un entier)")
+        if 0 in facteurs:
+            return 0
+
+    if nb_processus == 1:
+        return _produit_arbre(facteurs)
+
+    nb_parts = nb_processus or os.cpu_count() or 1
+    taille = max(1, -(-len(facteurs) // nb_parts))
+    parts = [facteurs[i : i + taille] for i in range(0, len(facteurs), taille)]
+    with concurrent.futures.ProcessPoolExecutor(nb_parts) as executeur:
+        return _produit_arbre(list(executeur.map(_produit_arbre, parts)))
@@ -1,8 +1,10 @@
+import math
 import re
 
+import numpy as np
 import pytest
 
-from .produit import produit
+from .produit import produit, produit_entiers
 
 
 @pytest.mark.parametrize(
@@ -48,3 +50,50 @@ def test_erreur_produit(liste, message_erreur):
 )
 def test_resultat_produit(liste, resultat_attendu):
     assert produit(liste) == resultat_attendu
+
+
+@pytest.mark.parametrize(
+    "valeurs, message_erreur",
+    [
+        ([1, 2.0, 3], "Tous les éléments doivent être des entiers (2.0 n'est pas un entier)"),
+        ((1, 2, "3"), "Tous les éléments doivent être des entiers ('3' n'est pas un entier)"),
+        ([2, True], "Tous les éléments doivent être des entiers (True n'est pas un entier)"),
+        (np.array([1.0, 2.0]), "Le tableau doit contenir des entiers (type float64)"),
+    ],
+)
+def test_erreur_produit_entiers(valeurs, message_erreur):
+    with pytest.raises(TypeError, match=re.escape(message_erreur)):
+        produit_entiers(valeurs)
+
+
+@pytest.mark.parametrize(
+    "valeurs, resultat_attendu",
+    [
+        ([], 1),
+        ((2, 3, 4), 24),
+        ({-3, 6, 5}, -90),
+        (iter([1, -2, 3, -4, 5, -6]), -720),
+        (range(1, 21), math.factorial(20)),
+        (np.array([], dtype=np.int64), 1),
+        (np.array([12, 12], dtype=np.int32), 144),
+        (np.array([0, 2, 4, 7, 12]), 0),
+        (np.full(10, 2**62, dtype=np.int64), 2**620),
+        ([3**k for k in range(1, 60)], 3 ** (59 * 60 // 2)),
+    ],
+)
+def test_resultat_produit_entiers(valeurs, resultat_attendu):
+    assert produit_entiers(valeurs) == resultat_attendu
+
+
+@pytest.mark.parametrize("valeurs", [[], [7], list(range(1, 1000)), list(range(-500, 0))])
+def test_produit_entiers_parallele(valeurs):
+    assert produit_entiers(valeurs, nb_processus=2) == math.prod(valeurs)
+
+
+@pytest.mark.parametrize(
+    "nb_processus, erreur",
+    [(0, ValueError), (-2, ValueError), (True, TypeError), (2.0, TypeError)],
+)
+def test_erreur_produit_entiers_nb_processus(nb_processus, erreur):
+    with pytest.raises(erreur, match="nb_processus"):
+        produit_entiers([2, 3], nb_processus=nb_processus)
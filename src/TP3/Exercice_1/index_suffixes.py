@@ -0,0 +1,167 @@
+"""Index des suffixes d'une liste, pour rechercher rapidement des sous-listes."""
+
+from typing import Hashable, Sequence
+
+import numpy as np
+
+
+def _table_suffixes(codes: np.ndarray) -> np.ndarray:
+    """Calcule la table des suffixes d'une liste d'entiers positifs ou nuls, inférieurs à sa longueur.
+
+    La table est construite par doublement de préfixes : à l'étape k, les
+    suffixes sont triés selon leurs 2**k premiers éléments, en triant les
+    couples (rang du suffixe i, rang du suffixe i + 2**(k-1)) obtenus à l'étape
+    précédente. Chaque couple étant codé par un unique entier, chaque étape
+    se résume à un tri de n entiers, soit O(n log² n) au total.
+
+    Examples
+    --------
+    >>> _table_suffixes(np.array([0, 1, 2, 0, 1, 0]))  # a, b, r, a, b, a
+    array([5, 3, 0, 4, 1, 2])
+    """
+    n = len(codes)
+    rangs = codes.astype(np.int64)
+    table = np.argsort(rangs, kind="stable")
+    decalage = 1
+    while decalage < n:
+        suivants = np.zeros(n, dtype=np.int64)
+        suivants[: n - decalage] = rangs[decalage:] + 1
+        cles = rangs * (n + 1) + suivants
+        table = np.argsort(cles, kind="stable")
+        cles_triees = cles[table]
+        rangs = np.empty(n, dtype=np.int64)
+        rangs[table] = np.cumsum(np.concatenate(([0], cles_triees[1:] != cles_triees[:-1])))
+        if rangs[table[-1]] == n - 1:
+            # Tous les suffixes sont distincts : ils sont entièrement triés
+            break
+        decalage *= 2
+    return table
+
+
+class IndexSuffixes:
+    """Index d'une liste permettant de rechercher toutes les occurrences d'une sous-liste.
+
+    L'index repose sur la table des suffixes de la liste : les positions de
+    ses suffixes, dans l'ordre lexicographique. Les suffixes commençant par
+    un motif y sont consécutifs, et sont trouvés par deux recherches
+    dichotomiques. Une fois l'index construit, en O(n log² n), chaque
+    recherche coûte O(m log n) plus le nombre d'occurrences, quelle que soit
+    la longueur de la liste.
+
+    L'index ne contient que des tableaux NumPy et un dictionnaire : il peut
+    être sérialisé avec pickle, par exemple pour être transmis à d'autres
+    processus.
+
+    Parameters
+    ----------
+    liste : Sequence[Hashable] or np.ndarray
+        Liste indexée. Ses éléments doivent pouvoir être comparés entre eux
+        par égalité.
+
+    Examples
+    --------
+    >>> index = IndexSuffixes("abracadabra")
+    >>> index.occurrences("abra")
+    [0, 7]
+    >>> index.nb_occurrences("a")
+    5
+    >>> "cad" in index, "bar" in index
+    (True, False)
+    >>> IndexSuffixes([3, 1, 4, 1, 5, 9, 2, 6]).position([1, 5])
+    3
+    """
+
+    def __init__(self, liste: Sequence[Hashable] | np.ndarray) -> None:
+        if isinstance(liste, np.ndarray):
+            valeurs, codes = np.unique(liste, return_inverse=True)
+            self._alphabet = {valeur: code for code, valeur in enumerate(valeurs.tolist())}
+        else:
+            self._alphabet = {}
+            codes = np.fromiter(
+                (self._alphabet.setdefault(element, len(self._alphabet)) for element in liste),
+                dtype=np.int64,
+                count=len(liste),
+            )
+        self._codes = codes.astype(np.int64).reshape(-1)
+        self._table = _table_suffixes(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def _coder(self, motif: Sequence[Hashable]) -> np.ndarray | None:
+        """Remplace les éléments du motif par leurs codes, ou renvoie None si l'un d'eux n'apparaît pas."""
+        if isinstance(motif, np.ndarray):
+            motif = motif.tolist()
+        codes = [self._alphabet.get(element) for element in motif]
+        if None in codes:
+            return None
+        return np.array(codes, dtype=np.int64)
+
+    def _comparer(self, debut: int, motif: np.ndarray) -> int:
+        """Compare le suffixe commençant à la position debut au motif, sur la longueur du motif.
+
+        Renvoie -1, 0 ou 1 selon que le suffixe est avant le motif, commence
+        par le motif ou est après le motif dans l'ordre lexicographique.
+        """
+        segment = self._codes[debut : debut + len(motif)]
+        differences = np.flatnonzero(segment != motif[: len(segment)])
+        if len(differences):
+            k = differences[0]
+            return -1 if segment[k] < motif[k] else 1
+        return -1 if len(segment) < len(motif) else 0
+
+    def _intervalle(self, motif: Sequence[Hashable]) -> tuple[int, int]:
+        """Renvoie l'intervalle de la table des suffixes contenant les suffixes qui commencent par le motif."""
+        codes = self._coder(motif)
+        if codes is None:
+            return 0, 0
+        bas, haut = 0, len(self)
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            if self._comparer(self._table[milieu], codes) < 0:
+                bas = milieu + 1
+            else:
+                haut = milieu
+        debut, haut = bas, len(self)
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            if self._comparer(self._table[milieu], codes) <= 0:
+                bas = milieu + 1
+            else:
+                haut = milieu
+        return debut, bas
+
+    def nb_occurrences(self, motif: Sequence[Hashable]) -> int:
+        """Renvoie le nombre d'occurrences d'un motif, sans les énumérer."""
+        if len(motif) == 0:
+            return len(self) + 1
+        debut, fin = self._intervalle(motif)
+        return fin - debut
+
+    def occurrences(self, motif: Sequence[Hashable]) -> list[int]:
+        """Renvoie les positions de toutes les occurrences d'un motif, dans l'ordre croissant.
+
+        Parameters
+        ----------
+        motif : Sequence[Hashable]
+            Sous-liste recherchée.
+
+        Returns
+        -------
+        list[int]
+            Position du début de chaque occurrence.
+        """
+        if len(motif) == 0:
+            return list(range(len(self) + 1))
+        debut, fin = self._intervalle(motif)
+        return np.sort(self._table[debut:fin]).tolist()
+
+    def position(self, motif: Sequence[Hashable]) -> int:
+        """Renvoie la position de la première occurrence d'un motif, ou -1 s'il n'apparaît pas."""
+        if len(motif) == 0:
+            return 0
+        debut, fin = self._intervalle(motif)
+        return int(self._table[debut:fin].min()) if fin > debut else -1
+
+    def __contains__(self, motif: Sequence[Hashable]) -> bool:
+        return self.nb_occurrences(motif) > 0
@@ -0,0 +1,39 @@
+"""Position d'une sous-liste dans une liste."""
+
+from typing import Hashable, Iterable, Sequence
+
+from .sous_liste import occurrences
+
+
+def position(liste: Iterable[Hashable], motif: Sequence[Hashable]) -> int:
+    """Renvoie la position de la première occurrence d'un motif dans une liste.
+
+    La recherche s'arrête dès la première occurrence trouvée, en O(n + m)
+    (algorithme de Knuth, Morris et Pratt).
+
+    Parameters
+    ----------
+    liste : Iterable[Hashable]
+        Liste dans laquelle le motif est recherché.
+
+    motif : Sequence[Hashable]
+        Sous-liste recherchée.
+
+    Returns
+    -------
+    int
+        Position du début de la première occurrence, ou -1 si le motif
+        n'apparaît pas dans la liste.
+
+    See Also
+    --------
+    IndexSuffixes.position : même recherche à l'aide d'un index.
+
+    Examples
+    --------
+    >>> position([5, 1, 2, 1, 2], [1, 2])
+    1
+    >>> position([5, 1, 2, 1, 2], [2, 5])
+    -1
+    """
+    return next(occurrences(liste, motif), -1)
@@ -0,0 +1,104 @@
+"""Recherche d'une sous-liste contiguë dans une liste."""
+
+from typing import Hashable, Iterable, Iterator, Sequence
+
+
+def _bords(motif: Sequence[Hashable]) -> list[int]:
+    """Calcule, pour chaque préfixe du motif, la longueur de son plus long bord.
+
+    Un bord d'une liste est une sous-liste qui en est à la fois un préfixe et
+    un suffixe, sans être la liste entière.
+
+    Examples
+    --------
+    >>> _bords([1, 2, 1, 2, 3, 1])
+    [0, 0, 1, 2, 0, 1]
+    """
+    bords = [0] * len(motif)
+    longueur = 0
+    for i in range(1, len(motif)):
+        while longueur and motif[i] != motif[longueur]:
+            longueur = bords[longueur - 1]
+        if motif[i] == motif[longueur]:
+            longueur += 1
+        bords[i] = longueur
+    return bords
+
+
+def occurrences(liste: Iterable[Hashable], motif: Sequence[Hashable]) -> Iterator[int]:
+    """Renvoie les positions de toutes les occurrences d'un motif dans une liste.
+
+    Il s'agit de l'algorithme de Knuth, Morris et Pratt : après un
+    prétraitement du motif en O(m), la liste est parcourue une seule fois, en
+    O(n), sans jamais revenir en arrière. La liste peut donc être un itérateur,
+    par exemple sur un fichier.
+
+    Parameters
+    ----------
+    liste : Iterable[Hashable]
+        Liste dans laquelle le motif est recherché.
+
+    motif : Sequence[Hashable]
+        Sous-liste recherchée.
+
+    Yields
+    ------
+    int
+        Position du début de chaque occurrence, éventuellement chevauchant la
+        précédente.
+
+    Examples
+    --------
+    >>> list(occurrences([1, 2, 1, 2, 1, 3], [1, 2, 1]))
+    [0, 2]
+    >>> list(occurrences("abracadabra", "abra"))
+    [0, 7]
+    """
+    if not motif:
+        # Le motif vide apparaît à chaque position, y compris à la fin
+        i = -1
+        for i, _ in enumerate(liste):
+            yield i
+        yield i + 1
+        return
+    bords = _bords(motif)
+    longueur = 0
+    for i, element in enumerate(liste):
+        while longueur and element != motif[longueur]:
+            longueur = bords[longueur - 1]
+        if element == motif[longueur]:
+            longueur += 1
+        if longueur == len(motif):
+            yield i - longueur + 1
+            longueur = bords[longueur - 1]
+
+
+def sous_liste(liste: Iterable[Hashable], motif: Sequence[Hashable]) -> bool:
+    """Indique si une liste apparaît de façon contiguë dans une autre.
+
+    Parameters
+    ----------
+    liste : Iterable[Hashable]
+        Liste dans laquelle le motif est recherché.
+
+    motif : Sequence[Hashable]
+        Sous-liste recherchée.
+
+    Returns
+    -------
+    bool
+        Vrai si les éléments du motif apparaissent consécutivement dans la
+        liste.
+
+    See Also
+    --------
+    IndexSuffixes : index pour de nombreuses recherches dans une même liste.
+
+    Examples
+    --------
+    >>> sous_liste([1, 2, 3, 4], [2, 3])
+    True
+    >>> sous_liste([1, 2, 3, 4], [2, 4])
+    False
+    """
+    return next(occurrences(liste, motif), None) is not None
@@ -0,0 +1,59 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from .index_suffixes import IndexSuffixes, _table_suffixes
+from .sous_liste import occurrences
+
+
+@pytest.mark.parametrize("liste", ["", "a", "banana", "mississippi", "aaaaaaaa", "abcabcabcab"])
+def test_table_suffixes(liste):
+    """Tests pour la table des suffixes, comparée au tri naïf des suffixes."""
+    codes = IndexSuffixes(liste)._codes.tolist()
+    assert _table_suffixes(np.array(codes)).tolist() == sorted(range(len(codes)), key=lambda i: codes[i:])
+    tableau = np.array([ord(caractere) - ord("a") for caractere in liste], dtype=np.int64)
+    assert IndexSuffixes(tableau)._table.tolist() == sorted(range(len(liste)), key=lambda i: liste[i:])
+
+
+@pytest.mark.parametrize("liste", ["mississippi", "aaaaaaaa", [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]])
+def test_occurrences(liste):
+    """Tests pour la recherche de tous les motifs de la liste, comparée à l'algorithme KMP."""
+    index = IndexSuffixes(liste)
+    for debut in range(len(liste)):
+        for fin in range(debut + 1, len(liste) + 1):
+            motif = liste[debut:fin]
+            attendu = list(occurrences(liste, motif))
+            assert index.occurrences(motif) == attendu
+            assert index.nb_occurrences(motif) == len(attendu)
+            assert index.position(motif) == attendu[0]
+            assert motif in index
+
+
+def test_motifs_absents():
+    """Tests pour les motifs absents ou vides."""
+    index = IndexSuffixes("mississippi")
+    for motif in ["x", "sx", "ippix", "mississippii", "pm"]:
+        assert index.occurrences(motif) == []
+        assert index.position(motif) == -1
+        assert motif not in index
+    assert index.occurrences("") == list(range(12))
+    assert index.position("") == 0
+
+
+def test_index_numpy():
+    """Tests pour un index construit à partir d'un grand tableau NumPy."""
+    tableau = np.random.default_rng(0).integers(0, 4, 100_000)
+    index = IndexSuffixes(tableau)
+    motif = tableau[5_000:5_012]
+    assert index.occurrences(motif) == list(occurrences(tableau.tolist(), motif.tolist()))
+    assert 5_000 in index.occurrences(motif)
+    assert np.all(np.diff(_table_suffixes(np.array([0, 0, 0]))) < 0)
+
+
+def test_index_pickle():
+    """Tests pour la sérialisation de l'index."""
+    index = IndexSuffixes(["Kiwi", "Pomme", "Kiwi", "Pomme", "Poire"])
+    copie = pickle.loads(pickle.dumps(index))
+    assert copie.occurrences(["Kiwi", "Pomme"]) == [0, 2]
+    assert len(copie) == 5
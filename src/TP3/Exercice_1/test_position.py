@@ -0,0 +1,19 @@
+import pytest
+
+from .position import position
+
+
+@pytest.mark.parametrize(
+    "liste, motif, resultat_attendu",
+    [
+        ([], [], 0),
+        ([], [1], -1),
+        ([5, 1, 2, 1, 2], [1, 2], 1),
+        ([5, 1, 2, 1, 2], [2, 5], -1),
+        ([5, 1, 2, 1, 2], [5, 1, 2, 1, 2], 0),
+        ("mississippi", "issip", 4),
+        (["Kiwi", "Pomme", "Kiwi"], ["Kiwi"], 0),
+    ],
+)
+def test_position(liste, motif, resultat_attendu):
+    assert position(liste, motif) == resultat_attendu
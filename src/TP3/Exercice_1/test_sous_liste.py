@@ -0,0 +1,36 @@
+import pytest
+
+from .sous_liste import occurrences, sous_liste
+
+
+@pytest.mark.parametrize(
+    "liste, motif, resultat_attendu",
+    [
+        ([], [], True),
+        ([1, 2], [], True),
+        ([], [1], False),
+        ([1, 2], [1, 2], True),
+        ([1, 2, 3, 4], [2, 3], True),
+        ([1, 2, 3, 4], [2, 4], False),
+        ([1, 2], [1, 2, 3], False),
+        ([1, 1, 1, 2], [1, 1, 2], True),
+        ("aaab", "aab", True),
+        ([1, 2, 1, 2, 1, 3], [1, 2, 1, 3], True),
+    ],
+)
+def test_sous_liste(liste, motif, resultat_attendu):
+    assert sous_liste(liste, motif) == resultat_attendu
+
+
+@pytest.mark.parametrize(
+    "liste, motif, resultat_attendu",
+    [
+        ([1, 2, 3], [], [0, 1, 2, 3]),
+        ("aaaa", "aa", [0, 1, 2]),
+        ("abababab", "abab", [0, 2, 4]),
+        ([0, 1, 0, 0, 1, 0, 1], [0, 1], [0, 3, 5]),
+        (iter([1, 2, 1, 2]), [1, 2], [0, 2]),
+    ],
+)
+def test_occurrences(liste, motif, resultat_attendu):
+    assert list(occurrences(liste, motif)) == resultat_attendu
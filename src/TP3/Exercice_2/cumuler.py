@@ -0,0 +1,39 @@
+"""Cumul des éléments d'une liste."""
+
+from typing import Any, Callable, Iterable
+
+
+def cumuler(liste: Iterable[Any], fonction: Callable[[Any, Any], Any]) -> list[Any]:
+    """Renvoie les cumuls successifs des éléments d'une liste par une fonction à deux arguments.
+
+    Le premier cumul est le premier élément, puis chaque cumul est obtenu en
+    appliquant la fonction au cumul précédent et à l'élément suivant.
+
+    Parameters
+    ----------
+    liste : Iterable[Any]
+        Éléments à cumuler.
+
+    fonction : Callable[[Any, Any], Any]
+        Fonction de deux arguments : le cumul précédent et l'élément suivant.
+
+    Returns
+    -------
+    list[Any]
+        Cumuls successifs, de même longueur que la liste.
+
+    See Also
+    --------
+    Pipeline.cumuler : cumul paresseux, combinable avec d'autres étapes.
+
+    Examples
+    --------
+    >>> cumuler([1, 2, 3, 4], lambda x, y: x + y)
+    [1, 3, 6, 10]
+    >>> cumuler([3, 1, 4, 1, 5], max)
+    [3, 3, 4, 4, 5]
+    """
+    cumuls: list[Any] = []
+    for element in liste:
+        cumuls.append(fonction(cumuls[-1], element) if cumuls else element)
+    return cumuls
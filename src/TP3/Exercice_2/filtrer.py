@@ -0,0 +1,31 @@
+"""Filtrage des éléments d'une liste."""
+
+from typing import Any, Callable, Iterable
+
+
+def filtrer(liste: Iterable[Any], fonction: Callable[[Any], bool]) -> list[Any]:
+    """Renvoie la liste des éléments pour lesquels une fonction renvoie vrai.
+
+    Parameters
+    ----------
+    liste : Iterable[Any]
+        Éléments à filtrer.
+
+    fonction : Callable[[Any], bool]
+        Fonction appliquée à chaque élément.
+
+    Returns
+    -------
+    list[Any]
+        Éléments conservés, dans leur ordre d'origine.
+
+    See Also
+    --------
+    Pipeline.filtrer : filtrage paresseux, combinable avec d'autres étapes.
+
+    Examples
+    --------
+    >>> filtrer([1, 2, 3, 4, 5], lambda x: x % 2 == 1)
+    [1, 3, 5]
+    """
+    return [element for element in liste if fonction(element)]
@@ -0,0 +1,186 @@
+"""Enchaînement paresseux de filtrages, de transformations et de cumuls.
+
+Enchaîner les fonctions filtrer, transformer et cumuler construit une liste
+intermédiaire à chaque étape. Un Pipeline décrit la suite des étapes sans les
+exécuter. Appliqué à un itérable, il renvoie un itérateur qui fait traverser
+toutes les étapes à chaque élément, l'un après l'autre : la mémoire utilisée
+ne dépend pas du nombre d'éléments, ce qui permet de traiter des fichiers
+volumineux ou des flux infinis.
+"""
+
+import itertools
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+
+_FILTRAGE, _TRANSFORMATION, _CUMUL = "filtrer", "transformer", "cumuler"
+
+
+class Pipeline:
+    """Suite d'étapes de filtrage, de transformation et de cumul.
+
+    Chaque méthode d'ajout d'étape renvoie un nouveau pipeline : un pipeline
+    peut ainsi servir de base à plusieurs autres.
+
+    Examples
+    --------
+    >>> carres_impairs = Pipeline().filtrer(lambda x: x % 2 == 1).transformer(lambda x: x**2)
+    >>> sommes = carres_impairs.cumuler(lambda x, y: x + y)
+    >>> list(sommes(range(10)))
+    [1, 10, 35, 84, 165]
+
+    Le pipeline s'applique aussi aux flux infinis :
+
+    >>> import itertools
+    >>> list(itertools.islice(carres_impairs(itertools.count()), 4))
+    [1, 9, 25, 49]
+
+    Si toutes les étapes acceptent des tableaux NumPy, et si les cumuls sont
+    effectués par des ufuncs à deux arguments, le pipeline peut être appliqué
+    à un tableau entier :
+
+    >>> Pipeline().filtrer(lambda x: x % 2 == 1).transformer(np.square).cumuler(np.add).executer_numpy(np.arange(10))
+    array([  1,  10,  35,  84, 165])
+    """
+
+    def __init__(self, etapes: tuple[tuple[str, Callable], ...] = ()) -> None:
+        self._etapes = etapes
+
+    def __repr__(self) -> str:
+        etapes = ", ".join(
+            f"{type_etape}({getattr(fonction, '__name__', fonction)})" for type_etape, fonction in self._etapes
+        )
+        return f"Pipeline([{etapes}])"
+
+    def __len__(self) -> int:
+        return len(self._etapes)
+
+    def _ajouter(self, type_etape: str, fonction: Callable) -> "Pipeline":
+        if not callable(fonction):
+            raise TypeError(f"{fonction!r} n'est pas une fonction.")
+        return type(self)(self._etapes + ((type_etape, fonction),))
+
+    def filtrer(self, fonction: Callable[[Any], bool]) -> "Pipeline":
+        """Ajoute une étape ne conservant que les éléments pour lesquels la fonction renvoie vrai."""
+        return self._ajouter(_FILTRAGE, fonction)
+
+    def transformer(self, fonction: Callable[[Any], Any]) -> "Pipeline":
+        """Ajoute une étape remplaçant chaque élément par son image par la fonction."""
+        return self._ajouter(_TRANSFORMATION, fonction)
+
+    def cumuler(self, fonction: Callable[[Any, Any], Any]) -> "Pipeline":
+        """Ajoute une étape remplaçant chaque élément par le cumul des éléments jusqu'à lui."""
+        return self._ajouter(_CUMUL, fonction)
+
+    def __call__(self, elements: Iterable[Any]) -> Iterator[Any]:
+        """Applique le pipeline à un itérable.
+
+        Les étapes sont enchaînées à l'aide des itérateurs filter, map et
+        itertools.accumulate : aucune liste intermédiaire n'est construite, et
+        chaque élément traverse toutes les étapes avant que le suivant ne
+        soit lu.
+
+        Parameters
+        ----------
+        elements : Iterable[Any]
+            Éléments à traiter, par exemple les lignes d'un fichier.
+
+        Returns
+        -------
+        Iterator[Any]
+            Éléments en sortie de la dernière étape.
+        """
+        iterateur = iter(elements)
+        for type_etape, fonction in self._etapes:
+            if type_etape == _FILTRAGE:
+                iterateur = filter(fonction, iterateur)
+            elif type_etape == _TRANSFORMATION:
+                iterateur = map(fonction, iterateur)
+            else:
+                iterateur = itertools.accumulate(iterateur, fonction)
+        return iterateur
+
+    @property
+    def vectorisable(self) -> bool:
+        """bool : Vrai si chaque étape de cumul est une ufunc NumPy à deux arguments."""
+        return all(
+            isinstance(fonction, np.ufunc) and fonction.nin == 2
+            for type_etape, fonction in self._etapes
+            if type_etape == _CUMUL
+        )
+
+    def _executer_bloc(self, tableau: np.ndarray, cumuls: list[Any]) -> np.ndarray:
+        """Applique les étapes à un tableau, en partant des cumuls du bloc précédent, mis à jour en place."""
+        for k, (type_etape, fonction) in enumerate(self._etapes):
+            if type_etape == _FILTRAGE:
+                tableau = tableau[np.asarray(fonction(tableau), dtype=bool)]
+            elif type_etape == _TRANSFORMATION:
+                tableau = np.asarray(fonction(tableau))
+            elif len(tableau) and isinstance(fonction, np.ufunc):
+                # Étape de cumul : les appelants ont vérifié que c'est une ufunc
+                if cumuls[k] is not None:
+                    tableau = fonction.accumulate(np.concatenate(([cumuls[k]], tableau)))[1:]
+                else:
+                    tableau = fonction.accumulate(tableau)
+                cumuls[k] = tableau[-1]
+        return tableau
+
+    def _verifier_vectorisable(self) -> None:
+        if not self.vectorisable:
+            raise TypeError("Les étapes de cumul doivent être des ufuncs NumPy à deux arguments, comme np.add.")
+
+    def executer_numpy(self, tableau: np.ndarray) -> np.ndarray:
+        """Applique le pipeline à un tableau NumPy à une dimension.
+
+        Chaque étape est appliquée au tableau entier : les fonctions de
+        filtrage et de transformation doivent donc accepter un tableau, et les
+        étapes de cumul être des ufuncs NumPy à deux arguments.
+
+        Parameters
+        ----------
+        tableau : np.ndarray
+            Éléments à traiter.
+
+        Returns
+        -------
+        np.ndarray
+            Éléments en sortie de la dernière étape.
+        """
+        self._verifier_vectorisable()
+        return self._executer_bloc(np.asarray(tableau), [None] * len(self._etapes))
+
+    def executer_par_blocs(
+        self, elements: Iterable[Any], taille_bloc: int = 65_536, dtype: Any = np.float64
+    ) -> Iterator[np.ndarray]:
+        """Applique le pipeline à un itérable, par blocs convertis en tableaux NumPy.
+
+        La mémoire utilisée est proportionnelle à la taille des blocs, et non
+        au nombre d'éléments. Les cumuls sont poursuivis d'un bloc à l'autre.
+
+        Parameters
+        ----------
+        elements : Iterable[Any]
+            Éléments à traiter, éventuellement en nombre infini.
+
+        taille_bloc : int
+            Nombre d'éléments lus à la fois.
+
+        dtype : np.dtype
+            Type des tableaux construits à partir des éléments.
+
+        Yields
+        ------
+        np.ndarray
+            Éléments en sortie de la dernière étape, pour chaque bloc.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline().transformer(np.square).cumuler(np.add)
+        >>> [bloc.tolist() for bloc in pipeline.executer_par_blocs(range(5), taille_bloc=2, dtype=int)]
+        [[0, 1], [5, 14], [30]]
+        """
+        self._verifier_vectorisable()
+        iterateur = iter(elements)
+        cumuls = [None] * len(self._etapes)
+        while len(bloc := np.fromiter(itertools.islice(iterateur, taille_bloc), dtype=dtype)):
+            yield self._executer_bloc(bloc, cumuls)
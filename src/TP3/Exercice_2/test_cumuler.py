@@ -0,0 +1,20 @@
+import operator
+
+import pytest
+
+from .cumuler import cumuler
+
+
+@pytest.mark.parametrize(
+    "liste, fonction, resultat_attendu",
+    [
+        ([], operator.add, []),
+        ([5], operator.add, [5]),
+        ([1, 2, 3, 4], operator.add, [1, 3, 6, 10]),
+        ([1, 2, 3, 4], operator.mul, [1, 2, 6, 24]),
+        ([2, 7, 1, 8, 2], max, [2, 7, 7, 8, 8]),
+        (["a", "b", "c"], operator.add, ["a", "ab", "abc"]),
+    ],
+)
+def test_cumuler(liste, fonction, resultat_attendu):
+    assert cumuler(liste, fonction) == resultat_attendu
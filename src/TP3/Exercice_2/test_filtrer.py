@@ -0,0 +1,17 @@
+import pytest
+
+from .filtrer import filtrer
+
+
+@pytest.mark.parametrize(
+    "liste, fonction, resultat_attendu",
+    [
+        ([], bool, []),
+        ([0, 1, "", "a", None], bool, [1, "a"]),
+        ([1, 2, 3, 4, 5, 6], lambda x: x % 3 == 0, [3, 6]),
+        (range(5), lambda x: x > 10, []),
+        ("Kiwi", str.islower, ["i", "w", "i"]),
+    ],
+)
+def test_filtrer(liste, fonction, resultat_attendu):
+    assert filtrer(liste, fonction) == resultat_attendu
@@ -0,0 +1,75 @@
+import itertools
+import operator
+
+import numpy as np
+import pytest
+
+from .cumuler import cumuler
+from .filtrer import filtrer
+from .pipeline import Pipeline
+from .transformer import transformer
+
+
+def test_pipeline_equivalent_aux_fonctions():
+    """Tests pour l'équivalence entre un pipeline et l'enchaînement des fonctions."""
+    liste = list(range(-20, 20))
+    pipeline = Pipeline().filtrer(lambda x: x % 3 != 0).transformer(abs).cumuler(operator.add).filtrer(lambda x: x > 50)
+    attendu = filtrer(cumuler(transformer(filtrer(liste, lambda x: x % 3 != 0), abs), operator.add), lambda x: x > 50)
+    assert list(pipeline(liste)) == attendu
+    assert list(Pipeline()(liste)) == liste
+    assert len(pipeline) == 4
+
+
+def test_pipeline_paresseux():
+    """Tests pour l'évaluation paresseuse, élément par élément."""
+    lus = []
+
+    def lire(x):
+        lus.append(x)
+        return x
+
+    iterateur = Pipeline().transformer(lire).filtrer(lambda x: x % 2 == 0)(itertools.count())
+    assert lus == []
+    assert next(iterateur) == 0
+    assert next(iterateur) == 2
+    assert lus == [0, 1, 2]
+
+
+def test_pipeline_fichier(tmp_path):
+    """Tests pour l'application d'un pipeline aux lignes d'un fichier."""
+    chemin = tmp_path / "nombres.txt"
+    chemin.write_text("3\n\n-1\n4\n\n1\n")
+    pipeline = Pipeline().transformer(str.strip).filtrer(bool).transformer(int).cumuler(max)
+    with open(chemin) as fichier:
+        assert list(pipeline(fichier)) == [3, 3, 4, 4]
+
+
+def test_pipeline_immuable():
+    """Tests pour l'indépendance des pipelines construits à partir d'une même base."""
+    base = Pipeline().transformer(lambda x: x + 1)
+    doubles = base.transformer(lambda x: 2 * x)
+    assert list(base([1, 2])) == [2, 3]
+    assert list(doubles([1, 2])) == [4, 6]
+
+
+@pytest.mark.parametrize("taille_bloc", [1, 7, 1000])
+def test_pipeline_numpy(taille_bloc):
+    """Tests pour les exécutions vectorisées, comparées à l'exécution élément par élément."""
+    pipeline = Pipeline().filtrer(lambda x: x % 3 != 0).transformer(np.abs).cumuler(np.add).cumuler(np.maximum)
+    tableau = np.random.default_rng(0).integers(-100, 100, 500)
+    attendu = list(pipeline(tableau.tolist()))
+    assert pipeline.executer_numpy(tableau).tolist() == attendu
+    blocs = list(pipeline.executer_par_blocs(iter(tableau.tolist()), taille_bloc=taille_bloc, dtype=np.int64))
+    assert np.concatenate(blocs).tolist() == attendu
+
+
+def test_erreur_pipeline_numpy():
+    """Tests pour les erreurs levées par les exécutions vectorisées."""
+    pipeline = Pipeline().cumuler(operator.add)
+    assert not pipeline.vectorisable
+    with pytest.raises(TypeError, match="ufuncs"):
+        pipeline.executer_numpy(np.arange(3))
+    with pytest.raises(TypeError, match="ufuncs"):
+        next(pipeline.executer_par_blocs(range(3)))
+    with pytest.raises(TypeError):
+        Pipeline().filtrer(42)
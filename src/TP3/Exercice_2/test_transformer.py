@@ -0,0 +1,16 @@
+import pytest
+
+from .transformer import transformer
+
+
+@pytest.mark.parametrize(
+    "liste, fonction, resultat_attendu",
+    [
+        ([], abs, []),
+        ([-1, 2, -3], abs, [1, 2, 3]),
+        (range(4), lambda x: 2 * x + 1, [1, 3, 5, 7]),
+        (["Kiwi", "Pomme"], len, [4, 5]),
+    ],
+)
+def test_transformer(liste, fonction, resultat_attendu):
+    assert transformer(liste, fonction) == resultat_attendu
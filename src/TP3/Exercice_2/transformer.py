@@ -0,0 +1,31 @@
+"""Transformation des éléments d'une liste."""
+
+from typing import Any, Callable, Iterable
+
+
+def transformer(liste: Iterable[Any], fonction: Callable[[Any], Any]) -> list[Any]:
+    """Renvoie la liste des images des éléments par une fonction.
+
+    Parameters
+    ----------
+    liste : Iterable[Any]
+        Éléments à transformer.
+
+    fonction : Callable[[Any], Any]
+        Fonction appliquée à chaque élément.
+
+    Returns
+    -------
+    list[Any]
+        Images des éléments, dans leur ordre d'origine.
+
+    See Also
+    --------
+    Pipeline.transformer : transformation paresseuse, combinable avec d'autres étapes.
+
+    Examples
+    --------
+    >>> transformer([1, 2, 3], lambda x: x**2)
+    [1, 4, 9]
+    """
+    return [fonction(element) for element in liste]
@@ -0,0 +1,97 @@
+"""Comparaison des représentations d'une matrice selon sa densité.
+
+Pour des matrices carrées aléatoires de taille N et de densités allant de 0,1 %
+à 50 %, on compare les temps de calcul de la somme, du produit par un vecteur
+et du produit de deux matrices avec :
+    - un dictionnaire {(i, j): valeur}, les opérations parcourant les
+      coefficients en Python ;
+    - la classe MatriceCreuse ;
+    - un tableau NumPy dense.
+
+Utilisation (depuis le dossier src) :
+    python -m TP3.Exercice_3.comparaison_mat_dict
+"""
+
+import time
+from typing import Callable
+
+import numpy as np
+
+from .mat_dict import MatriceCreuse
+
+N = 300
+DENSITES = [0.001, 0.01, 0.05, 0.1, 0.5]
+# Au-delà de ce nombre de couples de coefficients, le produit de dictionnaires est ignoré
+NB_COUPLES_MAX = 10**8
+
+
+def somme_dict(a: dict, b: dict) -> dict:
+    """Somme de deux matrices représentées par des dictionnaires."""
+    somme = dict(a)
+    for indices, valeur in b.items():
+        somme[indices] = somme.get(indices, 0.0) + valeur
+    return {indices: valeur for indices, valeur in somme.items() if valeur != 0}
+
+
+def produit_vecteur_dict(a: dict, x: list[float]) -> list[float]:
+    """Produit d'une matrice représentée par un dictionnaire par un vecteur."""
+    produit = [0.0] * N
+    for (i, j), valeur in a.items():
+        produit[i] += valeur * x[j]
+    return produit
+
+
+def produit_dict(a: dict, b: dict) -> dict:
+    """Produit de deux matrices représentées par des dictionnaires, parcourant tous les couples de coefficients."""
+    produit: dict = {}
+    for (i, k), valeur_a in a.items():
+        for (k_b, j), valeur_b in b.items():
+            if k == k_b:
+                produit[(i, j)] = produit.get((i, j), 0.0) + valeur_a * valeur_b
+    return produit
+
+
+def mesurer(fonction) -> float:
+    debut = time.perf_counter()
+    fonction()
+    return time.perf_counter() - debut
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(N)
+    for densite in DENSITES:
+        a, b = (np.where(rng.random((N, N)) < densite, rng.standard_normal((N, N)), 0.0) for _ in range(2))
+        creuse_a, creuse_b = MatriceCreuse.depuis_numpy(a), MatriceCreuse.depuis_numpy(b)
+        dict_a, dict_b = creuse_a.vers_dict(), creuse_b.vers_dict()
+        liste_x = x.tolist()
+        methodes: dict[str, dict[str, Callable[[], object]]] = {
+            "somme": {
+                "dictionnaire": lambda: somme_dict(dict_a, dict_b),
+                "MatriceCreuse": lambda: creuse_a + creuse_b,
+                "NumPy dense": lambda: a + b,
+            },
+            "produit par un vecteur": {
+                "dictionnaire": lambda: produit_vecteur_dict(dict_a, liste_x),
+                "MatriceCreuse": lambda: creuse_a @ x,
+                "NumPy dense": lambda: a @ x,
+            },
+            "produit matriciel": {
+                "dictionnaire": lambda: produit_dict(dict_a, dict_b),
+                "MatriceCreuse": lambda: creuse_a @ creuse_b,
+                "NumPy dense": lambda: a @ b,
+            },
+        }
+
+        print(f"Densité {densite:.1%} ({creuse_a.nb_non_nuls:_} coefficients non nuls)")
+        for operation, representations in methodes.items():
+            print(f"    {operation}")
+            for nom, methode in representations.items():
+                if (
+                    operation == "produit matriciel"
+                    and nom == "dictionnaire"
+                    and len(dict_a) * len(dict_b) > NB_COUPLES_MAX
+                ):
+                    print(f"        {nom:<15} : ignoré (trop lent)")
+                    continue
+                print(f"        {nom:<15} : {mesurer(methode):10.6f} s")
@@ -0,0 +1,325 @@
+"""Matrices creuses.
+
+Une matrice creuse peut être représentée par un dictionnaire associant à chaque
+couple (i, j) d'indices la valeur du coefficient correspondant, les
+coefficients nuls étant omis. Cette représentation est économe en mémoire,
+mais les opérations qui parcourent les coefficients un par un en Python sont
+lentes.
+
+La classe MatriceCreuse conserve les coefficients non nuls dans trois tableaux
+NumPy (format COO), triés par ligne puis par colonne. Ce tri permet d'obtenir
+sans copie le format CSR (lignes creuses compressées), et d'effectuer chaque
+opération en un nombre d'étapes proportionnel au nombre de coefficients non
+nuls, entièrement avec NumPy.
+"""
+
+import functools
+from typing import Sequence
+
+import numpy as np
+
+
+def _canoniser(
+    lignes: np.ndarray, colonnes: np.ndarray, valeurs: np.ndarray, forme: tuple[int, int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Trie des coefficients par ligne puis par colonne, somme les doublons et retire les zéros."""
+    codes = lignes * max(forme[1], 1) + colonnes
+    # Tri stable : pour des entiers de 64 bits, NumPy utilise timsort, qui
+    # fusionne en temps linéaire des suites déjà triées, comme celles des
+    # coefficients de deux matrices que l'on additionne.
+    ordre = np.argsort(codes, kind="stable")
+    codes, valeurs = codes[ordre], valeurs[ordre]
+    if len(codes):
+        debuts = np.flatnonzero(np.concatenate(([True], codes[1:] != codes[:-1])))
+        codes, valeurs = codes[debuts], np.add.reduceat(valeurs, debuts)
+        non_nuls = valeurs != 0
+        codes, valeurs = codes[non_nuls], valeurs[non_nuls]
+    lignes, colonnes = np.divmod(codes, max(forme[1], 1))
+    return lignes, colonnes, valeurs
+
+
+class MatriceCreuse:
+    """Matrice creuse de nombres flottants.
+
+    Parameters
+    ----------
+    lignes, colonnes : Sequence[int] or np.ndarray
+        Indices de ligne et de colonne des coefficients. Les coefficients
+        ayant les mêmes indices sont additionnés.
+
+    valeurs : Sequence[float] or np.ndarray
+        Valeurs des coefficients.
+
+    forme : tuple[int, int]
+        Nombre de lignes et nombre de colonnes de la matrice.
+
+    Attributes
+    ----------
+    lignes, colonnes, valeurs : np.ndarray
+        Coefficients non nuls de la matrice (format COO), triés par ligne puis
+        par colonne.
+
+    forme : tuple[int, int]
+        Nombre de lignes et nombre de colonnes de la matrice.
+
+    Examples
+    --------
+    >>> a = MatriceCreuse.depuis_dict({(0, 0): 1.0, (1, 2): 2.0}, forme=(2, 3))
+    >>> a.vers_listes()
+    [[1.0, 0.0, 0.0], [0.0, 0.0, 2.0]]
+    >>> (a @ a.T).vers_dict()
+    {(0, 0): 1.0, (1, 1): 4.0}
+    >>> a @ np.array([1.0, 1.0, 1.0])
+    array([1., 2.])
+    >>> (a - a).nb_non_nuls
+    0
+    """
+
+    def __init__(
+        self,
+        lignes: Sequence[int] | np.ndarray,
+        colonnes: Sequence[int] | np.ndarray,
+        valeurs: Sequence[float] | np.ndarray,
+        forme: tuple[int, int],
+    ) -> None:
+        lignes = np.asarray(lignes, dtype=np.int64)
+        colonnes = np.asarray(colonnes, dtype=np.int64)
+        valeurs = np.asarray(valeurs, dtype=np.float64)
+        if not lignes.shape == colonnes.shape == valeurs.shape or lignes.ndim != 1:
+            raise ValueError("Les indices et les valeurs doivent être trois tableaux de même taille.")
+        nb_lignes, nb_colonnes = forme
+        if nb_lignes < 0 or nb_colonnes < 0:
+            raise ValueError("Les dimensions de la matrice doivent être positives ou nulles.")
+        if len(lignes) and (
+            lignes.min() < 0 or lignes.max() >= nb_lignes or colonnes.min() < 0 or colonnes.max() >= nb_colonnes
+        ):
+            raise IndexError(f"Certains indices sont hors des dimensions de la matrice {forme}.")
+        self.forme = (nb_lignes, nb_colonnes)
+        self.lignes, self.colonnes, self.valeurs = _canoniser(lignes, colonnes, valeurs, self.forme)
+
+    @classmethod
+    def _depuis_canonique(
+        cls, lignes: np.ndarray, colonnes: np.ndarray, valeurs: np.ndarray, forme: tuple[int, int]
+    ) -> "MatriceCreuse":
+        """Construit une matrice à partir de coefficients déjà triés, distincts et non nuls."""
+        matrice = cls.__new__(cls)
+        matrice.forme = forme
+        matrice.lignes, matrice.colonnes, matrice.valeurs = lignes, colonnes, valeurs
+        return matrice
+
+    @classmethod
+    def depuis_dict(cls, dico: dict[tuple[int, int], float], forme: tuple[int, int] | None = None) -> "MatriceCreuse":
+        """Construit une matrice à partir d'un dictionnaire {(i, j): valeur}.
+
+        Parameters
+        ----------
+        dico : dict[tuple[int, int], float]
+            Coefficients de la matrice.
+
+        forme : tuple[int, int] or None
+            Dimensions de la matrice. Si None, ce sont les plus petites
+            dimensions contenant tous les coefficients.
+
+        Returns
+        -------
+        MatriceCreuse
+            La matrice correspondante.
+        """
+        indices = np.array(list(dico), dtype=np.int64).reshape(-1, 2)
+        if forme is None:
+            nb_lignes, nb_colonnes = indices.max(axis=0, initial=-1) + 1
+            forme = (int(nb_lignes), int(nb_colonnes))
+        valeurs = np.fromiter(dico.values(), dtype=np.float64, count=len(dico))
+        return cls(indices[:, 0], indices[:, 1], valeurs, forme)
+
+    @classmethod
+    def depuis_numpy(cls, tableau: np.ndarray) -> "MatriceCreuse":
+        """Construit une matrice à partir d'un tableau NumPy à deux dimensions."""
+        tableau = np.asarray(tableau, dtype=np.float64)
+        if tableau.ndim != 2:
+            raise ValueError("Le tableau doit avoir deux dimensions.")
+        lignes, colonnes = np.nonzero(tableau)
+        return cls._depuis_canonique(lignes, colonnes, tableau[lignes, colonnes], tableau.shape)
+
+    @classmethod
+    def depuis_listes(cls, listes: list[list[float]]) -> "MatriceCreuse":
+        """Construit une matrice à partir de la liste de ses lignes."""
+        return cls.depuis_numpy(np.array(listes, dtype=np.float64).reshape(len(listes), -1))
+
+    def vers_dict(self) -> dict[tuple[int, int], float]:
+        """Renvoie les coefficients non nuls sous la forme d'un dictionnaire {(i, j): valeur}."""
+        return dict(zip(zip(self.lignes.tolist(), self.colonnes.tolist()), self.valeurs.tolist()))
+
+    def vers_numpy(self) -> np.ndarray:
+        """Renvoie la matrice sous la forme d'un tableau NumPy à deux dimensions."""
+        tableau = np.zeros(self.forme)
+        tableau[self.lignes, self.colonnes] = self.valeurs
+        return tableau
+
+    def vers_listes(self) -> list[list[float]]:
+        """Renvoie la liste des lignes de la matrice."""
+        return self.vers_numpy().tolist()
+
+    @property
+    def nb_non_nuls(self) -> int:
+        """int : Nombre de coefficients non nuls."""
+        return len(self.valeurs)
+
+    @property
+    def densite(self) -> float:
+        """float : Proportion de coefficients non nuls."""
+        taille = self.forme[0] * self.forme[1]
+        return self.nb_non_nuls / taille if taille else 0.0
+
+    @property
+    def coo(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """tuple[np.ndarray, np.ndarray, np.ndarray] : Indices de ligne, de colonne et valeurs des coefficients."""
+        return self.lignes, self.colonnes, self.valeurs
+
+    @functools.cached_property
+    def decalages(self) -> np.ndarray:
+        """np.ndarray : Décalages du format CSR, la ligne i occupant les positions decalages[i] à decalages[i + 1]."""
+        decalages = np.zeros(self.forme[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.lignes, minlength=self.forme[0]), out=decalages[1:])
+        return decalages
+
+    @property
+    def csr(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """tuple[np.ndarray, np.ndarray, np.ndarray] : Décalages, indices de colonne et valeurs des coefficients."""
+        return self.decalages, self.colonnes, self.valeurs
+
+    def __getitem__(self, indices: tuple[int, int]) -> float:
+        i, j = indices
+        if not (0 <= i < self.forme[0] and 0 <= j < self.forme[1]):
+            raise IndexError(f"L'indice {indices!r} est hors des dimensions de la matrice {self.forme}.")
+        debut, fin = self.decalages[i], self.decalages[i + 1]
+        k = debut + np.searchsorted(self.colonnes[debut:fin], j)
+        return float(self.valeurs[k]) if k < fin and self.colonnes[k] == j else 0.0
+
+    def __eq__(self, autre: object) -> bool:
+        if not isinstance(autre, MatriceCreuse):
+            return NotImplemented
+        return (
+            self.forme == autre.forme
+            and np.array_equal(self.lignes, autre.lignes)
+            and np.array_equal(self.colonnes, autre.colonnes)
+            and np.array_equal(self.valeurs, autre.valeurs)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"MatriceCreuse(forme={self.forme}, nb_non_nuls={self.nb_non_nuls})"
+
+    def _verifier_forme(self, autre: "MatriceCreuse") -> None:
+        if self.forme != autre.forme:
+            raise ValueError(f"Les dimensions des matrices ne sont pas compatibles : {self.forme} et {autre.forme}.")
+
+    def __add__(self, autre: "MatriceCreuse") -> "MatriceCreuse":
+        if not isinstance(autre, MatriceCreuse):
+            return NotImplemented
+        self._verifier_forme(autre)
+        return type(self)(
+            np.concatenate((self.lignes, autre.lignes)),
+            np.concatenate((self.colonnes, autre.colonnes)),
+            np.concatenate((self.valeurs, autre.valeurs)),
+            self.forme,
+        )
+
+    def __neg__(self) -> "MatriceCreuse":
+        return self._depuis_canonique(self.lignes, self.colonnes, -self.valeurs, self.forme)
+
+    def __sub__(self, autre: "MatriceCreuse") -> "MatriceCreuse":
+        if not isinstance(autre, MatriceCreuse):
+            return NotImplemented
+        return self + (-autre)
+
+    def __mul__(self, scalaire: float) -> "MatriceCreuse":
+        if not isinstance(scalaire, (int, float, np.number)):
+            return NotImplemented
+        if scalaire == 0:
+            return self._depuis_canonique(self.lignes[:0], self.colonnes[:0], self.valeurs[:0], self.forme)
+        return self._depuis_canonique(self.lignes, self.colonnes, self.valeurs * scalaire, self.forme)
+
+    __rmul__ = __mul__
+
+    def transposee(self) -> "MatriceCreuse":
+        """Renvoie la transposée de la matrice.
+
+        Les coefficients étant déjà triés par ligne, un tri stable par colonne
+        suffit pour les trier par colonne puis par ligne.
+        """
+        ordre = np.argsort(self.colonnes, kind="stable")
+        return self._depuis_canonique(
+            self.colonnes[ordre], self.lignes[ordre], self.valeurs[ordre], (self.forme[1], self.forme[0])
+        )
+
+    @property
+    def T(self) -> "MatriceCreuse":
+        """MatriceCreuse : Transposée de la matrice."""
+        return self.transposee()
+
+    def produit_vecteur(self, vecteur: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Renvoie le produit de la matrice par un vecteur ou par une matrice dense.
+
+        Parameters
+        ----------
+        vecteur : Sequence[float] or np.ndarray
+            Vecteur de taille n, ou tableau de forme (n, k), où n est le nombre
+            de colonnes de la matrice.
+
+        Returns
+        -------
+        np.ndarray
+            Vecteur de taille m, ou tableau de forme (m, k), où m est le nombre
+            de lignes de la matrice.
+        """
+        vecteur = np.asarray(vecteur, dtype=np.float64)
+        if vecteur.ndim not in (1, 2) or len(vecteur) != self.forme[1]:
+            raise ValueError(f"Les dimensions ne sont pas compatibles : {self.forme} et {vecteur.shape}.")
+        if vecteur.ndim == 1:
+            return np.bincount(self.lignes, weights=self.valeurs * vecteur[self.colonnes], minlength=self.forme[0])
+        resultat = np.zeros((self.forme[0], vecteur.shape[1]))
+        np.add.at(resultat, self.lignes, self.valeurs[:, np.newaxis] * vecteur[self.colonnes])
+        return resultat
+
+    def produit(self, autre: "MatriceCreuse") -> "MatriceCreuse":
+        """Renvoie le produit de deux matrices creuses.
+
+        Chaque coefficient non nul a[i, k] de la matrice est multiplié par
+        tous les coefficients non nuls de la ligne k de l'autre matrice. Seuls
+        les produits non nuls sont donc calculés, puis ils sont additionnés
+        par couple (i, j).
+
+        Parameters
+        ----------
+        autre : MatriceCreuse
+            Matrice dont le nombre de lignes est égal au nombre de colonnes de
+            la matrice.
+
+        Returns
+        -------
+        MatriceCreuse
+            Produit des deux matrices.
+        """
+        if self.forme[1] != autre.forme[0]:
+            raise ValueError(f"Les dimensions des matrices ne sont pas compatibles : {self.forme} et {autre.forme}.")
+        debuts = autre.decalages[self.colonnes]
+        longueurs = autre.decalages[self.colonnes + 1] - debuts
+        fins = np.cumsum(longueurs)
+        # Position, dans les tableaux de l'autre matrice, de chaque coefficient
+        # à multiplier par le coefficient correspondant de la matrice
+        positions = np.arange(fins[-1] if len(fins) else 0) + np.repeat(debuts - fins + longueurs, longueurs)
+        return type(self)(
+            np.repeat(self.lignes, longueurs),
+            autre.colonnes[positions],
+            np.repeat(self.valeurs, longueurs) * autre.valeurs[positions],
+            (self.forme[0], autre.forme[1]),
+        )
+
+    def __matmul__(self, autre: "MatriceCreuse | np.ndarray") -> "MatriceCreuse | np.ndarray":
+        if isinstance(autre, MatriceCreuse):
+            return self.produit(autre)
+        if isinstance(autre, (np.ndarray, list, tuple)):
+            return self.produit_vecteur(autre)
+        return NotImplemented
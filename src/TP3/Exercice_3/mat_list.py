@@ -0,0 +1,287 @@
+"""Matrices denses.
+
+Une matrice peut être représentée par la liste de ses lignes, chaque ligne
+étant une liste de nombres. Chaque ligne est alors un objet distinct en
+mémoire, et chaque coefficient un objet Python : les calculs sur une telle
+représentation sont lents.
+
+La classe MatriceDense conserve les coefficients dans un unique tampon contigu
+de nombres flottants, ligne par ligne : le coefficient (i, j) se trouve à la
+position i * nb_colonnes + j. Le produit matriciel est effectué par blocs,
+éventuellement répartis sur plusieurs fils d'exécution.
+"""
+
+import concurrent.futures
+import itertools
+import os
+
+import numpy as np
+
+from .mat_dict import MatriceCreuse
+
+
+class MatriceDense:
+    """Matrice dense de nombres flottants.
+
+    Parameters
+    ----------
+    tampon : np.ndarray
+        Tableau NumPy de flottants de 64 bits, à une dimension et contigu,
+        contenant les coefficients ligne par ligne. Il n'est pas copié.
+
+    nb_lignes, nb_colonnes : int
+        Dimensions de la matrice.
+
+    Examples
+    --------
+    >>> a = MatriceDense.depuis_listes([[1, 2], [3, 4]])
+    >>> (a @ a).vers_listes()
+    [[7.0, 10.0], [15.0, 22.0]]
+    >>> a += a
+    >>> a[1, 0]
+    6.0
+    >>> a.T.vers_listes()
+    [[2.0, 6.0], [4.0, 8.0]]
+    """
+
+    def __init__(self, tampon: np.ndarray, nb_lignes: int, nb_colonnes: int) -> None:
+        if tampon.dtype != np.float64 or tampon.ndim != 1 or not tampon.flags.c_contiguous:
+            raise ValueError("Le tampon doit être un tableau contigu à une dimension de flottants de 64 bits.")
+        if len(tampon) != nb_lignes * nb_colonnes:
+            raise ValueError(f"Le tampon contient {len(tampon)} coefficients au lieu de {nb_lignes * nb_colonnes}.")
+        self.tampon = tampon
+        self.forme = (nb_lignes, nb_colonnes)
+
+    @classmethod
+    def zeros(cls, nb_lignes: int, nb_colonnes: int) -> "MatriceDense":
+        """Renvoie une matrice nulle."""
+        return cls(np.zeros(nb_lignes * nb_colonnes), nb_lignes, nb_colonnes)
+
+    @classmethod
+    def depuis_tampon(cls, tampon, nb_lignes: int, nb_colonnes: int) -> "MatriceDense":
+        """Construit une matrice à partir d'un objet exposant un tampon de flottants, sans copie.
+
+        Parameters
+        ----------
+        tampon : array.array, bytearray, memoryview or np.ndarray
+            Coefficients ligne par ligne, sous forme de flottants de 64 bits.
+            Les modifications de la matrice sont répercutées sur le tampon.
+
+        nb_lignes, nb_colonnes : int
+            Dimensions de la matrice.
+
+        Returns
+        -------
+        MatriceDense
+            La matrice correspondante.
+
+        Examples
+        --------
+        >>> from array import array
+        >>> coefficients = array('d', [1, 2, 3, 4, 5, 6])
+        >>> a = MatriceDense.depuis_tampon(coefficients, 2, 3)
+        >>> a *= 2
+        >>> coefficients
+        array('d', [2.0, 4.0, 6.0, 8.0, 10.0, 12.0])
+        """
+        return cls(np.frombuffer(tampon, dtype=np.float64), nb_lignes, nb_colonnes)
+
+    @classmethod
+    def depuis_numpy(cls, tableau: np.ndarray) -> "MatriceDense":
+        """Construit une matrice à partir d'un tableau NumPy à deux dimensions.
+
+        Le tableau n'est copié que s'il n'est pas contigu ou ne contient pas
+        des flottants de 64 bits.
+        """
+        tableau = np.ascontiguousarray(tableau, dtype=np.float64)
+        if tableau.ndim != 2:
+            raise ValueError("Le tableau doit avoir deux dimensions.")
+        return cls(tableau.reshape(-1), *tableau.shape)
+
+    @classmethod
+    def depuis_listes(cls, listes: list[list[float]]) -> "MatriceDense":
+        """Construit une matrice à partir de la liste de ses lignes.
+
+        Les coefficients sont copiés en une seule passe dans le tampon.
+        """
+        nb_lignes = len(listes)
+        nb_colonnes = len(listes[0]) if listes else 0
+        if any(len(ligne) != nb_colonnes for ligne in listes):
+            raise ValueError("Toutes les lignes doivent avoir la même longueur.")
+        tampon = np.fromiter(itertools.chain.from_iterable(listes), dtype=np.float64, count=nb_lignes * nb_colonnes)
+        return cls(tampon, nb_lignes, nb_colonnes)
+
+    @classmethod
+    def depuis_creuse(cls, matrice: MatriceCreuse) -> "MatriceDense":
+        """Construit une matrice dense à partir d'une matrice creuse."""
+        return cls.depuis_numpy(matrice.vers_numpy())
+
+    @property
+    def tableau(self) -> np.ndarray:
+        """np.ndarray : Vue à deux dimensions du tampon, sans copie."""
+        return self.tampon.reshape(self.forme)
+
+    def vers_numpy(self) -> np.ndarray:
+        """Renvoie une copie de la matrice sous la forme d'un tableau NumPy à deux dimensions."""
+        return self.tableau.copy()
+
+    def vers_listes(self) -> list[list[float]]:
+        """Renvoie la liste des lignes de la matrice."""
+        return self.tableau.tolist()
+
+    def vers_creuse(self) -> MatriceCreuse:
+        """Renvoie la matrice sous la forme d'une matrice creuse."""
+        return MatriceCreuse.depuis_numpy(self.tableau)
+
+    def copie(self) -> "MatriceDense":
+        """Renvoie une copie de la matrice."""
+        return type(self)(self.tampon.copy(), *self.forme)
+
+    def __getitem__(self, indices: tuple[int, int]) -> float:
+        return float(self.tableau[indices])
+
+    def __setitem__(self, indices: tuple[int, int], valeur: float) -> None:
+        self.tableau[indices] = valeur
+
+    def __eq__(self, autre: object) -> bool:
+        if not isinstance(autre, MatriceDense):
+            return NotImplemented
+        return self.forme == autre.forme and np.array_equal(self.tampon, autre.tampon)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"MatriceDense(forme={self.forme})"
+
+    def _verifier_forme(self, autre: "MatriceDense") -> None:
+        if self.forme != autre.forme:
+            raise ValueError(f"Les dimensions des matrices ne sont pas compatibles : {self.forme} et {autre.forme}.")
+
+    # Opérations en place : le résultat est écrit directement dans le tampon,
+    # sans tableau intermédiaire.
+
+    def __iadd__(self, autre: "MatriceDense") -> "MatriceDense":
+        if not isinstance(autre, MatriceDense):
+            return NotImplemented
+        self._verifier_forme(autre)
+        np.add(self.tampon, autre.tampon, out=self.tampon)
+        return self
+
+    def __isub__(self, autre: "MatriceDense") -> "MatriceDense":
+        if not isinstance(autre, MatriceDense):
+            return NotImplemented
+        self._verifier_forme(autre)
+        np.subtract(self.tampon, autre.tampon, out=self.tampon)
+        return self
+
+    def __imul__(self, scalaire: float) -> "MatriceDense":
+        if not isinstance(scalaire, (int, float, np.number)):
+            return NotImplemented
+        np.multiply(self.tampon, scalaire, out=self.tampon)
+        return self
+
+    def __add__(self, autre: "MatriceDense") -> "MatriceDense":
+        if not isinstance(autre, MatriceDense):
+            return NotImplemented
+        resultat = self.copie()
+        resultat += autre
+        return resultat
+
+    def __sub__(self, autre: "MatriceDense") -> "MatriceDense":
+        if not isinstance(autre, MatriceDense):
+            return NotImplemented
+        resultat = self.copie()
+        resultat -= autre
+        return resultat
+
+    def __mul__(self, scalaire: float) -> "MatriceDense":
+        if not isinstance(scalaire, (int, float, np.number)):
+            return NotImplemented
+        resultat = self.copie()
+        resultat *= scalaire
+        return resultat
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "MatriceDense":
+        return -1 * self
+
+    def transposee(self) -> "MatriceDense":
+        """Renvoie la transposée de la matrice, dans un nouveau tampon."""
+        return type(self).depuis_numpy(self.tableau.T)
+
+    @property
+    def T(self) -> "MatriceDense":
+        """MatriceDense : Transposée de la matrice."""
+        return self.transposee()
+
+    def produit(self, autre: "MatriceDense", taille_bloc: int = 256, nb_threads: int | None = 1) -> "MatriceDense":
+        """Renvoie le produit de deux matrices, calculé par blocs.
+
+        Le résultat est découpé en blocs de taille_bloc lignes et colonnes.
+        Chaque bloc est la somme de produits de blocs des deux matrices,
+        suffisamment petits pour rester dans le cache du processeur, et est
+        accumulé en place dans le résultat. Les bandes de lignes du résultat
+        sont indépendantes : elles peuvent être calculées par plusieurs fils
+        d'exécution, NumPy libérant le verrou global de l'interpréteur pendant
+        les produits de blocs.
+
+        Parameters
+        ----------
+        autre : MatriceDense
+            Matrice dont le nombre de lignes est égal au nombre de colonnes de
+            la matrice.
+
+        taille_bloc : int
+            Nombre de lignes et de colonnes des blocs.
+
+        nb_threads : int or None
+            Nombre de fils d'exécution. Si None, os.cpu_count() est utilisé.
+            Si 1, le calcul est effectué dans le fil courant.
+
+        Returns
+        -------
+        MatriceDense
+            Produit des deux matrices.
+
+        Examples
+        --------
+        >>> a = MatriceDense.depuis_numpy(np.arange(12).reshape(3, 4))
+        >>> b = MatriceDense.depuis_numpy(np.ones((4, 2)))
+        >>> a.produit(b, taille_bloc=2, nb_threads=2).vers_listes()
+        [[6.0, 6.0], [22.0, 22.0], [38.0, 38.0]]
+        """
+        if self.forme[1] != autre.forme[0]:
+            raise ValueError(f"Les dimensions des matrices ne sont pas compatibles : {self.forme} et {autre.forme}.")
+        if taille_bloc <= 0:
+            raise ValueError("La taille des blocs doit être strictement positive.")
+        (m, n), p = self.forme, autre.forme[1]
+        resultat = type(self).zeros(m, p)
+        a, b, c = self.tableau, autre.tableau, resultat.tableau
+
+        def calculer_bande(i: int) -> None:
+            """Calcule les lignes i à i + taille_bloc du résultat."""
+            tampon = np.empty((taille_bloc, taille_bloc))
+            bande = slice(i, min(i + taille_bloc, m))
+            for j in range(0, p, taille_bloc):
+                colonnes = slice(j, min(j + taille_bloc, p))
+                bloc_c = c[bande, colonnes]
+                produit_bloc = tampon[: bloc_c.shape[0], : bloc_c.shape[1]]
+                for k in range(0, n, taille_bloc):
+                    interieur = slice(k, min(k + taille_bloc, n))
+                    np.matmul(a[bande, interieur], b[interieur, colonnes], out=produit_bloc)
+                    bloc_c += produit_bloc
+
+        bandes = range(0, m, taille_bloc)
+        if nb_threads == 1:
+            for i in bandes:
+                calculer_bande(i)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(nb_threads or os.cpu_count()) as executeur:
+                list(executeur.map(calculer_bande, bandes))
+        return resultat
+
+    def __matmul__(self, autre: "MatriceDense") -> "MatriceDense":
+        if not isinstance(autre, MatriceDense):
+            return NotImplemented
+        return self.produit(autre)
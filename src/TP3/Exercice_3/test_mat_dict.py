@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from .mat_dict import MatriceCreuse
+
+
+def matrice_aleatoire(forme, densite, graine):
+    """Tableau NumPy aléatoire dont une proportion densite des coefficients est non nulle."""
+    rng = np.random.default_rng(graine)
+    return np.where(rng.random(forme) < densite, rng.standard_normal(forme), 0.0)
+
+
+@pytest.fixture
+def a():
+    return np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [0.0, -3.0, 0.0]])
+
+
+def test_construction():
+    """Tests pour la construction d'une matrice creuse."""
+    matrice = MatriceCreuse([2, 0, 0, 1, 2], [1, 2, 0, 1, 1], [1.0, 2.0, 3.0, 0.0, 4.0], forme=(3, 4))
+    assert matrice.lignes.tolist() == [0, 0, 2]
+    assert matrice.colonnes.tolist() == [0, 2, 1]
+    assert matrice.valeurs.tolist() == [3.0, 2.0, 5.0]
+    assert matrice.decalages.tolist() == [0, 2, 2, 3]
+    assert matrice.nb_non_nuls == 3
+    assert matrice.densite == 0.25
+    assert matrice[2, 1] == 5.0
+    assert matrice[1, 1] == 0.0
+
+
+def test_erreur_construction():
+    """Tests pour les erreurs levées lors de la construction d'une matrice creuse."""
+    with pytest.raises(IndexError):
+        MatriceCreuse([0, 3], [0, 0], [1.0, 1.0], forme=(3, 3))
+    with pytest.raises(ValueError):
+        MatriceCreuse([0, 1], [0], [1.0, 1.0], forme=(3, 3))
+    with pytest.raises(IndexError):
+        MatriceCreuse([], [], [], forme=(3, 3))[3, 0]
+
+
+def test_conversions(a):
+    """Tests pour les conversions depuis et vers les autres représentations."""
+    matrice = MatriceCreuse.depuis_numpy(a)
+    np.testing.assert_array_equal(matrice.vers_numpy(), a)
+    assert matrice.vers_listes() == a.tolist()
+    assert MatriceCreuse.depuis_listes(a.tolist()) == matrice
+    assert matrice.vers_dict() == {(0, 0): 1.0, (0, 2): 2.0, (2, 1): -3.0}
+    assert MatriceCreuse.depuis_dict(matrice.vers_dict(), forme=(3, 3)) == matrice
+    assert MatriceCreuse.depuis_dict({}).forme == (0, 0)
+
+
+@pytest.mark.parametrize("densite", [0.0, 0.01, 0.2, 1.0])
+def test_operations(densite):
+    """Tests pour les opérations, comparées à celles de NumPy."""
+    a = matrice_aleatoire((30, 20), densite, 0)
+    b = matrice_aleatoire((30, 20), densite, 1)
+    c = matrice_aleatoire((20, 10), densite, 2)
+    x = np.random.default_rng(3).standard_normal(20)
+    creuse_a, creuse_b, creuse_c = map(MatriceCreuse.depuis_numpy, (a, b, c))
+    np.testing.assert_allclose((creuse_a + creuse_b).vers_numpy(), a + b)
+    np.testing.assert_allclose((creuse_a - creuse_b).vers_numpy(), a - b)
+    np.testing.assert_allclose((2.5 * creuse_a).vers_numpy(), 2.5 * a)
+    np.testing.assert_array_equal(creuse_a.T.vers_numpy(), a.T)
+    np.testing.assert_allclose((creuse_a @ creuse_c).vers_numpy(), a @ c, atol=1e-12)
+    np.testing.assert_allclose(creuse_a @ x, a @ x, atol=1e-12)
+    np.testing.assert_allclose(creuse_a @ c, a @ c, atol=1e-12)
+
+
+def test_coefficients_nuls(a):
+    """Tests pour la suppression des coefficients qui s'annulent."""
+    matrice = MatriceCreuse.depuis_numpy(a)
+    assert (matrice - matrice).nb_non_nuls == 0
+    assert (0 * matrice).nb_non_nuls == 0
+    assert (matrice + MatriceCreuse([0], [0], [-1.0], forme=(3, 3))).nb_non_nuls == 2
+
+
+def test_erreur_dimensions(a):
+    """Tests pour les erreurs levées lorsque les dimensions ne sont pas compatibles."""
+    matrice = MatriceCreuse.depuis_numpy(a)
+    with pytest.raises(ValueError, match="dimensions"):
+        matrice + MatriceCreuse([], [], [], forme=(3, 2))
+    with pytest.raises(ValueError, match="dimensions"):
+        matrice @ MatriceCreuse([], [], [], forme=(2, 3))
+    with pytest.raises(ValueError, match="dimensions"):
+        matrice @ np.ones(2)
@@ -0,0 +1,82 @@
+from array import array
+
+import numpy as np
+import pytest
+
+from .mat_dict import MatriceCreuse
+from .mat_list import MatriceDense
+
+
+def test_conversions():
+    """Tests pour les conversions depuis et vers les autres représentations."""
+    listes = [[1.0, 0.0, 2.0], [0.0, -3.0, 0.0]]
+    matrice = MatriceDense.depuis_listes(listes)
+    assert matrice.forme == (2, 3)
+    assert matrice.vers_listes() == listes
+    np.testing.assert_array_equal(matrice.vers_numpy(), np.array(listes))
+    assert matrice.vers_creuse().vers_dict() == {(0, 0): 1.0, (0, 2): 2.0, (1, 1): -3.0}
+    assert MatriceDense.depuis_creuse(MatriceCreuse.depuis_listes(listes)) == matrice
+    assert MatriceDense.depuis_listes([]).forme == (0, 0)
+
+
+def test_conversions_sans_copie():
+    """Tests pour les conversions qui partagent le tampon des coefficients."""
+    coefficients = array("d", [1.0, 2.0, 3.0, 4.0])
+    matrice = MatriceDense.depuis_tampon(coefficients, 2, 2)
+    matrice[0, 1] = 5.0
+    assert coefficients[1] == 5.0
+
+    tableau = np.arange(6.0).reshape(2, 3)
+    matrice = MatriceDense.depuis_numpy(tableau)
+    assert np.shares_memory(matrice.tampon, tableau)
+    assert np.shares_memory(matrice.tableau, tableau)
+    assert not np.shares_memory(MatriceDense.depuis_numpy(tableau.T).tampon, tableau)
+
+
+def test_erreur_construction():
+    """Tests pour les erreurs levées lors de la construction d'une matrice dense."""
+    with pytest.raises(ValueError):
+        MatriceDense(np.zeros(5), 2, 3)
+    with pytest.raises(ValueError):
+        MatriceDense(np.zeros(6, dtype=np.int64), 2, 3)
+    with pytest.raises(ValueError):
+        MatriceDense.depuis_listes([[1.0, 2.0], [3.0]])
+
+
+def test_operations_en_place():
+    """Tests pour les opérations en place, qui ne changent pas de tampon."""
+    a = MatriceDense.depuis_numpy(np.arange(6.0).reshape(2, 3))
+    b = MatriceDense.depuis_numpy(np.ones((2, 3)))
+    tampon = a.tampon
+    a += b
+    a -= 2 * b
+    a *= 3
+    assert a.tampon is tampon
+    np.testing.assert_array_equal(a.tableau, 3 * (np.arange(6.0).reshape(2, 3) - 1))
+    assert a - a == MatriceDense.zeros(2, 3)
+    with pytest.raises(ValueError, match="dimensions"):
+        a += MatriceDense.zeros(3, 2)
+
+
+@pytest.mark.parametrize("taille_bloc", [1, 3, 16, 256])
+@pytest.mark.parametrize("nb_threads", [1, 4, None])
+@pytest.mark.parametrize("forme", [(17, 23, 9), (1, 40, 1), (0, 3, 2), (5, 0, 4)])
+def test_produit(forme, taille_bloc, nb_threads):
+    """Tests pour le produit par blocs, comparé à celui de NumPy."""
+    m, n, p = forme
+    rng = np.random.default_rng(0)
+    a, b = rng.standard_normal((m, n)), rng.standard_normal((n, p))
+    produit = MatriceDense.depuis_numpy(a).produit(
+        MatriceDense.depuis_numpy(b), taille_bloc=taille_bloc, nb_threads=nb_threads
+    )
+    assert produit.forme == (m, p)
+    np.testing.assert_allclose(produit.tableau, a @ b, atol=1e-12)
+
+
+def test_erreur_produit():
+    """Tests pour les erreurs levées par le produit."""
+    a = MatriceDense.zeros(2, 3)
+    with pytest.raises(ValueError, match="dimensions"):
+        a @ a
+    with pytest.raises(ValueError):
+        a.produit(a.T, taille_bloc=0)
@@ -0,0 +1,355 @@
+"""Chargement de listes d'arcs et format binaire des graphes.
+
+Une liste d'arcs est un fichier texte (CSV, TSV, ...) dont chaque ligne
+contient l'origine et l'extrémité d'un arc. Les colonnes supplémentaires (un
+poids, par exemple) sont ignorées, ainsi que les lignes vides et les lignes
+de commentaire commençant par #. Le fichier est lu par blocs de lignes : il
+n'est jamais chargé entièrement en mémoire.
+
+Un GrapheCSR peut être enregistré dans un fichier binaire, puis ouvert par
+projection en mémoire (mmap) : l'ouverture ne lit que l'en-tête du fichier, et
+les tableaux ne sont lus depuis le disque qu'au moment où ils sont utilisés.
+
+Format du fichier binaire (entiers little-endian) :
+    - un en-tête de 64 octets : la signature b"GRAPHCSR", la version du
+      format, le type des étiquettes, le nombre de sommets n, le nombre
+      d'arcs m et la taille en octets des indices des sommets ;
+    - les tableaux decalages (n + 1 entiers de 8 octets), voisins (m
+      indices), decalages_inverses et voisins_inverses ;
+    - les étiquettes des sommets : rien si ce sont les entiers de 0 à n - 1,
+      n entiers de 8 octets si ce sont des entiers, n + 1 décalages de 8
+      octets suivis du texte encodé en UTF-8 si ce sont des chaînes.
+Chaque tableau commence à une position multiple de 8.
+"""
+
+import itertools
+import mmap
+import os
+import struct
+from typing import Iterator, Sequence, overload
+
+import numpy as np
+
+from .graphe import Graphe
+from .graphe_csr import Etiquettes, GrapheCSR, _type_indices
+
+SIGNATURE = b"GRAPHCSR"
+VERSION = 1
+_EN_TETE = struct.Struct("<8sIIQQI")
+_TAILLE_EN_TETE = 64
+
+# Types des étiquettes des sommets
+_ETIQUETTES_INDICES, _ETIQUETTES_ENTIERS, _ETIQUETTES_TEXTE = 0, 1, 2
+
+
+def _blocs_lignes(chemin: str | os.PathLike, en_tete: bool, taille_bloc: int) -> Iterator[list[str]]:
+    """Lit un fichier texte par blocs de taille_bloc lignes."""
+    with open(chemin, encoding="utf-8") as fichier:
+        if en_tete:
+            fichier.readline()
+        while lignes := list(itertools.islice(fichier, taille_bloc)):
+            yield lignes
+
+
+def lire_arcs(
+    chemin: str | os.PathLike,
+    separateur: str | None = None,
+    en_tete: bool = False,
+    taille_bloc: int = 100_000,
+) -> Iterator[list[tuple[str, str]]]:
+    """Lit une liste d'arcs par blocs.
+
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Chemin du fichier.
+
+    separateur : str or None
+        Séparateur des colonnes. Si None, les colonnes sont séparées par des
+        espaces ou des tabulations.
+
+    en_tete : bool
+        Si vrai, la première ligne du fichier contient les noms des colonnes.
+
+    taille_bloc : int
+        Nombre de lignes lues à la fois.
+
+    Yields
+    ------
+    list[tuple[str, str]]
+        Arcs (origine, extrémité) d'un bloc de lignes.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'arcs.tsv'
+    >>> _ = chemin.write_text('# commentaire\\na\\tb\\nb\\tc\\n\\nc\\ta\\n')
+    >>> list(lire_arcs(chemin, taille_bloc=2))
+    [[('a', 'b')], [('b', 'c')], [('c', 'a')]]
+    """
+    numeros = itertools.count(2 if en_tete else 1)
+    for lignes in _blocs_lignes(chemin, en_tete, taille_bloc):
+        arcs = []
+        for numero, ligne in zip(numeros, lignes):
+            if not ligne.strip() or ligne.startswith("#"):
+                continue
+            colonnes = ligne.rstrip("\r\n").split(separateur)
+            if len(colonnes) < 2:
+                raise ValueError(f"La ligne {numero} ne contient pas d'arc : {ligne.rstrip()!r}.")
+            arcs.append((colonnes[0], colonnes[1]))
+        yield arcs
+
+
+def charger_dict(chemin: str | os.PathLike, **options) -> dict[str, set[str]]:
+    """Charge une liste d'arcs dans un dictionnaire d'ensembles de successeurs.
+
+    Les options sont celles de la fonction lire_arcs.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'arcs.csv'
+    >>> _ = chemin.write_text('origine,extremite\\na,b\\nb,c\\n')
+    >>> charger_dict(chemin, separateur=',', en_tete=True)
+    {'a': {'b'}, 'b': {'c'}, 'c': set()}
+    """
+    graphe: dict[str, set[str]] = {}
+    for arcs in lire_arcs(chemin, **options):
+        for origine, extremite in arcs:
+            graphe.setdefault(origine, set()).add(extremite)
+            graphe.setdefault(extremite, set())
+    return graphe
+
+
+def charger_set(chemin: str | os.PathLike, **options) -> set[tuple[str, str]]:
+    """Charge une liste d'arcs dans un ensemble d'arcs.
+
+    Les options sont celles de la fonction lire_arcs.
+    """
+    graphe: set[tuple[str, str]] = set()
+    for arcs in lire_arcs(chemin, **options):
+        graphe.update(arcs)
+    return graphe
+
+
+def charger_graphe(chemin: str | os.PathLike, **options) -> Graphe:
+    """Charge une liste d'arcs dans une instance de Graphe.
+
+    Les options sont celles de la fonction lire_arcs.
+    """
+    graphe = Graphe()
+    for arcs in lire_arcs(chemin, **options):
+        for origine, extremite in arcs:
+            graphe.ajouter_arc(origine, extremite)
+    return graphe
+
+
+def charger_csr(
+    chemin: str | os.PathLike,
+    separateur: str | None = None,
+    en_tete: bool = False,
+    taille_bloc: int = 100_000,
+    entiers: bool = False,
+) -> GrapheCSR:
+    """Charge une liste d'arcs dans un GrapheCSR.
+
+    Seuls les indices des sommets de chaque arc sont conservés pendant la
+    lecture, dans des tableaux NumPy, et non les arcs eux-mêmes.
+
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Chemin du fichier.
+
+    separateur, en_tete, taille_bloc
+        Voir la fonction lire_arcs.
+
+    entiers : bool
+        Si vrai, les sommets sont des entiers. Chaque bloc de lignes est alors
+        converti directement par np.loadtxt, et les étiquettes du graphe sont
+        un tableau d'entiers triés.
+
+    Returns
+    -------
+    GrapheCSR
+        Le graphe correspondant.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'arcs.txt'
+    >>> _ = chemin.write_text('10 20\\n20 30\\n20 10\\n')
+    >>> graphe = charger_csr(chemin, entiers=True)
+    >>> graphe.etiquettes
+    array([10, 20, 30])
+    >>> graphe.voisins
+    array([1, 0, 2], dtype=int32)
+    """
+    blocs_origines, blocs_extremites = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+    if entiers:
+        for lignes in _blocs_lignes(chemin, en_tete, taille_bloc):
+            lignes = [ligne for ligne in lignes if ligne.strip() and not ligne.startswith("#")]
+            if not lignes:
+                continue
+            tableau = np.loadtxt(lignes, dtype=np.int64, delimiter=separateur, usecols=(0, 1), ndmin=2)
+            blocs_origines.append(tableau[:, 0])
+            blocs_extremites.append(tableau[:, 1])
+        origines, extremites = np.concatenate(blocs_origines), np.concatenate(blocs_extremites)
+        etiquettes = np.sort(np.concatenate((origines, extremites)))
+        if len(etiquettes):
+            etiquettes = etiquettes[np.concatenate(([True], etiquettes[1:] != etiquettes[:-1]))]
+        return GrapheCSR.depuis_indices(
+            etiquettes, np.searchsorted(etiquettes, origines), np.searchsorted(etiquettes, extremites)
+        )
+
+    indices: dict[str, int] = {}
+    for arcs in lire_arcs(chemin, separateur, en_tete, taille_bloc):
+        blocs_origines.append(np.fromiter((indices.setdefault(o, len(indices)) for o, _ in arcs), np.int64, len(arcs)))
+        blocs_extremites.append(
+            np.fromiter((indices.setdefault(e, len(indices)) for _, e in arcs), np.int64, len(arcs))
+        )
+    return GrapheCSR.depuis_indices(list(indices), np.concatenate(blocs_origines), np.concatenate(blocs_extremites))
+
+
+class _EtiquettesTexte(Sequence[str]):
+    """Étiquettes textuelles d'un graphe projeté en mémoire, décodées à la demande."""
+
+    def __init__(self, decalages: np.ndarray, texte: memoryview) -> None:
+        self._decalages = decalages
+        self._texte = texte
+
+    def __len__(self) -> int:
+        return len(self._decalages) - 1
+
+    @overload
+    def __getitem__(self, i: int) -> str: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[str]: ...
+
+    def __getitem__(self, i: int | slice) -> str | list[str]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if not -len(self) <= i < len(self):
+            raise IndexError("Indice de sommet hors limites.")
+        i %= len(self)
+        return str(self._texte[self._decalages[i] : self._decalages[i + 1]], "utf-8")
+
+
+def _aligner(position: int) -> int:
+    return -(-position // 8) * 8
+
+
+def _ecrire_tableau(fichier, tableau: np.ndarray) -> None:
+    """Écrit un tableau à la prochaine position multiple de 8 du fichier."""
+    fichier.write(bytes(_aligner(fichier.tell()) - fichier.tell()))
+    fichier.write(np.ascontiguousarray(tableau).astype(tableau.dtype.newbyteorder("<"), copy=False).tobytes())
+
+
+def sauvegarder_csr(graphe: GrapheCSR, chemin: str | os.PathLike) -> None:
+    """Enregistre un GrapheCSR dans un fichier binaire.
+
+    Parameters
+    ----------
+    graphe : GrapheCSR
+        Graphe à enregistrer. Ses étiquettes doivent être les entiers de 0 à
+        n - 1, un tableau d'entiers ou des chaînes de caractères.
+
+    chemin : str or os.PathLike
+        Chemin du fichier.
+    """
+    etiquettes = graphe.etiquettes
+    entiers = None
+    textes: list[bytes] = []
+    if isinstance(etiquettes, range) and etiquettes == range(graphe.nb_sommets):
+        type_etiquettes = _ETIQUETTES_INDICES
+    elif isinstance(etiquettes, np.ndarray) and np.issubdtype(etiquettes.dtype, np.integer):
+        type_etiquettes = _ETIQUETTES_ENTIERS
+        entiers = etiquettes.astype(np.int64, copy=False)
+    else:
+        textes = [etiquette.encode("utf-8") for etiquette in etiquettes if isinstance(etiquette, str)]
+        if len(textes) < len(etiquettes):
+            raise TypeError(
+                "Les étiquettes doivent être des entiers de 0 à n - 1, un tableau d'entiers ou des chaînes."
+            )
+        type_etiquettes = _ETIQUETTES_TEXTE
+
+    type_indices = _type_indices(graphe.nb_sommets)
+    with open(chemin, "wb") as fichier:
+        en_tete = _EN_TETE.pack(
+            SIGNATURE, VERSION, type_etiquettes, graphe.nb_sommets, graphe.nb_arcs, np.dtype(type_indices).itemsize
+        )
+        fichier.write(en_tete.ljust(_TAILLE_EN_TETE, b"\0"))
+        _ecrire_tableau(fichier, graphe.decalages.astype(np.int64, copy=False))
+        _ecrire_tableau(fichier, graphe.voisins.astype(type_indices, copy=False))
+        _ecrire_tableau(fichier, graphe.decalages_inverses.astype(np.int64, copy=False))
+        _ecrire_tableau(fichier, graphe.voisins_inverses.astype(type_indices, copy=False))
+        if entiers is not None:
+            _ecrire_tableau(fichier, entiers)
+        elif type_etiquettes == _ETIQUETTES_TEXTE:
+            decalages = np.zeros(len(textes) + 1, dtype=np.int64)
+            np.cumsum(np.fromiter(map(len, textes), np.int64, len(textes)), out=decalages[1:])
+            _ecrire_tableau(fichier, decalages)
+            fichier.write(b"".join(textes))
+
+
+def ouvrir_csr(chemin: str | os.PathLike) -> GrapheCSR:
+    """Ouvre un GrapheCSR enregistré avec la fonction sauvegarder_csr.
+
+    Le fichier est projeté en mémoire en lecture seule : aucun tableau n'est
+    copié, et seules les pages effectivement utilisées sont lues.
+
+    Parameters
+    ----------
+    chemin : str or os.PathLike
+        Chemin du fichier.
+
+    Returns
+    -------
+    GrapheCSR
+        Le graphe enregistré.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> chemin = pathlib.Path(tempfile.mkdtemp()) / 'graphe.bin'
+    >>> sauvegarder_csr(GrapheCSR.depuis_dict({"a": {"b"}, "b": {"a", "c"}, "c": set()}), chemin)
+    >>> graphe = ouvrir_csr(chemin)
+    >>> graphe.etiquettes[2]
+    'c'
+    >>> sorted(graphe.successeurs("b"))
+    ['a', 'c']
+    """
+    with open(chemin, "rb") as fichier:
+        projection = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(projection) < _TAILLE_EN_TETE or projection[: len(SIGNATURE)] != SIGNATURE:
+        projection.close()
+        raise ValueError(f"Le fichier {os.fspath(chemin)!r} n'est pas un graphe au format binaire.")
+    _, version, type_etiquettes, nb_sommets, nb_arcs, taille_indices = _EN_TETE.unpack_from(projection)
+    if version != VERSION:
+        projection.close()
+        raise ValueError(f"Version {version} du format non prise en charge.")
+
+    position = _TAILLE_EN_TETE
+    type_indices = np.dtype(f"<i{taille_indices}")
+
+    def lire_tableau(dtype: np.dtype | str, nombre: int) -> np.ndarray:
+        nonlocal position
+        position = _aligner(position)
+        tableau = np.frombuffer(projection, dtype=dtype, count=nombre, offset=position)
+        position += tableau.nbytes
+        return tableau
+
+    decalages = lire_tableau("<i8", nb_sommets + 1)
+    voisins = lire_tableau(type_indices, nb_arcs)
+    decalages_inverses = lire_tableau("<i8", nb_sommets + 1)
+    voisins_inverses = lire_tableau(type_indices, nb_arcs)
+    etiquettes: Etiquettes
+    if type_etiquettes == _ETIQUETTES_INDICES:
+        etiquettes = range(nb_sommets)
+    elif type_etiquettes == _ETIQUETTES_ENTIERS:
+        etiquettes = lire_tableau("<i8", nb_sommets)
+    else:
+        decalages_texte = lire_tableau("<i8", nb_sommets + 1)
+        etiquettes = _EtiquettesTexte(decalages_texte, memoryview(projection)[position:])
+    return GrapheCSR(etiquettes, decalages, voisins, decalages_inverses, voisins_inverses)
@@ -0,0 +1,226 @@
+"""Graphe orienté indexé dans les deux sens."""
+
+from typing import Hashable, Iterable, Iterator
+
+
+class Graphe:
+    """Graphe orienté conservant, pour chaque sommet, ses successeurs et ses prédécesseurs.
+
+    Les deux index sont mis à jour à chaque ajout ou suppression d'arc, ainsi
+    que les ensembles des sources et des puits. Les requêtes ne parcourent donc
+    jamais l'ensemble des arcs : les successeurs et les prédécesseurs d'un
+    sommet sont obtenus en O(degré), et les sources et les puits en un temps
+    proportionnel à leur nombre.
+
+    Parameters
+    ----------
+    arcs : Iterable[tuple[Hashable, Hashable]]
+        Arcs (origine, extrémité) du graphe.
+
+    sommets : Iterable[Hashable]
+        Sommets du graphe. Les extrémités des arcs sont ajoutées
+        automatiquement ; ce paramètre permet d'ajouter des sommets isolés.
+
+    Examples
+    --------
+    >>> graphe = Graphe([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")])
+    >>> sorted(graphe.predecesseurs("a"))
+    ['c']
+    >>> sorted(graphe.puits())
+    ['d']
+    >>> graphe.supprimer_arc("c", "a")
+    >>> sorted(graphe.sources())
+    ['a']
+    >>> graphe.nb_arcs
+    3
+    """
+
+    def __init__(self, arcs: Iterable[tuple[Hashable, Hashable]] = (), sommets: Iterable[Hashable] = ()) -> None:
+        self._successeurs: dict[Hashable, set[Hashable]] = {}
+        self._predecesseurs: dict[Hashable, set[Hashable]] = {}
+        self._sources: set[Hashable] = set()
+        self._puits: set[Hashable] = set()
+        self._nb_arcs: int = 0
+        self._version: int = 0
+        for sommet in sommets:
+            self.ajouter_sommet(sommet)
+        for origine, extremite in arcs:
+            self.ajouter_arc(origine, extremite)
+
+    @classmethod
+    def depuis_dict(cls, graphe: dict[Hashable, set[Hashable]]) -> "Graphe":
+        """Construit un graphe à partir de sa représentation par un dictionnaire.
+
+        Parameters
+        ----------
+        graphe : dict[Hashable, set[Hashable]]
+            Dictionnaire associant à chaque sommet l'ensemble de ses successeurs.
+
+        Returns
+        -------
+        Graphe
+            Le graphe correspondant.
+
+        Examples
+        --------
+        >>> graphe = Graphe.depuis_dict({"a": {"b"}, "b": set(), "c": set()})
+        >>> sorted(graphe.sources())
+        ['a', 'c']
+        """
+        return cls(
+            arcs=((origine, extremite) for origine, successeurs in graphe.items() for extremite in successeurs),
+            sommets=graphe,
+        )
+
+    @classmethod
+    def depuis_set(cls, graphe: set[tuple[Hashable, Hashable]]) -> "Graphe":
+        """Construit un graphe à partir de l'ensemble de ses arcs.
+
+        Parameters
+        ----------
+        graphe : set[tuple[Hashable, Hashable]]
+            Ensemble des arcs (origine, extrémité).
+
+        Returns
+        -------
+        Graphe
+            Le graphe correspondant.
+        """
+        return cls(arcs=graphe)
+
+    def vers_dict(self) -> dict[Hashable, set[Hashable]]:
+        """Renvoie la représentation du graphe par un dictionnaire.
+
+        Returns
+        -------
+        dict[Hashable, set[Hashable]]
+            Dictionnaire associant à chaque sommet l'ensemble de ses successeurs.
+        """
+        return {sommet: set(successeurs) for sommet, successeurs in self._successeurs.items()}
+
+    def vers_set(self) -> set[tuple[Hashable, Hashable]]:
+        """Renvoie l'ensemble des arcs du graphe.
+
+        Returns
+        -------
+        set[tuple[Hashable, Hashable]]
+            Ensemble des arcs (origine, extrémité).
+        """
+        return {(origine, extremite) for origine, successeurs in self._successeurs.items() for extremite in successeurs}
+
+    @property
+    def nb_arcs(self) -> int:
+        """int : Nombre d'arcs du graphe."""
+        return self._nb_arcs
+
+    @property
+    def version(self) -> int:
+        """int : Compteur incrémenté à chaque modification du graphe."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._successeurs)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._successeurs)
+
+    def __contains__(self, sommet: Hashable) -> bool:
+        return sommet in self._successeurs
+
+    def _verifier_sommet(self, sommet: Hashable) -> None:
+        if sommet not in self._successeurs:
+            raise KeyError(f"Le sommet {sommet!r} n'appartient pas au graphe.")
+
+    def ajouter_sommet(self, sommet: Hashable) -> None:
+        """Ajoute un sommet au graphe, s'il n'y appartient pas déjà.
+
+        Parameters
+        ----------
+        sommet : Hashable
+            Sommet à ajouter.
+        """
+        if sommet not in self._successeurs:
+            self._successeurs[sommet] = set()
+            self._predecesseurs[sommet] = set()
+            self._sources.add(sommet)
+            self._puits.add(sommet)
+            self._version += 1
+
+    def supprimer_sommet(self, sommet: Hashable) -> None:
+        """Supprime un sommet du graphe, ainsi que tous les arcs qui le relient.
+
+        Parameters
+        ----------
+        sommet : Hashable
+            Sommet à supprimer.
+        """
+        self._verifier_sommet(sommet)
+        for extremite in list(self._successeurs[sommet]):
+            self.supprimer_arc(sommet, extremite)
+        for origine in list(self._predecesseurs[sommet]):
+            self.supprimer_arc(origine, sommet)
+        del self._successeurs[sommet]
+        del self._predecesseurs[sommet]
+        self._sources.discard(sommet)
+        self._puits.discard(sommet)
+        self._version += 1
+
+    def ajouter_arc(self, origine: Hashable, extremite: Hashable) -> None:
+        """Ajoute un arc au graphe, ainsi que ses extrémités si besoin.
+
+        Parameters
+        ----------
+        origine, extremite : Hashable
+            Sommets d'origine et d'arrivée de l'arc.
+        """
+        self.ajouter_sommet(origine)
+        self.ajouter_sommet(extremite)
+        if extremite not in self._successeurs[origine]:
+            self._successeurs[origine].add(extremite)
+            self._predecesseurs[extremite].add(origine)
+            self._puits.discard(origine)
+            self._sources.discard(extremite)
+            self._nb_arcs += 1
+            self._version += 1
+
+    def supprimer_arc(self, origine: Hashable, extremite: Hashable) -> None:
+        """Supprime un arc du graphe. Ses extrémités restent dans le graphe.
+
+        Parameters
+        ----------
+        origine, extremite : Hashable
+            Sommets d'origine et d'arrivée de l'arc.
+        """
+        self._verifier_sommet(origine)
+        if extremite not in self._successeurs[origine]:
+            raise KeyError(f"L'arc {(origine, extremite)!r} n'appartient pas au graphe.")
+        self._successeurs[origine].remove(extremite)
+        self._predecesseurs[extremite].remove(origine)
+        if not self._successeurs[origine]:
+            self._puits.add(origine)
+        if not self._predecesseurs[extremite]:
+            self._sources.add(extremite)
+        self._nb_arcs -= 1
+        self._version += 1
+
+    def sommets(self) -> set[Hashable]:
+        """Renvoie l'ensemble des sommets du graphe."""
+        return set(self._successeurs)
+
+    def successeurs(self, sommet: Hashable) -> set[Hashable]:
+        """Renvoie l'ensemble des successeurs d'un sommet, en O(degré sortant)."""
+        self._verifier_sommet(sommet)
+        return set(self._successeurs[sommet])
+
+    def predecesseurs(self, sommet: Hashable) -> set[Hashable]:
+        """Renvoie l'ensemble des prédécesseurs d'un sommet, en O(degré entrant)."""
+        self._verifier_sommet(sommet)
+        return set(self._predecesseurs[sommet])
+
+    def sources(self) -> set[Hashable]:
+        """Renvoie l'ensemble des sources, c'est-à-dire des sommets sans prédécesseur."""
+        return set(self._sources)
+
+    def puits(self) -> set[Hashable]:
+        """Renvoie l'ensemble des puits, c'est-à-dire des sommets sans successeur."""
+        return set(self._puits)
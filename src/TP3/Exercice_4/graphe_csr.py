@@ -0,0 +1,273 @@
+"""Graphe orienté stocké sous forme de lignes creuses compressées (CSR).
+
+Les sommets sont numérotés de 0 à n - 1. Les successeurs du sommet i sont
+stockés dans le tableau voisins, entre les indices decalages[i] (inclus) et
+decalages[i + 1] (exclu). Les prédécesseurs sont stockés de la même façon dans
+deux autres tableaux.
+
+Mémoire utilisée : chaque arc occupe 8 octets (un entier de 4 octets dans
+chacun des deux sens) tant que le graphe a moins de 2**31 sommets, 16 octets
+au-delà. Chaque sommet occupe 16 octets de décalages, auxquels s'ajoute le
+stockage de son étiquette. À titre de comparaison, un arc d'un dictionnaire
+d'ensembles de chaînes de caractères occupe plusieurs dizaines d'octets.
+"""
+
+import functools
+from typing import Hashable, Sequence
+
+import numpy as np
+
+# Étiquettes des sommets : séquence quelconque ou tableau NumPy
+Etiquettes = Sequence[Hashable] | np.ndarray
+
+
+def _type_indices(nb_sommets: int) -> type:
+    """Renvoie le plus petit type entier pouvant numéroter nb_sommets sommets."""
+    return np.int32 if nb_sommets < 2**31 else np.int64
+
+
+def _compresser(origines: np.ndarray, extremites: np.ndarray, nb_sommets: int) -> tuple[np.ndarray, np.ndarray]:
+    """Calcule les tableaux CSR à partir des arcs, triés au préalable par origine."""
+    decalages = np.zeros(nb_sommets + 1, dtype=np.int64)
+    np.cumsum(np.bincount(origines, minlength=nb_sommets), out=decalages[1:])
+    return decalages, extremites.astype(_type_indices(nb_sommets))
+
+
+def _decoder(codes: np.ndarray, nb_sommets: int) -> tuple[np.ndarray, np.ndarray]:
+    """Décode les arcs codés par l'entier origine * nb_sommets + extrémité."""
+    return np.divmod(codes, max(nb_sommets, 1))
+
+
+class GrapheCSR:
+    """Graphe orienté stocké dans des tableaux NumPy.
+
+    Les étiquettes des sommets sont conservées dans la séquence etiquettes, le
+    sommet d'indice i ayant pour étiquette etiquettes[i]. Le graphe ne peut pas
+    être modifié après sa construction.
+
+    Parameters
+    ----------
+    etiquettes : Sequence[Hashable] or np.ndarray
+        Étiquettes des sommets, deux à deux distinctes.
+
+    decalages : np.ndarray
+        Tableau de taille n + 1 des décalages des successeurs de chaque sommet.
+
+    voisins : np.ndarray
+        Indices des successeurs de chaque sommet.
+
+    decalages_inverses, voisins_inverses : np.ndarray or None
+        Tableaux équivalents pour les prédécesseurs. S'ils ne sont pas fournis,
+        ils sont calculés à partir des successeurs.
+
+    Examples
+    --------
+    >>> graphe = GrapheCSR.depuis_dict({"a": {"b"}, "b": {"a", "c"}, "c": set()})
+    >>> graphe.decalages
+    array([0, 1, 3, 3])
+    >>> graphe.voisins
+    array([1, 0, 2], dtype=int32)
+    >>> sorted(graphe.predecesseurs("a"))
+    ['b']
+    >>> graphe.puits()
+    {'c'}
+    """
+
+    def __init__(
+        self,
+        etiquettes: Etiquettes,
+        decalages: np.ndarray,
+        voisins: np.ndarray,
+        decalages_inverses: np.ndarray | None = None,
+        voisins_inverses: np.ndarray | None = None,
+    ) -> None:
+        if len(decalages) != len(etiquettes) + 1:
+            raise ValueError("Le tableau des décalages doit avoir un élément de plus que le nombre de sommets.")
+        if decalages[-1] != len(voisins):
+            raise ValueError("Le dernier décalage doit être égal au nombre d'arcs.")
+        self.etiquettes = etiquettes
+        self.decalages = decalages
+        self.voisins = voisins
+        if decalages_inverses is None or voisins_inverses is None:
+            # Les arcs inversés sont triés par extrémité puis par origine
+            nb_sommets = len(etiquettes)
+            origines = np.repeat(np.arange(nb_sommets, dtype=np.int64), np.diff(decalages))
+            codes = np.sort(voisins.astype(np.int64) * nb_sommets + origines)
+            decalages_inverses, voisins_inverses = _compresser(*_decoder(codes, nb_sommets), nb_sommets)
+        self.decalages_inverses = decalages_inverses
+        self.voisins_inverses = voisins_inverses
+
+    @classmethod
+    def depuis_indices(cls, etiquettes: Etiquettes, origines: np.ndarray, extremites: np.ndarray) -> "GrapheCSR":
+        """Construit un graphe à partir des indices des origines et des extrémités de ses arcs.
+
+        Les arcs en double sont supprimés. Chaque arc étant codé par un entier
+        de 64 bits, le nombre de sommets doit être inférieur à 3 milliards.
+
+        Parameters
+        ----------
+        etiquettes : Sequence[Hashable] or np.ndarray
+            Étiquettes des sommets.
+
+        origines, extremites : np.ndarray
+            Indices des sommets d'origine et d'arrivée de chaque arc.
+
+        Returns
+        -------
+        GrapheCSR
+            Le graphe correspondant.
+        """
+        # Chaque arc est codé par un unique entier, origine * n + extrémité : un
+        # seul tri suffit pour ordonner les arcs et supprimer les doublons.
+        nb_sommets = len(etiquettes)
+        codes = np.sort(np.asarray(origines, dtype=np.int64) * nb_sommets + np.asarray(extremites, dtype=np.int64))
+        codes = codes[np.concatenate(([True], codes[1:] != codes[:-1]))] if len(codes) else codes
+        decalages, voisins = _compresser(*_decoder(codes, nb_sommets), nb_sommets)
+        return cls(etiquettes, decalages, voisins)
+
+    @classmethod
+    def depuis_dict(cls, graphe: dict[Hashable, set[Hashable]]) -> "GrapheCSR":
+        """Construit un graphe à partir de sa représentation par un dictionnaire.
+
+        Parameters
+        ----------
+        graphe : dict[Hashable, set[Hashable]]
+            Dictionnaire associant à chaque sommet l'ensemble de ses successeurs.
+
+        Returns
+        -------
+        GrapheCSR
+            Le graphe correspondant.
+        """
+        indices = {sommet: i for i, sommet in enumerate(graphe)}
+        for successeurs in graphe.values():
+            for sommet in successeurs:
+                indices.setdefault(sommet, len(indices))
+        nb_arcs = sum(len(successeurs) for successeurs in graphe.values())
+        origines = np.repeat(
+            np.arange(len(graphe), dtype=np.int64),
+            np.fromiter(map(len, graphe.values()), dtype=np.int64, count=len(graphe)),
+        )
+        extremites = np.fromiter(
+            (indices[sommet] for successeurs in graphe.values() for sommet in successeurs),
+            dtype=np.int64,
+            count=nb_arcs,
+        )
+        return cls.depuis_indices(list(indices), origines, extremites)
+
+    @classmethod
+    def depuis_set(cls, graphe: set[tuple[Hashable, Hashable]]) -> "GrapheCSR":
+        """Construit un graphe à partir de l'ensemble de ses arcs.
+
+        Parameters
+        ----------
+        graphe : set[tuple[Hashable, Hashable]]
+            Ensemble des arcs (origine, extrémité).
+
+        Returns
+        -------
+        GrapheCSR
+            Le graphe correspondant.
+        """
+        indices: dict[Hashable, int] = {}
+        extremites = np.empty(len(graphe), dtype=np.int64)
+        origines = np.empty(len(graphe), dtype=np.int64)
+        for k, (origine, extremite) in enumerate(graphe):
+            origines[k] = indices.setdefault(origine, len(indices))
+            extremites[k] = indices.setdefault(extremite, len(indices))
+        return cls.depuis_indices(list(indices), origines, extremites)
+
+    def vers_dict(self) -> dict[Hashable, set[Hashable]]:
+        """Renvoie la représentation du graphe par un dictionnaire.
+
+        Returns
+        -------
+        dict[Hashable, set[Hashable]]
+            Dictionnaire associant à chaque sommet l'ensemble de ses successeurs.
+        """
+        return {self.etiquettes[i]: self._vers_etiquettes(self.successeurs_indices(i)) for i in range(self.nb_sommets)}
+
+    def vers_set(self) -> set[tuple[Hashable, Hashable]]:
+        """Renvoie l'ensemble des arcs du graphe.
+
+        Returns
+        -------
+        set[tuple[Hashable, Hashable]]
+            Ensemble des arcs (origine, extrémité).
+        """
+        origines = np.repeat(np.arange(self.nb_sommets), np.diff(self.decalages))
+        return {(self.etiquettes[i], self.etiquettes[j]) for i, j in zip(origines.tolist(), self.voisins.tolist())}
+
+    @property
+    def nb_sommets(self) -> int:
+        """int : Nombre de sommets du graphe."""
+        return len(self.etiquettes)
+
+    @property
+    def nb_arcs(self) -> int:
+        """int : Nombre d'arcs du graphe."""
+        return len(self.voisins)
+
+    @property
+    def nbytes(self) -> int:
+        """int : Nombre d'octets occupés par les tableaux du graphe, hors étiquettes des sommets."""
+        return sum(
+            tableau.nbytes for tableau in (self.decalages, self.voisins, self.decalages_inverses, self.voisins_inverses)
+        )
+
+    @functools.cached_property
+    def _indices(self) -> dict[Hashable, int]:
+        """Dictionnaire associant à chaque étiquette l'indice du sommet, construit au premier besoin."""
+        return {sommet: i for i, sommet in enumerate(self.etiquettes)}
+
+    def __len__(self) -> int:
+        return self.nb_sommets
+
+    def __contains__(self, sommet: Hashable) -> bool:
+        return sommet in self._indices
+
+    def indice(self, sommet: Hashable) -> int:
+        """Renvoie l'indice d'un sommet à partir de son étiquette."""
+        try:
+            return self._indices[sommet]
+        except KeyError:
+            raise KeyError(f"Le sommet {sommet!r} n'appartient pas au graphe.") from None
+
+    def _vers_etiquettes(self, indices: np.ndarray) -> set[Hashable]:
+        return {self.etiquettes[i] for i in indices.tolist()}
+
+    def successeurs_indices(self, i: int) -> np.ndarray:
+        """Renvoie les indices des successeurs du sommet d'indice i, sans copie."""
+        return self.voisins[self.decalages[i] : self.decalages[i + 1]]
+
+    def predecesseurs_indices(self, i: int) -> np.ndarray:
+        """Renvoie les indices des prédécesseurs du sommet d'indice i, sans copie."""
+        return self.voisins_inverses[self.decalages_inverses[i] : self.decalages_inverses[i + 1]]
+
+    def degres_sortants(self) -> np.ndarray:
+        """Renvoie le nombre de successeurs de chaque sommet."""
+        return np.diff(self.decalages)
+
+    def degres_entrants(self) -> np.ndarray:
+        """Renvoie le nombre de prédécesseurs de chaque sommet."""
+        return np.diff(self.decalages_inverses)
+
+    def sommets(self) -> set[Hashable]:
+        """Renvoie l'ensemble des sommets du graphe."""
+        return set(self.etiquettes)
+
+    def successeurs(self, sommet: Hashable) -> set[Hashable]:
+        """Renvoie l'ensemble des successeurs d'un sommet."""
+        return self._vers_etiquettes(self.successeurs_indices(self.indice(sommet)))
+
+    def predecesseurs(self, sommet: Hashable) -> set[Hashable]:
+        """Renvoie l'ensemble des prédécesseurs d'un sommet."""
+        return self._vers_etiquettes(self.predecesseurs_indices(self.indice(sommet)))
+
+    def sources(self) -> set[Hashable]:
+        """Renvoie l'ensemble des sources, c'est-à-dire des sommets sans prédécesseur."""
+        return self._vers_etiquettes(np.flatnonzero(self.degres_entrants() == 0))
+
+    def puits(self) -> set[Hashable]:
+        """Renvoie l'ensemble des puits, c'est-à-dire des sommets sans successeur."""
+        return self._vers_etiquettes(np.flatnonzero(self.degres_sortants() == 0))
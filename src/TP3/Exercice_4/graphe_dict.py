@@ -0,0 +1,143 @@
+"""Fonctions sur les graphes orientés représentés par un dictionnaire.
+
+Un graphe est représenté par un dictionnaire dont les clés sont les sommets et
+les valeurs les ensembles des successeurs de chaque sommet.
+"""
+
+
+def dict_ens_sommets(graphe: dict[str, set[str]]) -> set[str]:
+    """Renvoie l'ensemble des sommets d'un graphe.
+
+    Parameters
+    ----------
+    graphe : dict[str, set[str]]
+        Graphe orienté.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des sommets.
+
+    Examples
+    --------
+    >>> sorted(dict_ens_sommets({"a": {"b"}, "b": set()}))
+    ['a', 'b']
+    """
+    sommets = set(graphe)
+    for successeurs in graphe.values():
+        sommets |= successeurs
+    return sommets
+
+
+def dict_ens_successeurs(graphe: dict[str, set[str]], sommet: str) -> set[str]:
+    """Renvoie l'ensemble des successeurs d'un sommet.
+
+    Parameters
+    ----------
+    graphe : dict[str, set[str]]
+        Graphe orienté.
+
+    sommet : str
+        Sommet.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des successeurs du sommet.
+
+    Examples
+    --------
+    >>> dict_ens_successeurs({"a": {"b"}, "b": set()}, "a")
+    {'b'}
+    """
+    return set(graphe.get(sommet, set()))
+
+
+def dict_ens_predecesseurs(graphe: dict[str, set[str]], sommet: str) -> set[str]:
+    """Renvoie l'ensemble des prédécesseurs d'un sommet.
+
+    Tous les ensembles de successeurs sont parcourus : pour de nombreuses
+    requêtes sur un même graphe, la classe Graphe est plus efficace.
+
+    Parameters
+    ----------
+    graphe : dict[str, set[str]]
+        Graphe orienté.
+
+    sommet : str
+        Sommet.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des prédécesseurs du sommet.
+
+    Examples
+    --------
+    >>> dict_ens_predecesseurs({"a": {"b"}, "b": set()}, "b")
+    {'a'}
+    """
+    return {origine for origine, successeurs in graphe.items() if sommet in successeurs}
+
+
+def dict_ens_puits(graphe: dict[str, set[str]]) -> set[str]:
+    """Renvoie l'ensemble des puits d'un graphe, c'est-à-dire des sommets sans successeur.
+
+    Parameters
+    ----------
+    graphe : dict[str, set[str]]
+        Graphe orienté.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des puits.
+
+    Examples
+    --------
+    >>> dict_ens_puits({"a": {"b"}, "b": set()})
+    {'b'}
+    """
+    return {sommet for sommet in dict_ens_sommets(graphe) if not graphe.get(sommet)}
+
+
+def dict_ens_sources(graphe: dict[str, set[str]]) -> set[str]:
+    """Renvoie l'ensemble des sources d'un graphe, c'est-à-dire des sommets sans prédécesseur.
+
+    Parameters
+    ----------
+    graphe : dict[str, set[str]]
+        Graphe orienté.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des sources.
+
+    Examples
+    --------
+    >>> dict_ens_sources({"a": {"b"}, "b": set()})
+    {'a'}
+    """
+    return set(graphe) - set().union(*graphe.values())
+
+
+def dict_to_set(graphe: dict[str, set[str]]) -> set[tuple[str, str]]:
+    """Convertit un graphe représenté par un dictionnaire en l'ensemble de ses arcs.
+
+    Parameters
+    ----------
+    graphe : dict[str, set[str]]
+        Graphe orienté.
+
+    Returns
+    -------
+    set[tuple[str, str]]
+        Ensemble des arcs (origine, extrémité).
+
+    Examples
+    --------
+    >>> dict_to_set({"a": {"b"}, "b": set()})
+    {('a', 'b')}
+    """
+    return {(origine, extremite) for origine, successeurs in graphe.items() for extremite in successeurs}
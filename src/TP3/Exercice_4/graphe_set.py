@@ -0,0 +1,142 @@
+"""Fonctions sur les graphes orientés représentés par l'ensemble de leurs arcs.
+
+Un graphe est représenté par un ensemble de couples (origine, extrémité).
+"""
+
+
+def set_ens_sommets(graphe: set[tuple[str, str]]) -> set[str]:
+    """Renvoie l'ensemble des sommets d'un graphe.
+
+    Parameters
+    ----------
+    graphe : set[tuple[str, str]]
+        Graphe orienté.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des sommets.
+
+    Examples
+    --------
+    >>> sorted(set_ens_sommets({("a", "b"), ("b", "c")}))
+    ['a', 'b', 'c']
+    """
+    return {sommet for arc in graphe for sommet in arc}
+
+
+def set_ens_successeurs(graphe: set[tuple[str, str]], sommet: str) -> set[str]:
+    """Renvoie l'ensemble des successeurs d'un sommet.
+
+    Parameters
+    ----------
+    graphe : set[tuple[str, str]]
+        Graphe orienté.
+
+    sommet : str
+        Sommet.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des successeurs du sommet.
+
+    Examples
+    --------
+    >>> set_ens_successeurs({("a", "b"), ("b", "c")}, "a")
+    {'b'}
+    """
+    return {extremite for origine, extremite in graphe if origine == sommet}
+
+
+def set_ens_predecesseurs(graphe: set[tuple[str, str]], sommet: str) -> set[str]:
+    """Renvoie l'ensemble des prédécesseurs d'un sommet.
+
+    Parameters
+    ----------
+    graphe : set[tuple[str, str]]
+        Graphe orienté.
+
+    sommet : str
+        Sommet.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des prédécesseurs du sommet.
+
+    Examples
+    --------
+    >>> set_ens_predecesseurs({("a", "b"), ("b", "c")}, "c")
+    {'b'}
+    """
+    return {origine for origine, extremite in graphe if extremite == sommet}
+
+
+def set_ens_puits(graphe: set[tuple[str, str]]) -> set[str]:
+    """Renvoie l'ensemble des puits d'un graphe, c'est-à-dire des sommets sans successeur.
+
+    Parameters
+    ----------
+    graphe : set[tuple[str, str]]
+        Graphe orienté.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des puits.
+
+    Examples
+    --------
+    >>> set_ens_puits({("a", "b"), ("b", "c")})
+    {'c'}
+    """
+    return set_ens_sommets(graphe) - {origine for origine, _ in graphe}
+
+
+def set_ens_sources(graphe: set[tuple[str, str]]) -> set[str]:
+    """Renvoie l'ensemble des sources d'un graphe, c'est-à-dire des sommets sans prédécesseur.
+
+    Parameters
+    ----------
+    graphe : set[tuple[str, str]]
+        Graphe orienté.
+
+    Returns
+    -------
+    set[str]
+        Ensemble des sources.
+
+    Examples
+    --------
+    >>> set_ens_sources({("a", "b"), ("b", "c")})
+    {'a'}
+    """
+    return set_ens_sommets(graphe) - {extremite for _, extremite in graphe}
+
+
+def set_to_dict(graphe: set[tuple[str, str]]) -> dict[str, set[str]]:
+    """Convertit un graphe représenté par l'ensemble de ses arcs en dictionnaire.
+
+    Les arcs sont parcourus une seule fois.
+
+    Parameters
+    ----------
+    graphe : set[tuple[str, str]]
+        Graphe orienté.
+
+    Returns
+    -------
+    dict[str, set[str]]
+        Dictionnaire associant à chaque sommet l'ensemble de ses successeurs.
+
+    Examples
+    --------
+    >>> set_to_dict({("a", "b")})
+    {'a': {'b'}, 'b': set()}
+    """
+    dico: dict[str, set[str]] = {}
+    for origine, extremite in graphe:
+        dico.setdefault(origine, set()).add(extremite)
+        dico.setdefault(extremite, set())
+    return dico
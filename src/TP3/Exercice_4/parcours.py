@@ -0,0 +1,339 @@
+"""Parcours et accessibilité dans les graphes orientés.
+
+Toutes les fonctions de ce module sont itératives, et donc utilisables sur des
+graphes de plusieurs millions de sommets sans atteindre la limite de
+récursion. Elles acceptent un graphe représenté par un dictionnaire
+d'ensembles de successeurs, une instance de Graphe ou une instance de
+GrapheCSR. Pour cette dernière, le parcours en largeur, l'ensemble des sommets
+accessibles et le tri topologique traitent chaque niveau du parcours en une
+seule fois avec NumPy, ce qui est d'autant plus efficace que les niveaux sont
+peu nombreux et larges.
+"""
+
+import itertools
+from collections import deque
+from typing import Callable, Hashable, Iterable, Sequence, cast
+
+import numpy as np
+
+from .graphe import Graphe
+from .graphe_csr import GrapheCSR
+
+GrapheQuelconque = dict[Hashable, set[Hashable]] | Graphe | GrapheCSR
+
+
+def _adjacence(graphe: GrapheQuelconque) -> tuple[Sequence[Hashable], Callable[[Hashable], Iterable[Hashable]]]:
+    """Renvoie la liste des sommets d'un graphe et une fonction donnant les successeurs d'un sommet.
+
+    Pour un GrapheCSR, les sommets sont désignés par leurs indices.
+    """
+    if isinstance(graphe, GrapheCSR):
+        return range(graphe.nb_sommets), lambda i: graphe.successeurs_indices(cast(int, i)).tolist()
+    if isinstance(graphe, Graphe):
+        return list(graphe), graphe.successeurs
+    sommets = list(dict.fromkeys(itertools.chain(graphe, itertools.chain.from_iterable(graphe.values()))))
+    return sommets, lambda sommet: graphe.get(sommet, ())
+
+
+def _etiquettes(graphe: GrapheQuelconque, sommets: Iterable[Hashable]) -> list[Hashable]:
+    """Remplace les indices des sommets d'un GrapheCSR par leurs étiquettes."""
+    if isinstance(graphe, GrapheCSR):
+        return [graphe.etiquettes[cast(int, i)] for i in sommets]
+    return list(sommets)
+
+
+def _voisins_frontiere(decalages: np.ndarray, voisins: np.ndarray, frontiere: np.ndarray) -> np.ndarray:
+    """Renvoie les voisins (avec répétitions) de tous les sommets d'une frontière, en une seule fois."""
+    debuts = decalages[frontiere]
+    longueurs = decalages[frontiere + 1] - debuts
+    fins = np.cumsum(longueurs)
+    # Position de chaque voisin dans le tableau voisins
+    positions = np.arange(fins[-1] if len(fins) else 0) + np.repeat(debuts - fins + longueurs, longueurs)
+    return voisins[positions]
+
+
+def _valeurs_distinctes(tableau: np.ndarray) -> np.ndarray:
+    """Renvoie les valeurs distinctes d'un tableau, triées."""
+    tableau = np.sort(tableau)
+    return tableau[np.concatenate(([True], tableau[1:] != tableau[:-1]))] if len(tableau) else tableau
+
+
+def _niveaux_csr(graphe: GrapheCSR, depart: int) -> list[np.ndarray]:
+    """Renvoie les indices des sommets accessibles depuis depart, niveau par niveau."""
+    visites = np.zeros(graphe.nb_sommets, dtype=bool)
+    visites[depart] = True
+    niveaux = [np.array([depart])]
+    while len(niveaux[-1]):
+        voisins = _voisins_frontiere(graphe.decalages, graphe.voisins, niveaux[-1])
+        frontiere = _valeurs_distinctes(voisins[~visites[voisins]])
+        visites[frontiere] = True
+        niveaux.append(frontiere)
+    return niveaux[:-1]
+
+
+def parcours_largeur(graphe: GrapheQuelconque, depart: Hashable) -> list[Hashable]:
+    """Renvoie les sommets accessibles depuis un sommet, dans l'ordre d'un parcours en largeur.
+
+    Parameters
+    ----------
+    graphe : dict[Hashable, set[Hashable]], Graphe or GrapheCSR
+        Graphe orienté.
+
+    depart : Hashable
+        Sommet de départ.
+
+    Returns
+    -------
+    list[Hashable]
+        Sommets accessibles, par distance croissante au sommet de départ.
+
+    Examples
+    --------
+    >>> parcours_largeur({"a": {"b"}, "b": {"c"}, "c": {"a"}, "d": {"a"}}, "a")
+    ['a', 'b', 'c']
+    """
+    if isinstance(graphe, GrapheCSR):
+        return _etiquettes(graphe, np.concatenate(_niveaux_csr(graphe, graphe.indice(depart))).tolist())
+
+    _, successeurs = _adjacence(graphe)
+    visites = {depart}
+    ordre = []
+    file = deque([depart])
+    while file:
+        sommet = file.popleft()
+        ordre.append(sommet)
+        for successeur in successeurs(sommet):
+            if successeur not in visites:
+                visites.add(successeur)
+                file.append(successeur)
+    return ordre
+
+
+def parcours_profondeur(graphe: GrapheQuelconque, depart: Hashable) -> list[Hashable]:
+    """Renvoie les sommets accessibles depuis un sommet, dans l'ordre d'un parcours en profondeur.
+
+    Le parcours est itératif : la pile des appels récursifs est remplacée par
+    une pile d'itérateurs sur les successeurs.
+
+    Parameters
+    ----------
+    graphe : dict[Hashable, set[Hashable]], Graphe or GrapheCSR
+        Graphe orienté.
+
+    depart : Hashable
+        Sommet de départ.
+
+    Returns
+    -------
+    list[Hashable]
+        Sommets accessibles, dans l'ordre de leur première visite.
+
+    Examples
+    --------
+    >>> parcours_profondeur({"a": {"b"}, "b": {"c"}, "c": {"a"}, "d": {"a"}}, "a")
+    ['a', 'b', 'c']
+    """
+    _, successeurs = _adjacence(graphe)
+    if isinstance(graphe, GrapheCSR):
+        depart = graphe.indice(depart)
+
+    visites = {depart}
+    ordre = [depart]
+    pile = [iter(successeurs(depart))]
+    while pile:
+        for successeur in pile[-1]:
+            if successeur not in visites:
+                visites.add(successeur)
+                ordre.append(successeur)
+                pile.append(iter(successeurs(successeur)))
+                break
+        else:
+            pile.pop()
+    return _etiquettes(graphe, ordre)
+
+
+def accessibles(graphe: GrapheQuelconque, depart: Hashable) -> set[Hashable]:
+    """Renvoie l'ensemble des sommets accessibles depuis un sommet, y compris lui-même.
+
+    Parameters
+    ----------
+    graphe : dict[Hashable, set[Hashable]], Graphe or GrapheCSR
+        Graphe orienté.
+
+    depart : Hashable
+        Sommet de départ.
+
+    Returns
+    -------
+    set[Hashable]
+        Sommets accessibles.
+
+    Examples
+    --------
+    >>> sorted(accessibles({"a": {"b"}, "b": {"c"}, "c": set(), "d": {"a"}}, "b"))
+    ['b', 'c']
+    """
+    return set(parcours_largeur(graphe, depart))
+
+
+def tri_topologique(graphe: GrapheQuelconque) -> list[Hashable]:
+    """Renvoie les sommets d'un graphe sans cycle dans un ordre topologique.
+
+    Chaque sommet apparaît avant tous ses successeurs (algorithme de Kahn).
+
+    Parameters
+    ----------
+    graphe : dict[Hashable, set[Hashable]], Graphe or GrapheCSR
+        Graphe orienté sans cycle.
+
+    Returns
+    -------
+    list[Hashable]
+        Sommets du graphe dans un ordre topologique.
+
+    Examples
+    --------
+    >>> tri_topologique({"a": {"b", "c"}, "b": {"c"}, "c": set()})
+    ['a', 'b', 'c']
+    >>> tri_topologique({"a": {"b"}, "b": {"a"}})
+    Traceback (most recent call last):
+    ...
+    ValueError: Le graphe contient un cycle.
+    """
+    if isinstance(graphe, GrapheCSR):
+        degres = graphe.degres_entrants()
+        niveaux = [np.flatnonzero(degres == 0)]
+        while len(niveaux[-1]):
+            voisins = _voisins_frontiere(graphe.decalages, graphe.voisins, niveaux[-1])
+            candidats, nb_arcs = np.unique(voisins, return_counts=True)
+            degres[candidats] -= nb_arcs
+            niveaux.append(candidats[degres[candidats] == 0])
+        indices = np.concatenate(niveaux)
+        if len(indices) < graphe.nb_sommets:
+            raise ValueError("Le graphe contient un cycle.")
+        return _etiquettes(graphe, indices.tolist())
+
+    sommets, successeurs = _adjacence(graphe)
+    degres_entrants = dict.fromkeys(sommets, 0)
+    for sommet in sommets:
+        for successeur in successeurs(sommet):
+            degres_entrants[successeur] += 1
+    ordre: list[Hashable] = [sommet for sommet in sommets if degres_entrants[sommet] == 0]
+    for sommet in ordre:
+        for successeur in successeurs(sommet):
+            degres_entrants[successeur] -= 1
+            if degres_entrants[successeur] == 0:
+                ordre.append(successeur)
+    if len(ordre) < len(sommets):
+        raise ValueError("Le graphe contient un cycle.")
+    return ordre
+
+
+def composantes_fortement_connexes(graphe: GrapheQuelconque) -> list[set[Hashable]]:
+    """Renvoie les composantes fortement connexes d'un graphe.
+
+    Il s'agit d'une version itérative de l'algorithme de Tarjan. Les
+    composantes sont renvoyées dans l'ordre topologique inverse : aucune
+    composante n'a d'arc vers une composante qui la suit dans la liste.
+
+    Parameters
+    ----------
+    graphe : dict[Hashable, set[Hashable]], Graphe or GrapheCSR
+        Graphe orienté.
+
+    Returns
+    -------
+    list[set[Hashable]]
+        Composantes fortement connexes.
+
+    Examples
+    --------
+    >>> composantes = composantes_fortement_connexes({"a": {"b"}, "b": {"a", "c"}, "c": {"d"}, "d": {"c"}})
+    >>> [sorted(composante) for composante in composantes]
+    [['c', 'd'], ['a', 'b']]
+    """
+    sommets, successeurs = _adjacence(graphe)
+    numeros: dict[Hashable, int] = {}
+    minimums: dict[Hashable, int] = {}
+    pile_tarjan: list[Hashable] = []
+    sur_pile: set[Hashable] = set()
+    composantes = []
+
+    for racine in sommets:
+        if racine in numeros:
+            continue
+        numeros[racine] = minimums[racine] = len(numeros)
+        pile_tarjan.append(racine)
+        sur_pile.add(racine)
+        appels = [(racine, iter(successeurs(racine)))]
+        while appels:
+            sommet, iterateur = appels[-1]
+            for successeur in iterateur:
+                if successeur not in numeros:
+                    numeros[successeur] = minimums[successeur] = len(numeros)
+                    pile_tarjan.append(successeur)
+                    sur_pile.add(successeur)
+                    appels.append((successeur, iter(successeurs(successeur))))
+                    break
+                if successeur in sur_pile:
+                    minimums[sommet] = min(minimums[sommet], numeros[successeur])
+            else:
+                # Tous les successeurs ont été traités : retour de l'appel
+                appels.pop()
+                if appels:
+                    parent = appels[-1][0]
+                    minimums[parent] = min(minimums[parent], minimums[sommet])
+                if minimums[sommet] == numeros[sommet]:
+                    composante = set()
+                    while True:
+                        membre = pile_tarjan.pop()
+                        sur_pile.remove(membre)
+                        composante.add(membre)
+                        if membre == sommet:
+                            break
+                    composantes.append(composante)
+    return [set(_etiquettes(graphe, composante)) for composante in composantes]
+
+
+class CacheAccessibilite:
+    """Cache des ensembles de sommets accessibles depuis chaque sommet d'un graphe.
+
+    Les ensembles déjà calculés sont conservés tant que le graphe n'est pas
+    modifié. Le cache est vidé dès qu'un sommet ou un arc est ajouté ou
+    supprimé, ce qui est détecté grâce à l'attribut version de Graphe. Un
+    GrapheCSR ne pouvant pas être modifié, son cache n'est jamais vidé.
+
+    Parameters
+    ----------
+    graphe : Graphe or GrapheCSR
+        Graphe orienté.
+
+    Examples
+    --------
+    >>> graphe = Graphe([("a", "b"), ("b", "c")])
+    >>> cache = CacheAccessibilite(graphe)
+    >>> cache.est_accessible("a", "c")
+    True
+    >>> graphe.supprimer_arc("b", "c")
+    >>> cache.est_accessible("a", "c")
+    False
+    """
+
+    def __init__(self, graphe: Graphe | GrapheCSR) -> None:
+        self._graphe = graphe
+        self._version = getattr(graphe, "version", 0)
+        self._accessibles: dict[Hashable, frozenset[Hashable]] = {}
+
+    def accessibles(self, sommet: Hashable) -> frozenset[Hashable]:
+        """Renvoie l'ensemble des sommets accessibles depuis un sommet, y compris lui-même."""
+        version = getattr(self._graphe, "version", 0)
+        if version != self._version:
+            self._accessibles.clear()
+            self._version = version
+        if sommet not in self._accessibles:
+            self._accessibles[sommet] = frozenset(accessibles(self._graphe, sommet))
+        return self._accessibles[sommet]
+
+    def est_accessible(self, origine: Hashable, extremite: Hashable) -> bool:
+        """Indique s'il existe un chemin d'un sommet à un autre."""
+        return extremite in self.accessibles(origine)
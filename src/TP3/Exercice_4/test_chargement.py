@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from .chargement import (
+    charger_csr,
+    charger_dict,
+    charger_graphe,
+    charger_set,
+    lire_arcs,
+    ouvrir_csr,
+    sauvegarder_csr,
+)
+from .graphe_csr import GrapheCSR
+
+
+@pytest.fixture
+def chemin_arcs(tmp_path, graphe_1_set):
+    """Liste d'arcs du graphe 1 au format CSV, avec en-tête, commentaire et poids."""
+    chemin = tmp_path / "arcs.csv"
+    lignes = ["origine,extremite,poids", "# commentaire"]
+    lignes += [f"{origine},{extremite},1.5" for origine, extremite in sorted(graphe_1_set)]
+    chemin.write_text("\n".join(lignes) + "\n")
+    return chemin
+
+
+@pytest.mark.parametrize("taille_bloc", [1, 3, 100])
+def test_lire_arcs(chemin_arcs, graphe_1_set, taille_bloc):
+    """Tests pour la lecture d'une liste d'arcs par blocs."""
+    blocs = list(lire_arcs(chemin_arcs, separateur=",", en_tete=True, taille_bloc=taille_bloc))
+    assert all(len(bloc) <= taille_bloc for bloc in blocs)
+    assert [arc for bloc in blocs for arc in bloc] == sorted(graphe_1_set)
+
+
+def test_erreur_lire_arcs(tmp_path):
+    """Tests pour l'erreur levée sur une ligne sans arc."""
+    chemin = tmp_path / "arcs.txt"
+    chemin.write_text("a b\nc\n")
+    with pytest.raises(ValueError, match="ligne 2"):
+        list(lire_arcs(chemin))
+
+
+def test_charger(chemin_arcs, graphe_1_dict, graphe_1_set):
+    """Tests pour le chargement d'une liste d'arcs dans chaque représentation."""
+    options = {"separateur": ",", "en_tete": True, "taille_bloc": 3}
+    assert charger_dict(chemin_arcs, **options) == graphe_1_dict
+    assert charger_set(chemin_arcs, **options) == graphe_1_set
+    assert charger_graphe(chemin_arcs, **options).vers_dict() == graphe_1_dict
+    assert charger_csr(chemin_arcs, **options).vers_dict() == graphe_1_dict
+
+
+def test_charger_csr_entiers(tmp_path):
+    """Tests pour le chargement d'une liste d'arcs entre des sommets entiers."""
+    chemin = tmp_path / "arcs.tsv"
+    chemin.write_text("# commentaire\n5\t-3\n5\t100\n\n100\t5\t0.5\n5\t-3\n")
+    graphe = charger_csr(chemin, separateur="\t", entiers=True, taille_bloc=2)
+    assert graphe.etiquettes.tolist() == [-3, 5, 100]
+    assert graphe.vers_set() == {(5, -3), (5, 100), (100, 5)}
+
+
+@pytest.mark.parametrize(
+    "graphe",
+    [
+        GrapheCSR.depuis_dict({"a": {"b"}, "b": {"a", "c", "é"}, "c": set(), "é": {"a"}}),
+        GrapheCSR.depuis_indices(range(4), np.array([0, 1, 1]), np.array([1, 2, 3])),
+        GrapheCSR.depuis_indices(np.array([-7, 0, 10**12]), np.array([2, 2]), np.array([0, 1])),
+        GrapheCSR.depuis_dict({}),
+    ],
+)
+def test_sauvegarder_ouvrir_csr(tmp_path, graphe):
+    """Tests pour l'enregistrement et l'ouverture d'un graphe au format binaire."""
+    chemin = tmp_path / "graphe.bin"
+    sauvegarder_csr(graphe, chemin)
+    graphe_ouvert = ouvrir_csr(chemin)
+    assert graphe_ouvert.vers_set() == graphe.vers_set()
+    assert list(graphe_ouvert.etiquettes) == list(graphe.etiquettes)
+    assert list(graphe_ouvert.etiquettes[1::2]) == list(graphe.etiquettes[1::2])
+    for nom in ["decalages", "voisins", "decalages_inverses", "voisins_inverses"]:
+        np.testing.assert_array_equal(getattr(graphe_ouvert, nom), getattr(graphe, nom))
+    assert not graphe_ouvert.voisins.flags.writeable
+
+
+def test_erreur_sauvegarder_ouvrir_csr(tmp_path):
+    """Tests pour les erreurs levées lors de l'enregistrement et de l'ouverture."""
+    chemin = tmp_path / "graphe.bin"
+    with pytest.raises(TypeError):
+        sauvegarder_csr(GrapheCSR.depuis_dict({("a", 1): {2}}), chemin)
+    chemin.write_bytes(b"ceci n'est pas un graphe")
+    with pytest.raises(ValueError, match="format binaire"):
+        ouvrir_csr(chemin)
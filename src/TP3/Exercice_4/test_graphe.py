@@ -0,0 +1,67 @@
+import pytest
+
+from .graphe import Graphe
+from .graphe_dict import dict_ens_predecesseurs, dict_ens_puits, dict_ens_sources
+
+
+@pytest.mark.parametrize("dico", ["graphe_1_dict", "graphe_2_dict"])
+def test_graphe_depuis_dict(dico, request):
+    """Tests pour la construction d'un graphe à partir d'un dictionnaire."""
+    graphe_dict = request.getfixturevalue(dico)
+    graphe = Graphe.depuis_dict(graphe_dict)
+    assert graphe.vers_dict() == graphe_dict
+    assert graphe.sommets() == set(graphe_dict)
+    assert graphe.sources() == dict_ens_sources(graphe_dict)
+    assert graphe.puits() == dict_ens_puits(graphe_dict)
+    for sommet in graphe_dict:
+        assert graphe.successeurs(sommet) == graphe_dict[sommet]
+        assert graphe.predecesseurs(sommet) == dict_ens_predecesseurs(graphe_dict, sommet)
+
+
+@pytest.mark.parametrize(
+    "ensemble, dico",
+    [("graphe_1_set", "graphe_1_dict"), ("graphe_2_set", "graphe_2_dict")],
+)
+def test_graphe_depuis_set(ensemble, dico, request):
+    """Tests pour la construction d'un graphe à partir de l'ensemble de ses arcs."""
+    graphe_set = request.getfixturevalue(ensemble)
+    graphe = Graphe.depuis_set(graphe_set)
+    assert graphe.vers_set() == graphe_set
+    assert graphe.vers_dict() == request.getfixturevalue(dico)
+    assert graphe.nb_arcs == len(graphe_set)
+
+
+def test_graphe_mise_a_jour(graphe_1_dict):
+    """Tests pour la mise à jour des index lors des ajouts et suppressions."""
+    graphe = Graphe.depuis_dict(graphe_1_dict)
+    graphe.supprimer_arc("b", "a")
+    graphe.supprimer_arc("c", "a")
+    assert graphe.predecesseurs("a") == set()
+    assert graphe.sources() == {"a"}
+    graphe.ajouter_arc("e", "f")
+    assert graphe.puits() == {"f"}
+    assert graphe.sources() == {"a"}
+    graphe.supprimer_sommet("b")
+    assert graphe.sommets() == {"a", "c", "d", "e", "f"}
+    assert graphe.sources() == {"a", "c"}
+    assert graphe.puits() == {"a", "f"}
+    assert graphe.nb_arcs == 3
+    graphe.ajouter_arc("a", "a")
+    assert "a" not in graphe.sources() | graphe.puits()
+
+
+@pytest.mark.parametrize(
+    "methode, arguments, message_erreur",
+    [
+        ("successeurs", ("z",), "Le sommet 'z' n'appartient pas au graphe."),
+        ("predecesseurs", ("z",), "Le sommet 'z' n'appartient pas au graphe."),
+        ("supprimer_sommet", ("z",), "Le sommet 'z' n'appartient pas au graphe."),
+        ("supprimer_arc", ("a", "c"), "L'arc ('a', 'c') n'appartient pas au graphe."),
+    ],
+)
+def test_graphe_erreur(graphe_1_dict, methode, arguments, message_erreur):
+    """Tests pour les erreurs sur des sommets ou des arcs absents."""
+    graphe = Graphe.depuis_dict(graphe_1_dict)
+    with pytest.raises(KeyError) as erreur:
+        getattr(graphe, methode)(*arguments)
+    assert erreur.value.args[0] == message_erreur
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from .graphe_csr import GrapheCSR
+from .graphe_dict import dict_ens_predecesseurs, dict_ens_puits, dict_ens_sources
+
+
+@pytest.mark.parametrize("dico", ["graphe_1_dict", "graphe_2_dict"])
+def test_graphe_csr_depuis_dict(dico, request):
+    """Tests pour la construction d'un graphe CSR à partir d'un dictionnaire."""
+    graphe_dict = request.getfixturevalue(dico)
+    graphe = GrapheCSR.depuis_dict(graphe_dict)
+    assert graphe.vers_dict() == graphe_dict
+    assert graphe.sommets() == set(graphe_dict)
+    assert graphe.sources() == dict_ens_sources(graphe_dict)
+    assert graphe.puits() == dict_ens_puits(graphe_dict)
+    for sommet in graphe_dict:
+        assert graphe.successeurs(sommet) == graphe_dict[sommet]
+        assert graphe.predecesseurs(sommet) == dict_ens_predecesseurs(graphe_dict, sommet)
+
+
+@pytest.mark.parametrize(
+    "ensemble, dico",
+    [("graphe_1_set", "graphe_1_dict"), ("graphe_2_set", "graphe_2_dict")],
+)
+def test_graphe_csr_depuis_set(ensemble, dico, request):
+    """Tests pour la construction d'un graphe CSR à partir de l'ensemble de ses arcs."""
+    graphe_set = request.getfixturevalue(ensemble)
+    graphe = GrapheCSR.depuis_set(graphe_set)
+    assert graphe.vers_set() == graphe_set
+    assert graphe.vers_dict() == request.getfixturevalue(dico)
+    assert graphe.nb_arcs == len(graphe_set)
+
+
+def test_graphe_csr_depuis_indices():
+    """Tests pour la construction d'un graphe CSR à partir d'indices, avec arcs en double."""
+    graphe = GrapheCSR.depuis_indices(["a", "b", "c", "d"], np.array([2, 0, 2, 0, 1]), np.array([0, 1, 0, 2, 2]))
+    assert graphe.decalages.tolist() == [0, 2, 3, 4, 4]
+    assert graphe.voisins.tolist() == [1, 2, 2, 0]
+    assert graphe.decalages_inverses.tolist() == [0, 1, 2, 4, 4]
+    assert graphe.voisins_inverses.tolist() == [2, 0, 0, 1]
+    assert graphe.sources() == {"d"}
+    assert graphe.puits() == {"d"}
+    assert graphe.nbytes == 2 * 5 * 8 + 2 * 4 * 4
+
+
+@pytest.mark.parametrize(
+    "decalages, voisins, message_erreur",
+    [
+        ([0, 1], [0], "Le tableau des décalages doit avoir un élément de plus que le nombre de sommets."),
+        ([0, 1, 1], [0, 1], "Le dernier décalage doit être égal au nombre d'arcs."),
+    ],
+)
+def test_graphe_csr_erreur(decalages, voisins, message_erreur):
+    """Tests pour les erreurs à la construction d'un graphe CSR."""
+    with pytest.raises(ValueError, match=message_erreur):
+        GrapheCSR(["a", "b"], np.array(decalages), np.array(voisins))
+
+
+def test_graphe_csr_sommet_absent(graphe_1_dict):
+    graphe = GrapheCSR.depuis_dict(graphe_1_dict)
+    with pytest.raises(KeyError):
+        graphe.successeurs("z")
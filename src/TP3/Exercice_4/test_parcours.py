@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from .graphe import Graphe
+from .graphe_csr import GrapheCSR
+from .parcours import (
+    CacheAccessibilite,
+    accessibles,
+    composantes_fortement_connexes,
+    parcours_largeur,
+    parcours_profondeur,
+    tri_topologique,
+)
+
+REPRESENTATIONS = [dict, Graphe.depuis_dict, GrapheCSR.depuis_dict]
+
+
+def distances(graphe_dict, depart):
+    """Distances depuis un sommet, calculées naïvement."""
+    distances = {depart: 0}
+    frontiere = {depart}
+    distance = 0
+    while frontiere:
+        distance += 1
+        frontiere = {successeur for sommet in frontiere for successeur in graphe_dict[sommet]} - set(distances)
+        distances.update(dict.fromkeys(frontiere, distance))
+    return distances
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+@pytest.mark.parametrize("dico", ["graphe_1_dict", "graphe_2_dict"])
+def test_parcours(dico, representation, request):
+    """Tests pour les parcours en largeur et en profondeur."""
+    graphe_dict = request.getfixturevalue(dico)
+    graphe = representation(graphe_dict)
+    for depart in graphe_dict:
+        largeur = parcours_largeur(graphe, depart)
+        profondeur = parcours_profondeur(graphe, depart)
+        assert largeur[0] == profondeur[0] == depart
+        assert len(set(largeur)) == len(largeur)
+        assert set(largeur) == set(profondeur) == accessibles(graphe, depart)
+        # Le parcours en largeur visite les sommets par distance croissante
+        distances_depart = [distances(graphe_dict, depart)[sommet] for sommet in largeur]
+        assert distances_depart == sorted(distances_depart)
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_accessibles(representation, graphe_1_dict):
+    """Tests pour l'ensemble des sommets accessibles."""
+    graphe = representation(graphe_1_dict)
+    assert accessibles(graphe, "a") == {"a", "b", "c", "d", "e"}
+    assert accessibles(graphe, "d") == {"d", "e"}
+    assert accessibles(graphe, "e") == {"e"}
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_tri_topologique(representation):
+    """Tests pour le tri topologique."""
+    graphe_dict = {"a": {"c"}, "b": {"c", "d"}, "c": {"e"}, "d": {"e"}, "e": set(), "f": set()}
+    ordre = tri_topologique(representation(graphe_dict))
+    assert sorted(ordre) == sorted(graphe_dict)
+    rangs = {sommet: rang for rang, sommet in enumerate(ordre)}
+    for origine, successeurs in graphe_dict.items():
+        for extremite in successeurs:
+            assert rangs[origine] < rangs[extremite]
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_erreur_tri_topologique(representation, graphe_1_dict):
+    """Tests pour l'erreur levée par le tri topologique d'un graphe avec cycle."""
+    with pytest.raises(ValueError, match="cycle"):
+        tri_topologique(representation(graphe_1_dict))
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS)
+def test_composantes_fortement_connexes(representation, graphe_1_dict):
+    """Tests pour les composantes fortement connexes."""
+    composantes = composantes_fortement_connexes(representation(graphe_1_dict))
+    assert composantes == [{"e"}, {"d"}, {"a", "b", "c"}]
+
+
+def test_grand_graphe():
+    """Tests sur un chemin trop long pour un parcours récursif."""
+    n = 100_000
+    origines = np.arange(n - 1)
+    graphe = GrapheCSR.depuis_indices(range(n), origines, origines + 1)
+    assert parcours_profondeur(graphe, 0) == list(range(n))
+    assert tri_topologique(graphe) == list(range(n))
+    assert len(composantes_fortement_connexes(graphe)) == n
+    graphe_dict = graphe.vers_dict()
+    assert parcours_profondeur(graphe_dict, 0) == list(range(n))
+    assert len(composantes_fortement_connexes(graphe_dict)) == n
+
+
+def test_cache_accessibilite(graphe_1_dict):
+    """Tests pour l'invalidation du cache lors des modifications du graphe."""
+    graphe = Graphe.depuis_dict(graphe_1_dict)
+    cache = CacheAccessibilite(graphe)
+    assert cache.accessibles("d") == {"d", "e"}
+    assert cache.accessibles("d") is cache.accessibles("d")
+    assert not cache.est_accessible("e", "a")
+    graphe.ajouter_arc("e", "a")
+    assert cache.est_accessible("e", "a")
+    graphe.supprimer_arc("d", "e")
+    assert cache.accessibles("d") == {"d"}
+    graphe.ajouter_sommet("f")
+    assert cache.accessibles("f") == {"f"}
@@ -3,7 +3,7 @@
 # Install packages and VSCode extensions
 # Expected parameters : None
 
-pip install black==25.1.0 mypy==1.17.0 pytest==8.4.1 pytest-cov==6.2.1 ruff==0.12.4
+pip install black==25.1.0 mypy==1.17.0 numpy==2.3.1 pytest==8.4.1 pytest-cov==6.2.1 ruff==0.12.4
 
 code-server --install-extension charliermarsh.ruff@2026.34.0  # Ruff
 code-server --install-extension ms-python.mypy-type-checker@2025.2.0  # Mypy